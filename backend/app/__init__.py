@@ -1 +1,5 @@
 """BetterBobcats Backend Application Package"""
+from dotenv import load_dotenv
+
+# Load environment variables from .env before any module reads them at import time
+load_dotenv()
@@ -0,0 +1,78 @@
+"""
+Career Paths API Routes
+Read-only endpoints serving pre-encoded, precompressed career path configs
+"""
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from app.models.career import CareerPathConfig
+from app.services.career_paths import get_career_catalog
+from app.utils.http import CACHE_CONTROL, conditional_response
+
+router = APIRouter()
+
+
+@router.get("/")
+async def get_all_career_paths(request: Request) -> Response:
+    """
+    List every career path
+
+    Returns:
+        Major slug, career slug, root label and course count per career path
+    """
+    payload = get_career_catalog().index_payload
+    return conditional_response(request, payload, cache_control=CACHE_CONTROL["careers"])
+
+
+@router.get("/{major}/{career}", response_model=CareerPathConfig)
+async def get_career_path(major: str, career: str, request: Request) -> Response:
+    """
+    Get a career path configuration
+
+    Supports conditional GET (ETag) and gzip/brotli via Accept-Encoding.
+
+    Args:
+        major: Major slug, e.g. "cs-cse"
+        career: Career slug, e.g. "swe"
+
+    Returns:
+        Career path configuration with tier courses
+
+    Raises:
+        HTTPException: 404 if the career path is not found
+    """
+    path = get_career_catalog().get(major, career)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"Career path '{major}/{career}' not found")
+    return conditional_response(request, path.payload, cache_control=CACHE_CONTROL["careers"])
+
+
+@router.get("/{career}", response_model=CareerPathConfig)
+async def get_career_path_by_slug(career: str, request: Request) -> Response:
+    """
+    Get a career path by career slug alone
+
+    Kept for clients that do not know the major; the slug must belong to a
+    single major.
+
+    Args:
+        career: Career slug, e.g. "systems-infrastructure"
+
+    Returns:
+        Career path configuration with tier courses
+
+    Raises:
+        HTTPException: 404 if not found, 409 if several majors share the slug
+    """
+    paths = get_career_catalog().find(career)
+    if not paths:
+        raise HTTPException(status_code=404, detail=f"Career path '{career}' not found")
+    if len(paths) > 1:
+        majors = ", ".join(path.major for path in paths)
+        raise HTTPException(
+            status_code=409,
+            detail=(
+                f"Career path '{career}' exists in several majors ({majors}); "
+                f"use /api/careers/{{major}}/{career}"
+            ),
+        )
+    return conditional_response(request, paths[0].payload, cache_control=CACHE_CONTROL["careers"])
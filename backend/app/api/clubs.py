@@ -2,31 +2,348 @@
 Clubs API Routes
 Endpoints for managing clubs in the database
 """
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Body
-from typing import List, Optional
-from app.models.club import Club, ClubCreate
-from app.db.client import get_db
-from app.utils.slug import generate_slug
-from supabase import Client
 import os
+from typing import List, Optional, Union
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from postgrest.exceptions import APIError
+from supabase import AsyncClient
+
+from app.core.config import get_tuning
+from app.db.cache import catalog_cache
+from app.db.client import get_async_db
+from app.db.coalesce import by_id_loader, execute
+from app.models.club import Club, ClubCreate
+from app.models.page import Page
+from app.services.assets import STORAGE_BUCKET, store_club_images
+from app.services.catalog_snapshot import CatalogData, catalog_snapshot, snapshot_headers
+from app.services.club_filters import SORT_KEY_TYPES, SORT_KEYS, ClubFilterIndex, club_filters
+from app.services.club_import import (
+    CSV_CONTENT_TYPES,
+    NDJSON_CONTENT_TYPES,
+    import_clubs,
+    iter_csv_records,
+    iter_lines,
+    iter_ndjson_records,
+)
+from app.services.club_search import club_search
+from app.services.renditions import BANNER_WIDTHS, LOGO_WIDTHS
+from app.utils.http import CACHE_CONTROL, conditional_response, row_last_modified
+from app.utils.images import (
+    BANNER_ASPECT_RATIOS,
+    LOGO_ASPECT_RATIOS,
+    MAX_IMAGE_BYTES,
+    ImageInfo,
+    ImageValidationError,
+    check_dimensions,
+    read_capped,
+)
+from app.utils.pagination import decode_cursor, encode_cursor, keyset_filter
+from app.utils.serialization import EncodedPayload, encode_payload, project_rows
+from app.utils.slug import generate_slug, next_available_slug
 
 router = APIRouter()
 
-# Storage bucket name
-STORAGE_BUCKET = "club-assets"
+# Cache namespace for club reads (invalidated on every club write)
+CACHE_NAMESPACE = "clubs"
+
+# Keyset pagination page sizes (sort order is club_filters.SORT_KEYS)
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Postgres error code for unique constraint violations
+UNIQUE_VIOLATION = "23505"
+
+# Insert attempts before giving up when concurrent creates race for a slug
+SLUG_INSERT_ATTEMPTS = get_tuning().slug_insert_attempts
+
+# Concurrent by-ID club reads are batched into one `in_` query per tick
+club_loader = by_id_loader("clubs")
+
+# Search result limits
+DEFAULT_SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 50
+
+
+async def _fetch_all_clubs(db: AsyncClient) -> list[dict]:
+    """Fetch all club rows ordered by display_order, then created_at"""
+    query = db.table("clubs").select("*").order("display_order", desc=False)
+    response = await execute(query.order("created_at", desc=False))
+    return response.data
 
 
-@router.get("/", response_model=List[Club])
-async def get_all_clubs(db: Client = Depends(get_db)):
+async def _fetch_clubs_page(db: AsyncClient, after: Optional[list], limit: int) -> list[dict]:
+    """Fetch up to limit + 1 club rows after the cursor values (extra row signals a next page)"""
+    query = db.table("clubs").select("*")
+    if after is not None:
+        query = query.or_(keyset_filter(SORT_KEYS, after))
+    for key in SORT_KEYS:
+        query = query.order(key, desc=False)
+    response = await execute(query.limit(limit + 1))
+    return response.data
+
+
+async def _fetch_club(db: AsyncClient, club_id: str) -> dict:
+    """Fetch a single club row (batched with concurrent lookups), raising 404 if it is missing"""
+    try:
+        club = await club_loader.load(db, str(UUID(club_id)))
+    except ValueError:
+        club = None
+    
+    if club is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Club with id '{club_id}' not found"
+        )
+    
+    return club
+
+
+async def _fetch_taken_slugs(db: AsyncClient, base: str) -> list[str]:
+    """
+    Fetch existing slugs equal to base or of the form base-*, in one round trip
+
+    base must come from generate_slug(): it then holds only word characters
+    and hyphens, none of which PostgREST filters or LIKE treat specially.
     """
-    Get all clubs from the database
+    query = db.table("clubs").select("slug").or_(f"slug.eq.{base},slug.like.{base}-*")
+    response = await query.execute()
+    return [row["slug"] for row in response.data]
+
+
+async def _load_all_clubs(db: AsyncClient) -> EncodedPayload:
+    """Fetch and encode the legacy unpaged club list"""
+    rows = await _fetch_all_clubs(db)
+    return encode_payload(project_rows(rows, Club))
+
+
+async def _load_clubs_page(db: AsyncClient, cursor: Optional[str], limit: int) -> EncodedPayload:
+    """Fetch and encode one page of clubs with its next cursor"""
+    after = decode_cursor(cursor, SORT_KEY_TYPES) if cursor else None
+    rows = await _fetch_clubs_page(db, after, limit)
+    clubs = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor([clubs[-1][key] for key in SORT_KEYS])
+    return encode_payload({"items": project_rows(clubs, Club), "next_cursor": next_cursor})
+
+
+def _index_payload(
+    index: ClubFilterIndex,
+    major_id: Optional[str],
+    is_active: Optional[bool],
+    cursor: Optional[str],
+    limit: Optional[int],
+) -> EncodedPayload:
+    """Answer a club list (one page, or every match when limit is None) from a club filter index"""
+    def build():
+        bits = index.matches(major_id, is_active)
+        if limit is None:
+            return project_rows(index.rows_for(bits), Club)
+        after = decode_cursor(cursor, SORT_KEY_TYPES) if cursor else None
+        clubs, has_more = index.page(bits, after, limit)
+        next_cursor = encode_cursor([clubs[-1][key] for key in SORT_KEYS]) if has_more else None
+        return {"items": project_rows(clubs, Club), "next_cursor": next_cursor}
+
+    return index.payload((major_id, is_active, cursor, limit), build)
+
+
+def _major_filter(major_id: Optional[str]) -> Optional[str]:
+    """Canonical form of a major_id filter, or None when not filtering"""
+    if major_id is None:
+        return None
+    try:
+        return str(UUID(major_id))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid major_id")
+
+
+async def _load_filtered_clubs(
+    db: AsyncClient,
+    major_id: Optional[str],
+    is_active: Optional[bool],
+    cursor: Optional[str],
+    limit: Optional[int],
+) -> EncodedPayload:
+    """Answer a filtered club list from the live filter index"""
+    index = await club_filters.ensure_loaded(db)
+    return _index_payload(index, major_id, is_active, cursor, limit)
+
+
+async def _load_club(db: AsyncClient, club_id: str) -> EncodedPayload:
+    """Fetch and encode a single club"""
+    club = await _fetch_club(db, club_id)
+    return encode_payload(project_rows([club], Club)[0], last_modified=row_last_modified(club))
+
+
+async def preload(db: AsyncClient) -> None:
+    """Build the search and filter indexes and cache the first club page (run at startup)"""
+    await club_search.ensure_loaded(db)
+    await club_filters.ensure_loaded(db)
+    await catalog_cache.get_or_load(
+        (CACHE_NAMESPACE, "page", None, DEFAULT_PAGE_SIZE),
+        lambda: _load_clubs_page(db, None, DEFAULT_PAGE_SIZE),
+    )
+
+
+def _snapshot_club(snapshot: CatalogData, club_id: str) -> EncodedPayload:
+    """Encode a single club from the catalog snapshot, raising 404 if it is not there"""
+    try:
+        club = snapshot.club(str(UUID(club_id)))
+    except ValueError:
+        club = None
+    
+    if club is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Club with id '{club_id}' not found"
+        )
+    
+    return encode_payload(project_rows([club], Club)[0], last_modified=row_last_modified(club))
+
+
+async def _read_image(
+    file: UploadFile, aspect_ratios: list[tuple[float, float]], label: str
+) -> tuple[bytes, ImageInfo]:
+    """
+    Read and validate an image upload
+
+    The file is read in chunks (aborting past 2 MB), then its type and
+    dimensions are checked from the header without decoding it.
+
+    Raises:
+        HTTPException: 400 if the file is not an acceptable image
+    """
+    try:
+        data, info = await read_capped(file, MAX_IMAGE_BYTES, label)
+        check_dimensions(info, aspect_ratios, label)
+    except ImageValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return data, info
+
+
+async def _save_club_images(
+    db: AsyncClient,
+    club_slug: str,
+    logo: Optional[tuple[bytes, ImageInfo]] = None,
+    banner: Optional[tuple[bytes, ImageInfo]] = None,
+) -> dict:
+    """
+    Store images under content-hash paths and record their URLs on the club
+
+    Raises:
+        HTTPException: 400 if an image cannot be decoded
+    """
+    try:
+        updates = await store_club_images(
+            db.storage.from_(STORAGE_BUCKET), logo, banner, LOGO_WIDTHS, BANNER_WIDTHS
+        )
+    except ImageValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    response = await db.table("clubs").update(updates).eq("slug", club_slug).execute()
+    catalog_cache.invalidate(CACHE_NAMESPACE)
+    club_search.upsert(response.data)
+    club_filters.invalidate()
+    catalog_snapshot.request_sync()
+    return updates
+
+
+async def _require_club_slug(db: AsyncClient, club_slug: str) -> None:
+    """Raise 404 unless a club with this slug exists"""
+    club_response = await db.table("clubs").select("id, slug").eq("slug", club_slug).execute()
+    if not club_response.data:
+        raise HTTPException(status_code=404, detail=f"Club with slug '{club_slug}' not found")
+
+
+@router.get("/", response_model=Union[Page[Club], List[Club]])
+async def get_all_clubs(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    paginate: bool = Query(True, description="Set to false for the legacy unpaged list"),
+    major_id: Optional[str] = Query(
+        None, description="Only clubs for this major (including all-majors clubs)"
+    ),
+    is_active: Optional[bool] = Query(
+        None, description="Only active (true) or inactive (false) clubs"
+    ),
+    db: AsyncClient = Depends(get_async_db)
+) -> Response:
+    """
+    Get clubs from the database, one keyset page at a time
+    
+    Supports conditional GET: returns 304 when If-None-Match matches the ETag.
+    Rows are encoded once per catalog version and served from the cache as bytes.
+    Filtered lists (major_id / is_active) are answered from the in-memory
+    club filter index by bitset intersection; their cursors are
+    interchangeable with unfiltered ones. In snapshot mode every list is
+    answered from the local catalog snapshot instead.
+    
+    Args:
+        limit: Maximum number of clubs per page
+        cursor: Opaque cursor returned as next_cursor by the previous page
+        paginate: If False, return every club as a plain list (legacy clients)
+        major_id: Major UUID; clubs linked to it and clubs marked is_all_majors
+        is_active: Filter on the club's active flag
     
     Returns:
-        List of all clubs ordered by display_order, then created_at
+        Page of clubs ordered by display_order, then created_at
+        (or a list of all clubs when paginate is False)
+        
+    Raises:
+        HTTPException: 400 if the cursor or major_id is invalid
     """
+    major_id = _major_filter(major_id)
+    if paginate and cursor:
+        try:
+            decode_cursor(cursor, SORT_KEY_TYPES)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
     try:
-        response = db.table("clubs").select("*").order("display_order", desc=False).order("created_at", desc=False).execute()
-        return [Club(**club) for club in response.data]
+        snapshot = catalog_snapshot.current()
+        if snapshot is not None:
+            payload = _index_payload(
+                snapshot.clubs,
+                major_id,
+                is_active,
+                cursor if paginate else None,
+                limit if paginate else None,
+            )
+        elif major_id is not None or is_active is not None:
+            payload = await _load_filtered_clubs(
+                db, major_id, is_active, cursor if paginate else None, limit if paginate else None
+            )
+        elif not paginate:
+            payload = await catalog_cache.get_or_load(
+                (CACHE_NAMESPACE, "all"), lambda: _load_all_clubs(db)
+            )
+        else:
+            payload = await catalog_cache.get_or_load(
+                (CACHE_NAMESPACE, "page", cursor, limit),
+                lambda: _load_clubs_page(db, cursor, limit),
+            )
+        return conditional_response(
+            request,
+            payload,
+            cache_control=CACHE_CONTROL["clubs.list"],
+            headers=snapshot_headers(snapshot),
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -34,6 +351,70 @@ async def get_all_clubs(db: Client = Depends(get_db)):
         )
 
 
+@router.get("/search")
+async def search_clubs(
+    q: str = Query(
+        ..., min_length=1, max_length=100, description="Search text (partial words allowed)"
+    ),
+    limit: int = Query(
+        DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT, description="Maximum results"
+    ),
+    include_inactive: bool = Query(False, description="Also return inactive clubs"),
+    major_id: Optional[str] = Query(
+        None, description="Only clubs for this major (including all-majors clubs)"
+    ),
+    db: AsyncClient = Depends(get_async_db)
+):
+    """
+    Search clubs by name, slug, description and tags
+    
+    Results are ranked (name matches first) and tolerate typos; the last
+    word is matched as a prefix for search-as-you-type. Served from an
+    in-memory index, so Supabase is only queried when the index is loaded
+    or refreshed.
+    
+    Args:
+        q: Search text
+        limit: Maximum number of results
+        include_inactive: Whether inactive clubs are included
+        major_id: Major UUID to restrict results to (via the club filter index)
+        
+    Returns:
+        Matching clubs, best first, each with a relevance score
+        
+    Raises:
+        HTTPException: 400 if major_id is invalid
+    """
+    major_id = _major_filter(major_id)
+    try:
+        snapshot = catalog_snapshot.current()
+        if snapshot is not None:
+            index, filters = snapshot.search, snapshot.clubs
+        else:
+            index = await club_search.ensure_loaded(db)
+            filters = await club_filters.ensure_loaded(db) if major_id is not None else None
+        if major_id is not None:
+            bits = filters.matches(major_id, None if include_inactive else True)
+
+            def predicate(row: dict) -> bool:
+                return filters.contains(row["id"], bits)
+        elif include_inactive:
+            predicate = None
+        else:
+            def predicate(row: dict) -> bool:
+                return row.get("is_active", True)
+        results = index.search(q, limit=limit, predicate=predicate)
+        items = project_rows([row for row, _ in results], Club)
+        for item, (_, score) in zip(items, results):
+            item["score"] = score
+        return {"query": q, "items": items}
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to search clubs: {str(e)}"
+        )
+
+
 @router.post("/", response_model=Club, status_code=201)
 async def create_club(
     name: str = Form(...),
@@ -44,7 +425,7 @@ async def create_club(
     display_order: int = Form(0),
     logo_url: Optional[str] = Form(None),
     banner_url: Optional[str] = Form(None),
-    db: Client = Depends(get_db)
+    db: AsyncClient = Depends(get_async_db)
 ):
     """
     Create a new club
@@ -53,7 +434,8 @@ async def create_club(
         name: Club name
         description: Club description
         website: Club website URL (optional)
-        slug: URL-friendly slug (optional, auto-generated from name if not provided)
+        slug: URL-friendly slug (optional, normalized like generated slugs; generated
+              from name if not provided)
         is_active: Whether club is active
         display_order: Display order
         logo_url: Logo URL (optional)
@@ -63,37 +445,45 @@ async def create_club(
         Created club with generated id and created_at
         
     Raises:
-        HTTPException: 400 if validation fails, 500 if database error
+        HTTPException: 400 if validation fails, 409 if no unique slug could be
+                       claimed, 500 if database error
     """
     try:
-        # Generate slug if not provided
-        if not slug:
-            slug = generate_slug(name)
-        
-        # Check if slug already exists
-        existing = db.table("clubs").select("id").eq("slug", slug).execute()
-        if existing.data:
-            # Append number if slug exists
-            counter = 1
-            original_slug = slug
-            while existing.data:
-                slug = f"{original_slug}-{counter}"
-                existing = db.table("clubs").select("id").eq("slug", slug).execute()
-                counter += 1
+        # Normalize a provided slug the same way (it is used in a prefix filter),
+        # falling back to the name if nothing is left of it
+        base_slug = (generate_slug(slug) if slug else "") or generate_slug(name)
         
         club_dict = {
             "name": name,
             "description": description,
             "website": website,
-            "slug": slug,
             "is_active": is_active,
             "display_order": display_order,
             "logo_url": logo_url,
             "banner_url": banner_url,
         }
         
-        # Insert into database
-        response = db.table("clubs").insert(club_dict).execute()
+        # Pick the next free suffix from one prefix query, then insert. If a
+        # concurrent create claims the same slug first, the unique constraint
+        # rejects ours and we re-read the taken slugs and try again.
+        response = None
+        for _ in range(SLUG_INSERT_ATTEMPTS):
+            taken = await _fetch_taken_slugs(db, base_slug)
+            club_dict["slug"] = next_available_slug(base_slug, taken)
+            try:
+                response = await db.table("clubs").insert(club_dict).execute()
+                break
+            except APIError as e:
+                if e.code != UNIQUE_VIOLATION:
+                    raise
+        
+        if response is None:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Failed to create club: could not claim a unique slug for '{base_slug}'"
+            )
+        
+        catalog_cache.invalidate(CACHE_NAMESPACE)
         
         if not response.data:
             raise HTTPException(
@@ -101,6 +491,9 @@ async def create_club(
                 detail="Failed to create club: No data returned"
             )
         
+        club_search.upsert(response.data)
+        club_filters.invalidate()
+        catalog_snapshot.request_sync()
         return Club(**response.data[0])
     except HTTPException:
         raise
@@ -111,65 +504,78 @@ async def create_club(
         )
 
 
+@router.post("/import")
+async def bulk_import_clubs(request: Request, db: AsyncClient = Depends(get_async_db)):
+    """
+    Bulk import clubs from an NDJSON or CSV request body
+    
+    The body is streamed and parsed row by row; each row is validated against
+    ClubCreate, slugs are assigned per batch, and rows are inserted with
+    multi-row requests. Invalid rows are reported and skipped.
+    
+    Send `Content-Type: application/x-ndjson` (one JSON object per line) or
+    `Content-Type: text/csv` (header row with ClubCreate field names).
+    
+    Returns:
+        Report with total/created/failed counts and a result per row
+        
+    Raises:
+        HTTPException: 415 if the content type is not NDJSON or CSV
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_CONTENT_TYPES:
+        records = iter_ndjson_records(iter_lines(request.stream()))
+    elif content_type in CSV_CONTENT_TYPES:
+        records = iter_csv_records(iter_lines(request.stream()))
+    else:
+        raise HTTPException(
+            status_code=415,
+            detail="Import body must be NDJSON (application/x-ndjson) or CSV (text/csv)"
+        )
+    
+    try:
+        report = await import_clubs(db, records)
+        if report["created"]:
+            catalog_cache.invalidate(CACHE_NAMESPACE)
+            club_search.invalidate()
+            club_filters.invalidate()
+            catalog_snapshot.request_sync()
+        return report
+    except Exception as e:
+        catalog_cache.invalidate(CACHE_NAMESPACE)
+        club_search.invalidate()
+        club_filters.invalidate()
+        catalog_snapshot.request_sync()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to import clubs: {str(e)}"
+        )
+
+
 @router.post("/{club_slug}/upload-logo")
 async def upload_logo(
     club_slug: str,
     file: UploadFile = File(...),
-    db: Client = Depends(get_db)
+    db: AsyncClient = Depends(get_async_db)
 ):
     """
     Upload logo image for a club
     
     Args:
         club_slug: The club's slug
-        file: Image file (must be PNG, max 2MB, 1:1 aspect ratio)
+        file: Image file (PNG, JPEG or WebP, max 2MB, 1:1 aspect ratio)
         
     Returns:
-        Public URL of the uploaded logo
+        Public URLs of the uploaded logo and its resized renditions
         
     Raises:
         HTTPException: 404 if club not found, 400 if validation fails
     """
     try:
-        # Verify club exists
-        club_response = db.table("clubs").select("id, slug").eq("slug", club_slug).execute()
-        if not club_response.data:
-            raise HTTPException(status_code=404, detail=f"Club with slug '{club_slug}' not found")
-        
-        # Read file content
-        file_content = await file.read()
-        
-        # Validate file size (2 MB max for logo)
-        if len(file_content) > 2 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="Logo file size must be ≤ 2 MB")
-        
-        # Validate file type
-        if not file.content_type or not file.content_type.startswith("image/"):
-            raise HTTPException(status_code=400, detail="File must be an image")
-        
-        # Upload to Supabase Storage
-        storage_path = f"clubs/{club_slug}/logo.png"
-        
-        # Upload with upsert (overwrite if exists)
-        storage = db.storage.from_(STORAGE_BUCKET)
-        upload_response = storage.upload(
-            storage_path,
-            file_content,
-            file_options={"content-type": file.content_type, "upsert": "true"}
-        )
-        
-        # Get public URL
-        public_url_response = storage.get_public_url(storage_path)
-        # Handle both string and dict responses
-        if isinstance(public_url_response, dict):
-            public_url = public_url_response.get("publicUrl", public_url_response.get("public_url", str(public_url_response)))
-        else:
-            public_url = str(public_url_response)
-        
-        # Update club record with logo URL
-        db.table("clubs").update({"logo_url": public_url}).eq("slug", club_slug).execute()
-        
-        return {"logo_url": public_url, "message": "Logo uploaded successfully"}
+        await _require_club_slug(db, club_slug)
+        image = await _read_image(file, LOGO_ASPECT_RATIOS, "Logo")
+        updates = await _save_club_images(db, club_slug, logo=image)
+        return {**updates, "message": "Logo uploaded successfully"}
     except HTTPException:
         raise
     except Exception as e:
@@ -183,61 +589,26 @@ async def upload_logo(
 async def upload_banner(
     club_slug: str,
     file: UploadFile = File(...),
-    db: Client = Depends(get_db)
+    db: AsyncClient = Depends(get_async_db)
 ):
     """
     Upload banner image for a club
     
     Args:
         club_slug: The club's slug
-        file: Image file (must be JPG/PNG, max 2MB, wide aspect ratio)
+        file: Image file (PNG, JPEG or WebP, max 2MB, 16:9 or 3:1 aspect ratio)
         
     Returns:
-        Public URL of the uploaded banner
+        Public URLs of the uploaded banner and its resized renditions
         
     Raises:
         HTTPException: 404 if club not found, 400 if validation fails
     """
     try:
-        # Verify club exists
-        club_response = db.table("clubs").select("id, slug").eq("slug", club_slug).execute()
-        if not club_response.data:
-            raise HTTPException(status_code=404, detail=f"Club with slug '{club_slug}' not found")
-        
-        # Read file content
-        file_content = await file.read()
-        
-        # Validate file size (2 MB max for banner)
-        if len(file_content) > 2 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="Banner file size must be ≤ 2 MB")
-        
-        # Validate file type
-        if not file.content_type or not file.content_type.startswith("image/"):
-            raise HTTPException(status_code=400, detail="File must be an image")
-        
-        # Upload to Supabase Storage
-        storage_path = f"clubs/{club_slug}/banner.jpg"
-        
-        # Upload with upsert (overwrite if exists)
-        storage = db.storage.from_(STORAGE_BUCKET)
-        upload_response = storage.upload(
-            storage_path,
-            file_content,
-            file_options={"content-type": file.content_type, "upsert": "true"}
-        )
-        
-        # Get public URL
-        public_url_response = storage.get_public_url(storage_path)
-        # Handle both string and dict responses
-        if isinstance(public_url_response, dict):
-            public_url = public_url_response.get("publicUrl", public_url_response.get("public_url", str(public_url_response)))
-        else:
-            public_url = str(public_url_response)
-        
-        # Update club record with banner URL
-        db.table("clubs").update({"banner_url": public_url}).eq("slug", club_slug).execute()
-        
-        return {"banner_url": public_url, "message": "Banner uploaded successfully"}
+        await _require_club_slug(db, club_slug)
+        image = await _read_image(file, BANNER_ASPECT_RATIOS, "Banner")
+        updates = await _save_club_images(db, club_slug, banner=image)
+        return {**updates, "message": "Banner uploaded successfully"}
     except HTTPException:
         raise
     except Exception as e:
@@ -247,11 +618,56 @@ async def upload_banner(
         )
 
 
+@router.post("/{club_slug}/upload-assets")
+async def upload_assets(
+    club_slug: str,
+    logo: Optional[UploadFile] = File(None),
+    banner: Optional[UploadFile] = File(None),
+    db: AsyncClient = Depends(get_async_db)
+):
+    """
+    Upload a logo and a banner for a club in one request
+
+    Both images are validated first, then stored concurrently. Either file
+    may be omitted.
+
+    Args:
+        club_slug: The club's slug
+        logo: Logo image (PNG, JPEG or WebP, max 2MB, 1:1 aspect ratio)
+        banner: Banner image (PNG, JPEG or WebP, max 2MB, 16:9 or 3:1 aspect ratio)
+
+    Returns:
+        Public URLs of the uploaded images and their resized renditions
+
+    Raises:
+        HTTPException: 404 if club not found, 400 if validation fails
+    """
+    try:
+        if logo is None and banner is None:
+            raise HTTPException(status_code=400, detail="Provide a logo, a banner, or both")
+
+        await _require_club_slug(db, club_slug)
+        logo_image = banner_image = None
+        if logo is not None:
+            logo_image = await _read_image(logo, LOGO_ASPECT_RATIOS, "Logo")
+        if banner is not None:
+            banner_image = await _read_image(banner, BANNER_ASPECT_RATIOS, "Banner")
+        updates = await _save_club_images(db, club_slug, logo=logo_image, banner=banner_image)
+        return {**updates, "message": "Assets uploaded successfully"}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to upload assets: {str(e)}"
+        )
+
+
 @router.patch("/{club_id}", response_model=Club)
 async def update_club(
     club_id: str,
     update_data: dict = Body(...),
-    db: Client = Depends(get_db)
+    db: AsyncClient = Depends(get_async_db)
 ):
     """
     Update club fields (typically image URLs)
@@ -268,7 +684,7 @@ async def update_club(
     """
     try:
         # Check if club exists
-        existing = db.table("clubs").select("*").eq("id", club_id).execute()
+        existing = await db.table("clubs").select("*").eq("id", club_id).execute()
         if not existing.data:
             raise HTTPException(status_code=404, detail=f"Club with id '{club_id}' not found")
         
@@ -276,11 +692,15 @@ async def update_club(
             return Club(**existing.data[0])
         
         # Update club
-        response = db.table("clubs").update(update_data).eq("id", club_id).execute()
+        response = await db.table("clubs").update(update_data).eq("id", club_id).execute()
+        catalog_cache.invalidate(CACHE_NAMESPACE)
         
         if not response.data:
             raise HTTPException(status_code=500, detail="Failed to update club")
         
+        club_search.upsert(response.data)
+        club_filters.invalidate()
+        catalog_snapshot.request_sync()
         return Club(**response.data[0])
     except HTTPException:
         raise
@@ -292,10 +712,14 @@ async def update_club(
 
 
 @router.get("/{club_id}", response_model=Club)
-async def get_club_by_id(club_id: str, db: Client = Depends(get_db)):
+async def get_club_by_id(
+    club_id: str, request: Request, db: AsyncClient = Depends(get_async_db)
+) -> Response:
     """
     Get a specific club by ID
     
+    Supports conditional GET via If-None-Match / If-Modified-Since.
+    
     Args:
         club_id: UUID of the club
         
@@ -306,15 +730,19 @@ async def get_club_by_id(club_id: str, db: Client = Depends(get_db)):
         HTTPException: 404 if club not found
     """
     try:
-        response = db.table("clubs").select("*").eq("id", club_id).execute()
-        
-        if not response.data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Club with id '{club_id}' not found"
+        snapshot = catalog_snapshot.current()
+        if snapshot is not None:
+            payload = _snapshot_club(snapshot, club_id)
+        else:
+            payload = await catalog_cache.get_or_load(
+                (CACHE_NAMESPACE, "id", club_id), lambda: _load_club(db, club_id)
             )
-        
-        return Club(**response.data[0])
+        return conditional_response(
+            request,
+            payload,
+            cache_control=CACHE_CONTROL["clubs.detail"],
+            headers=snapshot_headers(snapshot),
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -0,0 +1,222 @@
+"""
+Courses API Routes
+Read-only endpoints for courses and prerequisite graphs
+"""
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from app.models.course import Course, PlanRequest, SemesterPlan
+from app.services.course_graph import CATALOG, CourseGraphIndex, get_course_catalog
+from app.services.semester_planner import PlanError, get_planner
+from app.utils.http import CACHE_CONTROL, conditional_response
+
+router = APIRouter()
+
+
+def _get_index(major: Optional[str]) -> CourseGraphIndex:
+    """Get the graph index for a major (or the combined catalog), raising 404 if unknown"""
+    index = get_course_catalog().get(major)
+    if index is None:
+        raise HTTPException(status_code=404, detail=f"Major '{major}' not found")
+    return index
+
+
+def _require_course(index: CourseGraphIndex, course_id: str) -> None:
+    """Raise 404 unless the course is in the graph"""
+    if course_id not in index:
+        raise HTTPException(status_code=404, detail=f"Course '{course_id}' not found")
+
+
+@router.get("/", response_model=List[Course])
+async def get_all_courses(
+    request: Request,
+    major: Optional[str] = Query(None, description="Major slug (defaults to every major)")
+) -> Response:
+    """
+    Get all courses, prerequisites first
+
+    Args:
+        major: Major slug, e.g. "cs-cse" (optional)
+
+    Returns:
+        List of courses in topological order
+
+    Raises:
+        HTTPException: 404 if the major is unknown
+    """
+    index = _get_index(major)
+    payload = index.payload(("courses",), lambda: index.rows)
+    return conditional_response(request, payload, cache_control=CACHE_CONTROL["courses"])
+
+
+@router.get("/majors")
+async def get_course_majors(request: Request) -> Response:
+    """
+    List the majors that have course graphs
+
+    Returns:
+        Major slugs with their course counts
+    """
+    catalog = get_course_catalog()
+    payload = catalog.catalog.payload(
+        ("majors",),
+        lambda: [
+            {"major": major, "course_count": len(index)} for major, index in catalog.majors.items()
+        ],
+    )
+    return conditional_response(request, payload, cache_control=CACHE_CONTROL["courses"])
+
+
+@router.get("/majors/{major}/graph")
+async def get_major_graph(major: str, request: Request) -> Response:
+    """
+    Get a major's whole prerequisite graph
+
+    Args:
+        major: Major slug, e.g. "cs-cse"
+
+    Returns:
+        Courses in topological order, with each course's direct and
+        transitive prerequisites and the courses it unlocks
+
+    Raises:
+        HTTPException: 404 if the major is unknown
+    """
+    if major == CATALOG:
+        raise HTTPException(status_code=404, detail=f"Major '{major}' not found")
+    index = _get_index(major)
+
+    def build():
+        return {
+            "major": major,
+            "order": index.order,
+            "courses": index.rows,
+            "prerequisites": {
+                course_id: index.ids(index.prerequisites(course_id, transitive=True))
+                for course_id in index.order
+            },
+            "unlocks": {
+                course_id: index.ids(index.unlocks(course_id, transitive=True))
+                for course_id in index.order
+            },
+        }
+
+    payload = index.payload(("graph",), build)
+    return conditional_response(request, payload, cache_control=CACHE_CONTROL["courses"])
+
+
+@router.post("/plan", response_model=SemesterPlan)
+async def plan_semesters(plan_request: PlanRequest, request: Request) -> Response:
+    """
+    Schedule a student's remaining courses into the fewest semesters
+
+    Courses are only taken after all of their prerequisites, in the term
+    they are offered (unless strict_offering is false), within the
+    per-semester course and unit caps. The longest prerequisite chain is
+    scheduled first. Plans are cached per set of completed courses, so
+    toggling a course back and forth is served from memory.
+
+    Args:
+        plan_request: Major, completed course IDs and scheduling limits
+
+    Returns:
+        Semester-by-semester plan with its critical path
+
+    Raises:
+        HTTPException: 404 if the major is unknown, 400 if the courses cannot be scheduled
+    """
+    if plan_request.major == CATALOG:
+        raise HTTPException(status_code=404, detail=f"Major '{plan_request.major}' not found")
+    index = _get_index(plan_request.major)
+
+    try:
+        payload = get_planner(plan_request.major, index).plan_payload(plan_request)
+    except PlanError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_response(request, payload, cache_control="no-store")
+
+
+@router.get("/{course_id}", response_model=Course)
+async def get_course_by_id(
+    course_id: str,
+    request: Request,
+    major: Optional[str] = Query(None, description="Major slug (defaults to every major)")
+) -> Response:
+    """
+    Get a specific course by ID
+
+    Args:
+        course_id: Course ID, e.g. "cse-030"
+        major: Major slug whose version of the course to return (optional)
+
+    Returns:
+        Course details
+
+    Raises:
+        HTTPException: 404 if the major or course is not found
+    """
+    index = _get_index(major)
+    _require_course(index, course_id)
+    payload = index.payload(("course", course_id), lambda: index.rows[index.position(course_id)])
+    return conditional_response(request, payload, cache_control=CACHE_CONTROL["courses"])
+
+
+@router.get("/{course_id}/prerequisites", response_model=List[Course])
+async def get_course_prerequisites(
+    course_id: str,
+    request: Request,
+    transitive: bool = Query(False, description="Include prerequisites of prerequisites"),
+    major: Optional[str] = Query(None, description="Major slug (defaults to every major)")
+) -> Response:
+    """
+    Get the courses required before a course
+
+    Args:
+        course_id: Course ID, e.g. "cse-030"
+        transitive: Return every course in the prerequisite chain, not just direct ones
+        major: Major slug whose prerequisite rules to use (optional)
+
+    Returns:
+        Prerequisite courses in topological order
+
+    Raises:
+        HTTPException: 404 if the major or course is not found
+    """
+    index = _get_index(major)
+    _require_course(index, course_id)
+    payload = index.payload(
+        ("prerequisites", course_id, transitive),
+        lambda: index.rows_for(index.prerequisites(course_id, transitive)),
+    )
+    return conditional_response(request, payload, cache_control=CACHE_CONTROL["courses"])
+
+
+@router.get("/{course_id}/unlocks", response_model=List[Course])
+async def get_course_unlocks(
+    course_id: str,
+    request: Request,
+    transitive: bool = Query(False, description="Include courses unlocked indirectly"),
+    major: Optional[str] = Query(None, description="Major slug (defaults to every major)")
+) -> Response:
+    """
+    Get the courses that require a course ("what does this unlock")
+
+    Args:
+        course_id: Course ID, e.g. "cse-030"
+        transitive: Return every course downstream, not just direct dependents
+        major: Major slug whose prerequisite rules to use (optional)
+
+    Returns:
+        Dependent courses in topological order
+
+    Raises:
+        HTTPException: 404 if the major or course is not found
+    """
+    index = _get_index(major)
+    _require_course(index, course_id)
+    payload = index.payload(
+        ("unlocks", course_id, transitive),
+        lambda: index.rows_for(index.unlocks(course_id, transitive)),
+    )
+    return conditional_response(request, payload, cache_control=CACHE_CONTROL["courses"])
@@ -2,25 +2,208 @@
 Majors API Routes
 Endpoints for managing majors in the database
 """
-from fastapi import APIRouter, HTTPException, Depends, Body
-from typing import List, Dict, Optional
-from app.db.client import get_db
-from supabase import Client
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from postgrest.exceptions import APIError
+from supabase import AsyncClient
+
+from app.db.cache import catalog_cache
+from app.db.client import get_async_admin_db, get_async_db
+from app.db.coalesce import by_id_loader, execute
+from app.services.catalog_snapshot import (
+    MAJOR_SORT_KEY_TYPES,
+    MAJOR_SORT_KEYS,
+    CatalogData,
+    SortedRows,
+    catalog_snapshot,
+    snapshot_headers,
+)
+from app.utils.http import CACHE_CONTROL, conditional_response, row_last_modified
+from app.utils.pagination import decode_cursor, encode_cursor, keyset_filter
+from app.utils.serialization import EncodedPayload, encode_payload
 
 router = APIRouter()
 
+# Cache namespace for major reads (invalidated on every major write)
+CACHE_NAMESPACE = "majors"
+
+# Keyset pagination: list sort order (name, then id) and page sizes
+SORT_KEYS = MAJOR_SORT_KEYS
+SORT_KEY_TYPES = MAJOR_SORT_KEY_TYPES
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Postgres error codes mapped to client errors (checks are left to constraints)
+UNIQUE_VIOLATION = "23505"
+FOREIGN_KEY_VIOLATION = "23503"
+NO_DATA_FOUND = "P0002"
+
+# Concurrent by-ID major reads are batched into one `in_` query per tick
+major_loader = by_id_loader("majors")
+
+
+async def _fetch_all_majors(db: AsyncClient) -> list[dict]:
+    """Fetch all major rows ordered by name"""
+    response = await execute(db.table("majors").select("*").order("name", desc=False))
+    return response.data
+
+
+async def _fetch_majors_page(db: AsyncClient, after: Optional[list], limit: int) -> list[dict]:
+    """Fetch up to limit + 1 major rows after the cursor values (extra row signals a next page)"""
+    query = db.table("majors").select("*")
+    if after is not None:
+        query = query.or_(keyset_filter(SORT_KEYS, after))
+    for key in SORT_KEYS:
+        query = query.order(key, desc=False)
+    response = await execute(query.limit(limit + 1))
+    return response.data
+
+
+async def _fetch_major(db: AsyncClient, major_id: str) -> dict:
+    """Fetch a single major row (batched with concurrent lookups), raising 404 if it is missing"""
+    try:
+        major = await major_loader.load(db, str(UUID(major_id)))
+    except ValueError:
+        major = None
+    
+    if major is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Major with id '{major_id}' not found"
+        )
+    
+    return major
+
+
+def _require_uuid(major_id: str) -> None:
+    """Raise 404 for IDs that are not UUIDs (no major can have them)"""
+    try:
+        UUID(major_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Major with id '{major_id}' not found"
+        )
+
+
+async def _load_all_majors(db: AsyncClient) -> EncodedPayload:
+    """Fetch and encode the legacy unpaged major list"""
+    return encode_payload(await _fetch_all_majors(db))
+
+
+async def _load_majors_page(db: AsyncClient, cursor: Optional[str], limit: int) -> EncodedPayload:
+    """Fetch and encode one page of majors with its next cursor"""
+    after = decode_cursor(cursor, SORT_KEY_TYPES) if cursor else None
+    rows = await _fetch_majors_page(db, after, limit)
+    majors = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor([majors[-1][key] for key in SORT_KEYS])
+    return encode_payload({"items": majors, "next_cursor": next_cursor})
+
+
+async def _load_major(db: AsyncClient, major_id: str) -> EncodedPayload:
+    """Fetch and encode a single major"""
+    major = await _fetch_major(db, major_id)
+    return encode_payload(major, last_modified=row_last_modified(major))
+
+
+async def preload(db: AsyncClient) -> None:
+    """Cache the first major page (run at startup)"""
+    await catalog_cache.get_or_load(
+        (CACHE_NAMESPACE, "page", None, DEFAULT_PAGE_SIZE),
+        lambda: _load_majors_page(db, None, DEFAULT_PAGE_SIZE),
+    )
+
+
+def _snapshot_majors(
+    majors: SortedRows, cursor: Optional[str], limit: Optional[int]
+) -> EncodedPayload:
+    """Answer a major list (one page, or every major when limit is None) from the snapshot"""
+    def build():
+        if limit is None:
+            return majors.rows
+        after = decode_cursor(cursor, SORT_KEY_TYPES) if cursor else None
+        rows, has_more = majors.page(after, limit)
+        next_cursor = encode_cursor([rows[-1][key] for key in SORT_KEYS]) if has_more else None
+        return {"items": rows, "next_cursor": next_cursor}
+
+    return majors.payload((cursor, limit), build)
+
+
+def _snapshot_major(snapshot: CatalogData, major_id: str) -> EncodedPayload:
+    """Encode a single major from the catalog snapshot, raising 404 if it is not there"""
+    try:
+        major = snapshot.majors.by_id.get(str(UUID(major_id)))
+    except ValueError:
+        major = None
+    
+    if major is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Major with id '{major_id}' not found"
+        )
+    
+    return encode_payload(major, last_modified=row_last_modified(major))
+
 
 @router.get("/")
-async def get_all_majors(db: Client = Depends(get_db)):
+async def get_all_majors(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    paginate: bool = Query(True, description="Set to false for the legacy unpaged list"),
+    db: AsyncClient = Depends(get_async_db)
+) -> Response:
     """
-    Get all majors from the database
+    Get majors from the database, one keyset page at a time
+    
+    Supports conditional GET: returns 304 when If-None-Match matches the ETag.
+    In snapshot mode the list is answered from the local catalog snapshot.
+    
+    Args:
+        limit: Maximum number of majors per page
+        cursor: Opaque cursor returned as next_cursor by the previous page
+        paginate: If False, return every major as a plain list (legacy clients)
     
     Returns:
-        List of all majors ordered by name
+        Page of majors ordered by name ({"items": [...], "next_cursor": ...})
+        (or a list of all majors when paginate is False)
+        
+    Raises:
+        HTTPException: 400 if the cursor is invalid
     """
+    if paginate and cursor:
+        try:
+            decode_cursor(cursor, SORT_KEY_TYPES)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
     try:
-        response = db.table("majors").select("*").order("name", desc=False).execute()
-        return response.data
+        snapshot = catalog_snapshot.current()
+        if snapshot is not None:
+            payload = _snapshot_majors(
+                snapshot.majors, cursor if paginate else None, limit if paginate else None
+            )
+        elif not paginate:
+            payload = await catalog_cache.get_or_load(
+                (CACHE_NAMESPACE, "all"), lambda: _load_all_majors(db)
+            )
+        else:
+            payload = await catalog_cache.get_or_load(
+                (CACHE_NAMESPACE, "page", cursor, limit),
+                lambda: _load_majors_page(db, cursor, limit),
+            )
+        return conditional_response(
+            request,
+            payload,
+            cache_control=CACHE_CONTROL["majors.list"],
+            headers=snapshot_headers(snapshot),
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -29,10 +212,14 @@ async def get_all_majors(db: Client = Depends(get_db)):
 
 
 @router.get("/{major_id}")
-async def get_major_by_id(major_id: str, db: Client = Depends(get_db)):
+async def get_major_by_id(
+    major_id: str, request: Request, db: AsyncClient = Depends(get_async_db)
+) -> Response:
     """
     Get a specific major by ID
     
+    Supports conditional GET via If-None-Match / If-Modified-Since.
+    
     Args:
         major_id: UUID of the major
         
@@ -43,15 +230,19 @@ async def get_major_by_id(major_id: str, db: Client = Depends(get_db)):
         HTTPException: 404 if major not found
     """
     try:
-        response = db.table("majors").select("*").eq("id", major_id).execute()
-        
-        if not response.data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Major with id '{major_id}' not found"
+        snapshot = catalog_snapshot.current()
+        if snapshot is not None:
+            payload = _snapshot_major(snapshot, major_id)
+        else:
+            payload = await catalog_cache.get_or_load(
+                (CACHE_NAMESPACE, "id", major_id), lambda: _load_major(db, major_id)
             )
-        
-        return response.data[0]
+        return conditional_response(
+            request,
+            payload,
+            cache_control=CACHE_CONTROL["majors.detail"],
+            headers=snapshot_headers(snapshot),
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -64,7 +255,7 @@ async def get_major_by_id(major_id: str, db: Client = Depends(get_db)):
 @router.post("/", status_code=201)
 async def create_major(
     major_data: Dict[str, str] = Body(...),
-    db: Client = Depends(lambda: get_db(admin=True))  # Use admin client to bypass RLS
+    db: AsyncClient = Depends(get_async_admin_db)  # Use admin client to bypass RLS
 ):
     """
     Create a new major
@@ -87,16 +278,18 @@ async def create_major(
         
         name = major_data["name"].strip()
         
-        # Check if major with same name already exists
-        existing = db.table("majors").select("id").eq("name", name).execute()
-        if existing.data:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Major with name '{name}' already exists"
-            )
-        
-        # Insert into database
-        response = db.table("majors").insert({"name": name}).execute()
+        # Insert into database (the unique constraint on name rejects duplicates)
+        try:
+            response = await db.table("majors").insert({"name": name}).execute()
+        except APIError as e:
+            if e.code == UNIQUE_VIOLATION:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Major with name '{name}' already exists"
+                )
+            raise
+        catalog_cache.invalidate(CACHE_NAMESPACE)
+        catalog_snapshot.request_sync()
         
         if not response.data:
             raise HTTPException(
@@ -118,7 +311,7 @@ async def create_major(
 async def update_major(
     major_id: str,
     major_data: Dict[str, str] = Body(...),
-    db: Client = Depends(lambda: get_db(admin=True))  # Use admin client to bypass RLS
+    db: AsyncClient = Depends(get_async_admin_db)  # Use admin client to bypass RLS
 ):
     """
     Update a major
@@ -134,14 +327,6 @@ async def update_major(
         HTTPException: 404 if major not found, 400 if validation fails
     """
     try:
-        # Check if major exists
-        existing = db.table("majors").select("*").eq("id", major_id).execute()
-        if not existing.data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Major with id '{major_id}' not found"
-            )
-        
         # Build update dict
         update_dict = {}
         if "name" in major_data and major_data["name"]:
@@ -151,27 +336,31 @@ async def update_major(
                     status_code=400,
                     detail="Major name cannot be empty"
                 )
-            
-            # Check if another major with same name exists
-            existing_name = db.table("majors").select("id").eq("name", name).neq("id", major_id).execute()
-            if existing_name.data:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Major with name '{name}' already exists"
-                )
-            
             update_dict["name"] = name
         
         if not update_dict:
-            return existing.data[0]
+            return await _fetch_major(db, major_id)
         
-        # Update major
-        response = db.table("majors").update(update_dict).eq("id", major_id).execute()
+        _require_uuid(major_id)
+        
+        # Update major (no rows back means it does not exist; the unique
+        # constraint on name rejects duplicates)
+        try:
+            response = await db.table("majors").update(update_dict).eq("id", major_id).execute()
+        except APIError as e:
+            if e.code == UNIQUE_VIOLATION:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Major with name '{update_dict['name']}' already exists"
+                )
+            raise
+        catalog_cache.invalidate(CACHE_NAMESPACE)
+        catalog_snapshot.request_sync()
         
         if not response.data:
             raise HTTPException(
-                status_code=500,
-                detail="Failed to update major"
+                status_code=404,
+                detail=f"Major with id '{major_id}' not found"
             )
         
         return response.data[0]
@@ -187,12 +376,14 @@ async def update_major(
 @router.delete("/{major_id}", status_code=204)
 async def delete_major(
     major_id: str,
-    db: Client = Depends(lambda: get_db(admin=True))  # Use admin client to bypass RLS
+    db: AsyncClient = Depends(get_async_admin_db)  # Use admin client to bypass RLS
 ):
     """
     Delete a major
     
-    This will fail if the major has associated clubs (enforced by database constraints).
+    This will fail if the major has associated clubs. The check and the
+    delete run atomically in the delete_major_if_unused RPC, because
+    club_majors would otherwise cascade the delete.
     Consider updating club associations first.
     
     Args:
@@ -202,42 +393,32 @@ async def delete_major(
         HTTPException: 404 if major not found, 400 if major has associated clubs
     """
     try:
-        # Check if major exists
-        existing = db.table("majors").select("*").eq("id", major_id).execute()
-        if not existing.data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Major with id '{major_id}' not found"
-            )
-        
-        # Check if major has associated clubs
-        clubs_check = db.table("club_majors").select("club_id").eq("major_id", major_id).limit(1).execute()
-        if clubs_check.data:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Cannot delete major: It is associated with one or more clubs. Please remove the associations first."
-            )
+        _require_uuid(major_id)
         
-        # Delete the major
-        delete_response = db.table("majors").delete().eq("id", major_id).execute()
-        
-        if not delete_response.data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Major with id '{major_id}' not found or already deleted"
-            )
+        try:
+            await db.rpc("delete_major_if_unused", {"p_major_id": major_id}).execute()
+        except APIError as e:
+            if e.code == NO_DATA_FOUND:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Major with id '{major_id}' not found"
+                )
+            if e.code == FOREIGN_KEY_VIOLATION:
+                raise HTTPException(
+                    status_code=400,
+                    detail=(
+                        "Cannot delete major: It is associated with one or more clubs. "
+                        "Please remove the associations first."
+                    )
+                )
+            raise
+        catalog_cache.invalidate(CACHE_NAMESPACE)
+        catalog_snapshot.request_sync()
         
         return None  # 204 No Content
     except HTTPException:
         raise
     except Exception as e:
-        # Check if error is due to foreign key constraint
-        error_str = str(e).lower()
-        if "foreign key" in error_str or "constraint" in error_str:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Cannot delete major: It is associated with one or more clubs. Please remove the associations first."
-            )
         raise HTTPException(
             status_code=500,
             detail=f"Failed to delete major: {str(e)}"
@@ -0,0 +1,85 @@
+"""
+Response Compression
+ASGI middleware that compresses JSON and text responses the routes did not compress themselves
+"""
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.compression import (
+    MIN_COMPRESS_BYTES,
+    available_encodings,
+    compress_dynamic,
+    negotiate,
+)
+
+# Content types worth compressing (images and other binary bodies are already compressed)
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies with brotli or gzip, as negotiated with the client
+
+    Responses that already carry a Content-Encoding (cached payloads served
+    by conditional_response, which keep their compressed variants) are
+    passed through, as are bodies under COMPRESS_MIN_BYTES, non-text content
+    types and streamed responses. Large bodies are compressed in a worker
+    thread, so the event loop keeps serving other requests meanwhile.
+    """
+
+    def __init__(self, app: ASGIApp, min_bytes: int = MIN_COMPRESS_BYTES):
+        self.app = app
+        self.min_bytes = min_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), available_encodings())
+        start: Message = {}
+        passthrough = False
+
+        async def compressing_send(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                content_type = headers.get("content-type", "")
+                passthrough = (
+                    "content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or int(headers.get("content-length", self.min_bytes)) < self.min_bytes
+                )
+                if not passthrough:
+                    # Compressed or not, the body depends on Accept-Encoding
+                    headers.add_vary_header("Accept-Encoding")
+                    passthrough = encoding is None
+                if passthrough:
+                    await send(message)
+                else:
+                    start = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.min_bytes:
+                # Streamed (or, without Content-Length, small): send as is
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            compressed = await compress_dynamic(body, encoding)
+            headers = MutableHeaders(scope=start)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            if "etag" in headers:
+                etag = headers["etag"]
+                headers["ETag"] = f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+            passthrough = True
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, compressing_send)
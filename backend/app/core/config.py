@@ -1,20 +1,161 @@
 """
 Core Configuration
-TODO: Implement settings using Pydantic BaseSettings
+Application settings read from environment variables (and .env), validated once at startup
 """
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import Optional
 
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-class Settings(BaseSettings):
-    """Application settings - to be configured"""
-    
-    # TODO: Add environment variables
-    # SUPABASE_URL: str
-    # SUPABASE_KEY: str
-    # DATABASE_URL: str
-    
-    class Config:
-        env_file = ".env"
 
+class TuningSettings(BaseSettings):
+    """
+    Performance tuning knobs, all optional
 
-# settings = Settings()
+    Modules read these at import (for module-level caches and pools), so
+    they carry no required fields; a malformed value fails with a
+    ValidationError naming the variable.
+    """
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # Catalog response cache (app.db.cache)
+    catalog_cache_ttl_seconds: float = Field(300.0, gt=0)
+    catalog_cache_max_entries: int = Field(1024, ge=1)
+    catalog_cache_max_bytes: int = Field(32 * 1024 * 1024, ge=0)
+
+    # Semester plan cache
+    plan_cache_ttl_seconds: float = Field(3600.0, gt=0)
+    plan_cache_max_entries: int = Field(4096, ge=1)
+    plan_cache_max_bytes: int = Field(16 * 1024 * 1024, ge=0)
+
+    # Club search reload interval, filter index version polling and response memo size
+    club_search_refresh_seconds: float = Field(300.0, gt=0)
+    club_filter_version_check_seconds: float = Field(5.0, ge=0)
+    club_filter_payload_entries: int = Field(1024, ge=1)
+
+    # Insert attempts before giving up when concurrent creates race for a slug
+    slug_insert_attempts: int = Field(3, ge=1)
+
+    # Delta sync of catalog tables (app.db.sync)
+    catalog_sync_overlap_seconds: float = Field(30.0, ge=0)
+    catalog_sync_tombstone_retention_seconds: float = Field(7 * 24 * 3600.0, gt=0)
+
+    # Local catalog snapshot (app.services.catalog_snapshot)
+    snapshot_enabled: bool = False
+    snapshot_path: str = "catalog_snapshot.sqlite3"
+    snapshot_refresh_seconds: float = Field(60.0, gt=0)
+    snapshot_max_staleness_seconds: float = Field(900.0, gt=0)
+    snapshot_poll_seconds: float = Field(1.0, gt=0)
+    snapshot_mmap_bytes: int = Field(256 * 1024 * 1024, ge=0)
+
+    # Response compression: precompressed payloads, then dynamic (per-request) bodies
+    compress_min_bytes: int = Field(1024, ge=0)
+    compress_gzip_level: int = Field(9, ge=1, le=9)
+    compress_brotli_quality: int = Field(11, ge=0, le=11)
+    compress_dynamic_gzip_level: int = Field(6, ge=1, le=9)
+    compress_dynamic_brotli_quality: int = Field(5, ge=0, le=11)
+    compress_thread_min_bytes: int = Field(64 * 1024, ge=0)
+
+    # Cache-Control of public GET routes
+    cache_control_clubs_list: str = "public, max-age=60"
+    cache_control_clubs_detail: str = "public, max-age=60"
+    cache_control_majors_list: str = "public, max-age=300"
+    cache_control_majors_detail: str = "public, max-age=300"
+    cache_control_courses: str = "public, max-age=3600"
+    cache_control_careers: str = "public, max-age=3600"
+
+    # Uploaded images: rendition worker processes and storage Cache-Control max-age
+    rendition_workers: int = Field(2, ge=1)
+    asset_cache_max_age: int = Field(31536000, ge=0)
+
+    # Validate rows from Supabase against the response model before encoding (off: one fewer pass)
+    serialize_validate_rows: bool = False
+
+    # Prometheus metrics endpoint and middleware
+    metrics_enabled: bool = True
+
+    # Request profiling (see app.core.profiling)
+    profile_token: str = ""
+    profile_sample_rate: float = Field(0.0, ge=0, le=1)
+    profile_dir: str = "profiles"
+    profile_interval: float = Field(0.0005, gt=0)
+
+
+class Settings(TuningSettings):
+    """
+    Application settings
+
+    Field names map to upper-case environment variables (supabase_url is
+    SUPABASE_URL). Missing or malformed values fail startup instead of the
+    first request that needs them.
+    """
+
+    # Supabase project (the service role key is only needed by admin routes)
+    supabase_url: str
+    supabase_key: str
+    supabase_service_role_key: Optional[str] = None
+
+    # Pooled httpx client shared by the async Supabase clients
+    supabase_http_max_connections: int = Field(100, ge=1)
+    supabase_http_max_keepalive_connections: int = Field(20, ge=0)
+    supabase_http_keepalive_expiry: float = Field(30.0, gt=0)
+    supabase_http_timeout: float = Field(10.0, gt=0)
+
+    # Startup: open this many pooled connections and preload catalog caches
+    # before reporting ready (0 connections skips the warm-up)
+    startup_warm_connections: int = Field(2, ge=0)
+    startup_preload_caches: bool = True
+    startup_timeout_seconds: float = Field(10.0, gt=0)
+
+    @field_validator("supabase_url")
+    @classmethod
+    def _check_url(cls, value: str) -> str:
+        if not value.startswith(("http://", "https://")):
+            raise ValueError("SUPABASE_URL must start with http:// or https://")
+        return value.rstrip("/")
+
+    @field_validator("supabase_key")
+    @classmethod
+    def _check_key(cls, value: str) -> str:
+        if not value.strip():
+            raise ValueError("SUPABASE_KEY must not be empty")
+        return value
+
+    @field_validator("supabase_service_role_key")
+    @classmethod
+    def _optional_key(cls, value: Optional[str]) -> Optional[str]:
+        # An empty SUPABASE_SERVICE_ROLE_KEY= line means "not set"
+        return value or None
+
+
+@lru_cache
+def get_tuning() -> TuningSettings:
+    """
+    Get the tuning knobs, reading and validating them on first use
+
+    Unlike get_settings(), this needs no Supabase credentials, so modules
+    can call it at import.
+
+    Returns:
+        Shared TuningSettings instance
+
+    Raises:
+        pydantic.ValidationError: If a variable is malformed
+    """
+    return TuningSettings()
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Get the application settings, reading and validating them on first use
+
+    Returns:
+        Shared Settings instance
+
+    Raises:
+        pydantic.ValidationError: If a required variable is missing or invalid
+    """
+    return Settings()
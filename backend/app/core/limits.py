@@ -0,0 +1,72 @@
+"""
+Request Size Limits
+ASGI middleware that caps request bodies before they are fully received
+"""
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class _BodyTooLarge(Exception):
+    """Raised from receive() once the body exceeds the limit"""
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject oversized request bodies on selected routes with 413
+
+    Requests whose Content-Length is over the limit are rejected without
+    reading the body. Chunked bodies are counted as they arrive and cut off
+    as soon as they pass the limit, so an oversized upload never costs its
+    full size in transfer time or memory.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int, path_suffixes: tuple[str, ...]):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_suffixes = path_suffixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].endswith(self.path_suffixes):
+            await self.app(scope, receive, send)
+            return
+
+        too_large = JSONResponse(
+            status_code=413,
+            content={"detail": f"Request body must be ≤ {self.max_bytes} bytes"},
+        )
+
+        declared = dict(scope["headers"]).get(b"content-length")
+        if declared is not None and declared.isdigit() and int(declared) > self.max_bytes:
+            await too_large(scope, receive, send)
+            return
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    exceeded = True
+                    raise _BodyTooLarge()
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if exceeded:
+                # The app turned the aborted body into an error response; send 413 instead
+                if message["type"] == "http.response.start" and not response_started:
+                    response_started = True
+                    await too_large(scope, receive, send)
+                return
+            response_started = message["type"] == "http.response.start" or response_started
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except _BodyTooLarge:
+            if not response_started:
+                await too_large(scope, receive, send)
@@ -0,0 +1,253 @@
+"""
+Metrics
+Prometheus metrics for API routes and Supabase calls, exposed at /metrics
+"""
+import os
+import time
+from typing import Iterator
+
+import httpx
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_tuning
+from app.db.cache import catalog_cache
+from app.db.coalesce import coalescing_stats
+from app.db.sync import catalog_sync, parse_timestamp
+from app.services.catalog_snapshot import catalog_snapshot
+
+# Set METRICS_ENABLED=false to skip recording and serve 404 at /metrics
+METRICS_ENABLED = get_tuning().metrics_enabled
+
+# Set by the production server (gunicorn.conf.py): counters and histograms are
+# kept in files there and summed across worker processes at scrape time
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+# Latency buckets in seconds: cache hits are sub-millisecond, Supabase calls tens of milliseconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Route label for requests that matched no route (keeps label cardinality bounded)
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests handled, by route template and status code",
+    ["method", "route", "status"],
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the end of its response",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_REQUESTS = Counter(
+    "supabase_requests_total",
+    "Requests sent to Supabase, by service, table/RPC/bucket, operation and status class",
+    ["service", "target", "operation", "status"],
+)
+UPSTREAM_LATENCY = Histogram(
+    "supabase_request_duration_seconds",
+    "Time from sending a Supabase request to receiving its response headers",
+    ["service", "target", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# PostgREST operations by HTTP method
+_POSTGREST_OPERATIONS = {
+    "GET": "select", "HEAD": "count", "POST": "insert", "PATCH": "update", "DELETE": "delete"
+}
+
+# Storage operations named in the path (/storage/v1/object/<operation>/<bucket>/...)
+_STORAGE_PATH_OPERATIONS = {
+    "list", "info", "public", "sign", "authenticated", "move", "copy", "upload"
+}
+
+# Storage operations on /storage/v1/object/<bucket>/<path>, by HTTP method
+_STORAGE_OPERATIONS = {
+    "GET": "download", "HEAD": "exists", "POST": "upload", "PUT": "update", "DELETE": "delete"
+}
+
+
+def upstream_labels(request: httpx.Request) -> tuple[str, str, str]:
+    """
+    Label a Supabase request by service, target and operation
+
+    Object paths and filter values are dropped so label cardinality stays
+    bounded by the number of tables, RPCs and buckets.
+
+    Args:
+        request: Outgoing httpx request
+
+    Returns:
+        (service, target, operation), e.g. ("postgrest", "clubs", "select"),
+        ("postgrest", "delete_major_if_unused", "rpc") or ("storage", "club-assets", "list")
+    """
+    parts = request.url.path.strip("/").split("/")
+    method = request.method
+    if len(parts) >= 3 and parts[0] == "rest":
+        if parts[2] == "rpc" and len(parts) >= 4:
+            return "postgrest", parts[3], "rpc"
+        operation = _POSTGREST_OPERATIONS.get(method, method.lower())
+        if method == "POST" and "merge-duplicates" in request.headers.get("prefer", ""):
+            operation = "upsert"
+        return "postgrest", parts[2], operation
+    if len(parts) >= 4 and parts[0] == "storage" and parts[2] == "object":
+        if parts[3] in _STORAGE_PATH_OPERATIONS and len(parts) >= 5:
+            return "storage", parts[4], parts[3]
+        return "storage", parts[3], _STORAGE_OPERATIONS.get(method, method.lower())
+    return (parts[0] if parts[0] else "-"), "-", method.lower()
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that times every request sent through the wrapped transport
+
+    Installed on the pooled client shared by all async Supabase clients,
+    so every table query, RPC and storage call is recorded. Failed requests
+    (timeouts, connection errors) are counted with status "error".
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not METRICS_ENABLED:
+            return await self.transport.handle_async_request(request)
+
+        labels = upstream_labels(request)
+        start = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            UPSTREAM_REQUESTS.labels(*labels, "error").inc()
+            raise
+        UPSTREAM_LATENCY.labels(*labels).observe(time.perf_counter() - start)
+        UPSTREAM_REQUESTS.labels(*labels, f"{response.status_code // 100}xx").inc()
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class MetricsMiddleware:
+    """
+    Record request counts, status codes and latency per route template
+
+    Routes are labelled by their template (e.g. /api/clubs/{club_id}), read
+    from the matched FastAPI route after the request is handled, so IDs in
+    paths do not create new series. Pure ASGI, so the cost per request is
+    two clock reads and two metric updates.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            template = getattr(route, "path", None) or UNMATCHED_ROUTE
+            HTTP_LATENCY.labels(scope["method"], template).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(scope["method"], template, str(status)).inc()
+
+
+class CatalogCollector(Collector):
+    """Export catalog cache, request coalescing, snapshot and delta sync stats at scrape time"""
+
+    def collect(self) -> Iterator:
+        cache = catalog_cache.stats()
+        for name in ("hits", "misses", "evictions"):
+            yield CounterMetricFamily(
+                f"catalog_cache_{name}", f"Catalog cache {name}", value=cache[name]
+            )
+        yield GaugeMetricFamily(
+            "catalog_cache_entries", "Entries in the catalog cache", value=cache["entries"]
+        )
+        yield GaugeMetricFamily(
+            "catalog_cache_bytes", "Approximate catalog cache size", value=cache["bytes"]
+        )
+
+        stats = coalescing_stats()
+        calls = CounterMetricFamily(
+            "coalesced_calls", "Reads and by-ID loads requested, by coalescer", labels=["coalescer"]
+        )
+        collapsed = CounterMetricFamily(
+            "coalesced_collapsed",
+            "Reads and loads that joined a call already in flight",
+            labels=["coalescer"],
+        )
+        for name, values in stats.items():
+            calls.add_metric([name], values.get("calls", values.get("loads", 0)))
+            collapsed.add_metric([name], values["collapsed"])
+        yield calls
+        yield collapsed
+
+        snapshot = catalog_snapshot.stats()
+        if snapshot["enabled"] and snapshot["age_seconds"] is not None:
+            yield GaugeMetricFamily(
+                "catalog_snapshot_age_seconds", "Seconds since the catalog snapshot was synced",
+                value=snapshot["age_seconds"],
+            )
+
+        sync = catalog_sync.stats()
+        if sync["lag_seconds"] is not None:
+            yield GaugeMetricFamily(
+                "catalog_sync_lag_seconds",
+                "Seconds since the last completed catalog delta sync began",
+                value=sync["lag_seconds"],
+            )
+            watermarks = GaugeMetricFamily(
+                "catalog_sync_watermark_seconds",
+                "Latest change (Unix time) mirrored per table",
+                labels=["table"],
+            )
+            for table, watermark in sync["watermarks"].items():
+                if watermark is not None:
+                    watermarks.add_metric([table], parse_timestamp(watermark).timestamp())
+            yield watermarks
+
+
+_catalog_collector = CatalogCollector()
+REGISTRY.register(_catalog_collector)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Render every registered metric in the Prometheus text format
+
+    Under the multi-process server, request and Supabase metrics cover every
+    worker; catalog gauges and counters are those of the worker answering.
+
+    Returns:
+        (body, content type)
+    """
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(_catalog_collector)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,204 @@
+"""
+Request Profiling
+Opt-in per-request profiling with dumps and a time breakdown written to a local directory
+"""
+import asyncio
+import cProfile
+import hmac
+import json
+import os
+import pstats
+import random
+import re
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_tuning
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import SpeedscopeRenderer
+except ImportError:  # pragma: no cover - optional, cProfile is used without it
+    Profiler = None
+
+
+# Requests carrying `X-Profile: <PROFILE_TOKEN>` are profiled (disabled when unset)
+PROFILE_TOKEN = get_tuning().profile_token
+PROFILE_HEADER = b"x-profile"
+
+# Fraction of all requests profiled at random (0 disables sampling)
+PROFILE_SAMPLE_RATE = get_tuning().profile_sample_rate
+
+# Where dumps are written
+PROFILE_DIR = get_tuning().profile_dir
+
+# pyinstrument sampling interval in seconds
+PROFILE_INTERVAL = get_tuning().profile_interval
+
+# Time categories, matched against the file of the innermost frame that matches
+# any of them; everything else is "other"
+CATEGORIES = {
+    "validation": ("/pydantic/", "/pydantic_core/"),
+    "json_encoding": (
+        "/orjson", "/json/", "/app/utils/serialization.py", "/app/utils/compression.py",
+    ),
+    "supabase_io": (
+        "/httpx/", "/httpcore/", "/h11/", "/h2/",
+        "/postgrest/", "/storage3/", "/supabase/", "/ssl.py",
+    ),
+}
+
+
+def profiling_enabled() -> bool:
+    """Whether any trigger (token header or sampling) is configured"""
+    return bool(PROFILE_TOKEN) or PROFILE_SAMPLE_RATE > 0
+
+
+def categorize(file_path: Optional[str]) -> Optional[str]:
+    """Time category of a source file, or None if it is not in one"""
+    if not file_path:
+        return None
+    path = file_path.replace("\\", "/")
+    for category, markers in CATEGORIES.items():
+        if any(marker in path for marker in markers):
+            return category
+    return None
+
+
+def _breakdown_pyinstrument(frame, category: str = "other", totals: Optional[dict] = None) -> dict:
+    """Sum leaf times of a pyinstrument frame tree by innermost category (await time included)"""
+    if totals is None:
+        totals = {}
+    category = categorize(frame.file_path) or category
+    if not frame.children:
+        totals[category] = totals.get(category, 0.0) + frame.time
+    for child in frame.children:
+        _breakdown_pyinstrument(child, category, totals)
+    return totals
+
+
+def _breakdown_cprofile(stats: pstats.Stats) -> dict:
+    """Sum per-function self time by category (CPU time only; awaits are not measured)"""
+    totals: dict[str, float] = {}
+    for (file_path, _, _), (_, _, self_time, _, _) in stats.stats.items():
+        category = categorize(file_path) or "other"
+        totals[category] = totals.get(category, 0.0) + self_time
+    return totals
+
+
+def _slug(route: str) -> str:
+    """File-name-safe form of a route template"""
+    return re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+
+
+def _write_dump(directory: str, stem: str, dump, extension: str, summary: dict) -> None:
+    """Write a dump (bytes or pstats.Stats) and its summary"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{stem}.{extension}")
+    if isinstance(dump, pstats.Stats):
+        dump.dump_stats(path)
+    else:
+        with open(path, "wb") as f:
+            f.write(dump)
+    with open(os.path.join(directory, f"{stem}.summary.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+
+class ProfilingMiddleware:
+    """
+    Profile selected requests and write a dump plus a time breakdown
+
+    A request is profiled when it sends `X-Profile: <PROFILE_TOKEN>` or is
+    picked by PROFILE_SAMPLE_RATE. With pyinstrument installed it is
+    sampled (async-aware, so time awaiting Supabase is attributed to the
+    awaiting call) and written as a speedscope flamegraph; otherwise
+    cProfile writes a pstats file. Files are named
+    `<id>_<method>_<route>_<duration>ms`, and the id is returned in an
+    `X-Profile-Id` response header. Next to each dump, `.summary.json`
+    gives the route, status, duration and the time split across Pydantic
+    validation, JSON encoding, Supabase I/O and everything else.
+
+    Only one request is profiled at a time per process; others run
+    unprofiled. Add the middleware only when profiling_enabled(), so
+    untriggered requests pay nothing beyond a header lookup.
+    """
+
+    def __init__(self, app: ASGIApp, directory: str = PROFILE_DIR):
+        self.app = app
+        self.directory = directory
+        self._busy = False
+
+    def _triggered(self, scope: Scope) -> bool:
+        if PROFILE_TOKEN:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return hmac.compare_digest(value.decode("latin-1"), PROFILE_TOKEN)
+        return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._busy or not self._triggered(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self._busy = True
+        profile_id = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S%f}-{os.getpid()}"
+        status = 500
+
+        async def send_with_id(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+            await send(message)
+
+        if Profiler is not None:
+            profiler = Profiler(interval=PROFILE_INTERVAL, async_mode="enabled")
+            profiler.start()
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            duration = time.perf_counter() - start
+            if Profiler is not None:
+                profiler.stop()
+            else:
+                profiler.disable()
+            self._busy = False
+            await self._save(profiler, profile_id, scope, status, duration)
+
+    async def _save(
+        self, profiler, profile_id: str, scope: Scope, status: int, duration: float
+    ) -> None:
+        route = getattr(scope.get("route"), "path", None) or scope["path"]
+        if Profiler is not None:
+            root = profiler.last_session.root_frame()
+            breakdown = _breakdown_pyinstrument(root) if root is not None else {}
+            dump = profiler.output(SpeedscopeRenderer()).encode()
+            extension, kind = "speedscope.json", "pyinstrument"
+        else:
+            dump = pstats.Stats(profiler)
+            breakdown = _breakdown_cprofile(dump)
+            extension, kind = "pstats", "cprofile"
+
+        stem = f"{profile_id}_{scope['method']}_{_slug(route)}_{duration * 1000:.0f}ms"
+        summary = {
+            "id": profile_id,
+            "method": scope["method"],
+            "route": route,
+            "path": scope["path"],
+            "status": status,
+            "duration_ms": round(duration * 1000, 3),
+            "profiler": kind,
+            "breakdown_ms": {
+                name: round(seconds * 1000, 3) for name, seconds in sorted(breakdown.items())
+            },
+            "dump": f"{stem}.{extension}",
+        }
+        await asyncio.to_thread(_write_dump, self.directory, stem, dump, extension, summary)
@@ -0,0 +1,79 @@
+"""
+Startup
+Readiness state and per-phase timings for the application lifespan
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+
+class StartupState:
+    """
+    Tracks startup phases and whether the app is ready for traffic
+
+    Liveness only means the process answers; readiness is set once every
+    startup phase has run and cleared again when shutdown begins. Phases
+    marked optional (warm-ups) record their error instead of failing startup.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.phases: dict[str, float] = {}
+        self.errors: dict[str, str] = {}
+        self.started_at = time.perf_counter()
+        self.ready_after: Optional[float] = None
+
+    @contextmanager
+    def phase(self, name: str, optional: bool = False) -> Iterator[None]:
+        """
+        Time one startup phase
+
+        Args:
+            name: Phase name reported under phases_ms
+            optional: If True, an exception is recorded and startup continues
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            if not optional:
+                raise
+            self.errors[name] = f"{type(e).__name__}: {str(e)}"
+        finally:
+            self.phases[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    def mark_ready(self) -> None:
+        """Startup finished; accept traffic"""
+        self.ready = True
+        self.ready_after = round((time.perf_counter() - self.started_at) * 1000, 1)
+
+    def mark_stopping(self) -> None:
+        """Shutdown began; stop accepting new traffic"""
+        self.ready = False
+
+    def summary(self) -> str:
+        """One-line startup report"""
+        phases = ", ".join(f"{name} {ms:.1f}ms" for name, ms in self.phases.items())
+        line = f"Startup ready in {self.ready_after:.1f}ms ({phases})"
+        if self.errors:
+            line += "; warm-up errors: " + "; ".join(f"{k}: {v}" for k, v in self.errors.items())
+        return line
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get startup status
+
+        Returns:
+            Dictionary with ready, total time to ready (ms since the module
+            was imported), time per phase and warm-up errors
+        """
+        return {
+            "ready": self.ready,
+            "ready_after_ms": self.ready_after,
+            "phases_ms": dict(self.phases),
+            "errors": dict(self.errors),
+        }
+
+
+# Shared startup state (process-wide)
+startup_state = StartupState()
@@ -0,0 +1,178 @@
+"""
+Catalog Cache
+In-process read-through cache for club and major catalog reads
+"""
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from app.core.config import get_tuning
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory cost of a cached value
+
+    Encoded payloads count their body length; other values use the length
+    of their JSON encoding, which tracks the size of row dictionaries closely
+    enough to enforce a memory bound.
+
+    Args:
+        value: Encoded payload, bytes, or JSON-compatible value
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    body = getattr(value, "body", None)
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return len(json.dumps(value, default=str))
+
+
+class TTLCache:
+    """
+    LRU cache with per-entry TTL and a max-memory bound
+
+    Keys are tuples whose first element is a namespace (e.g. "clubs"), so a
+    whole namespace can be invalidated at once after a write. Each namespace
+    has a generation counter; loads that started before an invalidation are
+    not stored, so a slow read can never re-insert stale rows.
+
+    The cache is per process. Writes made through other workers or directly
+    against Supabase become visible once the TTL expires.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, max_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[float, int, Any]] = OrderedDict()
+        self._generations: dict[Hashable, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def generation(self, namespace: Hashable) -> int:
+        """Return the current generation of a namespace (bumped on invalidation)"""
+        return self._generations.get(namespace, 0)
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key tuple, first element is the namespace
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, _, value = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: tuple, value: Any, size: Optional[int] = None) -> None:
+        """
+        Store a value, evicting least recently used entries to stay within bounds
+
+        Args:
+            key: Cache key tuple, first element is the namespace
+            value: Value to cache
+            size: Size in bytes (estimated from the value if not provided)
+        """
+        if size is None:
+            size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, size, value)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    async def get_or_load(self, key: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Read-through lookup: return the cached value or load and cache it
+
+        Args:
+            key: Cache key tuple, first element is the namespace
+            loader: Coroutine function that fetches the value on a miss
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        generation = self.generation(key[0])
+        value = await loader()
+        if self.generation(key[0]) == generation:
+            self.set(key, value)
+        return value
+
+    def invalidate(self, namespace: Hashable) -> None:
+        """
+        Drop every entry in a namespace
+
+        Args:
+            namespace: First element of the keys to drop (e.g. "clubs")
+        """
+        self._generations[namespace] = self.generation(namespace) + 1
+        for key in [k for k in self._entries if k[0] == namespace]:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        for namespace in {k[0] for k in self._entries}:
+            self.invalidate(namespace)
+
+    def stats(self) -> dict:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hits, misses, evictions, entries and bytes
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _remove(self, key: tuple) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+# Shared cache for public catalog reads (clubs, majors)
+catalog_cache = TTLCache(
+    ttl_seconds=get_tuning().catalog_cache_ttl_seconds,
+    max_entries=get_tuning().catalog_cache_max_entries,
+    max_bytes=get_tuning().catalog_cache_max_bytes,
+)
@@ -2,48 +2,58 @@
 Supabase Database Client
 Handles database connections and queries
 """
-import os
-from supabase import create_client, Client
+import asyncio
 from typing import Optional
 
+import httpx
+from supabase import AsyncClient, AsyncClientOptions, Client, acreate_client, create_client
 
-def get_supabase_client(use_service_role: bool = False) -> Client:
+from app.core.config import get_settings
+from app.core.metrics import InstrumentedTransport
+
+
+def _get_credentials(use_service_role: bool = False) -> tuple[str, str]:
     """
-    Create and return a Supabase client instance
+    Read Supabase URL and key from the application settings
     
     Args:
-        use_service_role: If True, use service_role key (bypasses RLS).
-                         If False, use anon key (subject to RLS).
+        use_service_role: If True, read the service_role key instead of the anon key
     
     Returns:
-        Supabase client configured with environment variables
+        Tuple of (supabase_url, supabase_key)
         
     Raises:
         ValueError: If required environment variables are missing
     """
-    supabase_url = os.getenv("SUPABASE_URL")
+    settings = get_settings()
     
     if use_service_role:
         # Use service role key for admin operations (bypasses RLS)
-        supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-        if not supabase_key:
+        if not settings.supabase_service_role_key:
             raise ValueError(
                 "Missing SUPABASE_SERVICE_ROLE_KEY. Required for admin operations."
             )
-    else:
-        # Use anon key for public operations (subject to RLS)
-        supabase_key = os.getenv("SUPABASE_KEY")
+        return settings.supabase_url, settings.supabase_service_role_key
     
-    if not supabase_url or not supabase_key:
-        if use_service_role:
-            raise ValueError(
-                "Missing Supabase credentials. Set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY environment variables."
-            )
-        else:
-            raise ValueError(
-                "Missing Supabase credentials. Set SUPABASE_URL and SUPABASE_KEY environment variables."
-            )
+    # Use anon key for public operations (subject to RLS)
+    return settings.supabase_url, settings.supabase_key
+
+
+def get_supabase_client(use_service_role: bool = False) -> Client:
+    """
+    Create and return a Supabase client instance
+    
+    Args:
+        use_service_role: If True, use service_role key (bypasses RLS).
+                         If False, use anon key (subject to RLS).
     
+    Returns:
+        Supabase client configured with environment variables
+        
+    Raises:
+        ValueError: If required environment variables are missing
+    """
+    supabase_url, supabase_key = _get_credentials(use_service_role)
     return create_client(supabase_url, supabase_key)
 
 
@@ -74,3 +84,125 @@ def get_db(admin: bool = False) -> Client:
             _supabase_client = get_supabase_client(use_service_role=False)
         return _supabase_client
 
+
+# Async singleton instances (share one pooled httpx client)
+_http_client: Optional[httpx.AsyncClient] = None
+_async_supabase_client: Optional[AsyncClient] = None
+_async_admin_client: Optional[AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the pooled httpx client shared by all async Supabase clients
+    
+    Keep-alive connections are reused across requests, so PostgREST and Storage
+    calls do not pay for TLS and connection setup each time. Pool limits are
+    tunable with the SUPABASE_HTTP_* environment variables. Every request is
+    timed by InstrumentedTransport and reported at /metrics.
+    
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _http_client
+    
+    if _http_client is None:
+        settings = get_settings()
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=settings.supabase_http_max_connections,
+                max_keepalive_connections=settings.supabase_http_max_keepalive_connections,
+                keepalive_expiry=settings.supabase_http_keepalive_expiry,
+            ),
+        )
+        _http_client = httpx.AsyncClient(
+            transport=InstrumentedTransport(transport),
+            timeout=httpx.Timeout(settings.supabase_http_timeout),
+            follow_redirects=True,
+        )
+    return _http_client
+
+
+async def get_async_supabase_client(use_service_role: bool = False) -> AsyncClient:
+    """
+    Create and return an async Supabase client instance
+    
+    Args:
+        use_service_role: If True, use service_role key (bypasses RLS).
+                         If False, use anon key (subject to RLS).
+    
+    Returns:
+        Async Supabase client backed by the shared pooled httpx client
+        
+    Raises:
+        ValueError: If required environment variables are missing
+    """
+    supabase_url, supabase_key = _get_credentials(use_service_role)
+    options = AsyncClientOptions(httpx_client=get_http_client())
+    return await acreate_client(supabase_url, supabase_key, options=options)
+
+
+async def get_async_db(admin: bool = False) -> AsyncClient:
+    """
+    Get or create async Supabase client singleton
+    
+    Queries made through this client are awaited, so they do not block the
+    event loop while waiting on Supabase.
+    
+    Args:
+        admin: If True, returns client with service_role key (bypasses RLS).
+               If False, returns client with anon key (subject to RLS).
+    
+    Returns:
+        Async Supabase client instance
+    """
+    global _async_supabase_client, _async_admin_client
+    
+    if admin:
+        if _async_admin_client is None:
+            _async_admin_client = await get_async_supabase_client(use_service_role=True)
+        return _async_admin_client
+    else:
+        if _async_supabase_client is None:
+            _async_supabase_client = await get_async_supabase_client(use_service_role=False)
+        return _async_supabase_client
+
+
+async def get_async_admin_db() -> AsyncClient:
+    """
+    Get async Supabase client with service_role key (bypasses RLS)
+    
+    Use as a FastAPI dependency for admin operations.
+    
+    Returns:
+        Async admin Supabase client instance
+    """
+    return await get_async_db(admin=True)
+
+
+async def warm_up(connections: int) -> None:
+    """
+    Create the async client singletons and open pooled connections ahead of traffic
+    
+    Runs `connections` trivial reads concurrently, so the first requests find
+    keep-alive connections with TLS already negotiated.
+    
+    Args:
+        connections: Number of connections to open (0 only creates the clients)
+    """
+    db = await get_async_db()
+    if get_settings().supabase_service_role_key:
+        await get_async_db(admin=True)
+    await asyncio.gather(
+        *(db.table("majors").select("id").limit(1).execute() for _ in range(connections))
+    )
+
+
+async def close_async_clients() -> None:
+    """Close the pooled httpx client and drop async client singletons"""
+    global _http_client, _async_supabase_client, _async_admin_client
+    
+    _async_supabase_client = None
+    _async_admin_client = None
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
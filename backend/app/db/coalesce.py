@@ -0,0 +1,290 @@
+"""
+Request Coalescing
+Single-flight sharing of identical in-flight Supabase reads and DataLoader-style by-ID batching
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from postgrest import APIResponse
+
+from app.db.cache import catalog_cache
+
+# Request headers that change what PostgREST returns (role, representation)
+_KEY_HEADERS = ("authorization", "apikey", "accept", "accept-profile", "prefer", "range")
+
+
+class SingleFlight:
+    """
+    Share one in-flight call among concurrent callers with the same key
+
+    The first caller (the leader) runs the call; callers arriving before it
+    finishes await the same future and get the same result or exception.
+    Nothing is kept once the call completes, so this never serves stale
+    data; it only collapses duplicate work that is already in progress.
+    Results are shared objects and must be treated as read-only.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.collapsed = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call, or join the identical call already in flight
+
+        Args:
+            key: Identity of the call (equal keys must return equal results)
+            call: Coroutine function doing the upstream work
+
+        Returns:
+            The call's result
+        """
+        self.calls += 1
+        future = self._inflight.get(key)
+        if future is not None:
+            self.collapsed += 1
+            # Shielded so one cancelled caller does not cancel the shared call
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(call())
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict:
+        """
+        Get coalescing counters
+
+        Returns:
+            Dictionary with calls, upstream calls, collapsed calls and in-flight keys
+        """
+        return {
+            "calls": self.calls,
+            "upstream": self.calls - self.collapsed,
+            "collapsed": self.collapsed,
+            "inflight": len(self._inflight),
+        }
+
+
+class BatchLoader:
+    """
+    DataLoader-style batching of by-key lookups
+
+    load() calls made during one event-loop tick are collected and resolved
+    by a single fetch (e.g. one `in_("id", [...])` query). Keys already being
+    fetched, in this batch or in one still in flight, join that fetch
+    instead of asking again. Batches are kept per Supabase client so anon
+    and service-role reads are never mixed, and a fetch is only joined while
+    `version()` is unchanged, so a lookup made after a write never receives
+    a row read before it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Callable[[Any, list], Awaitable[dict]],
+        max_batch_size: int = 100,
+        version: Callable[[], Hashable] = lambda: 0,
+    ):
+        """
+        Args:
+            name: Name reported in stats
+            fetch: Coroutine taking (client, keys) and returning {key: value}
+                   (keys missing from the result resolve to None)
+            max_batch_size: Most keys per fetch; larger batches are split
+            version: Returns the data version (e.g. a cache generation bumped on writes)
+        """
+        self.name = name
+        self.fetch = fetch
+        self.max_batch_size = max_batch_size
+        self.version = version
+        self._pending: dict[int, tuple[Any, dict[Hashable, asyncio.Future]]] = {}
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.loads = 0
+        self.collapsed = 0
+        self.batches = 0
+        self.batched_keys = 0
+
+    async def load(self, client: Any, key: Hashable) -> Optional[Any]:
+        """
+        Look up one key, batched with other lookups in the same tick
+
+        Args:
+            client: Supabase client to fetch with
+            key: Key to look up (e.g. a row ID)
+
+        Returns:
+            The value for the key, or None if it does not exist
+        """
+        self.loads += 1
+        inflight_key = (id(client), self.version(), key)
+        future = self._inflight.get(inflight_key)
+        if future is None:
+            future = self._schedule(client, inflight_key)
+        else:
+            self.collapsed += 1
+        return await asyncio.shield(future)
+
+    def _schedule(self, client: Any, inflight_key: tuple) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(id(client))
+        if batch is None:
+            batch = self._pending[id(client)] = (client, {})
+            loop.call_soon(self._dispatch, id(client))
+
+        future = loop.create_future()
+        batch[1][inflight_key] = future
+        self._inflight[inflight_key] = future
+        return future
+
+    def _dispatch(self, client_id: int) -> None:
+        client, futures = self._pending.pop(client_id)
+        keys = list(futures)
+        for start in range(0, len(keys), self.max_batch_size):
+            chunk = {key: futures[key] for key in keys[start:start + self.max_batch_size]}
+            task = asyncio.ensure_future(self._run(client, chunk))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, client: Any, futures: dict[tuple, asyncio.Future]) -> None:
+        self.batches += 1
+        self.batched_keys += len(futures)
+        try:
+            values = await self.fetch(client, list({key for _, _, key in futures}))
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Mark retrieved so a batch nobody awaits anymore does not warn
+                    future.exception()
+        else:
+            for (_, _, key), future in futures.items():
+                if not future.done():
+                    future.set_result(values.get(key))
+        finally:
+            for inflight_key in futures:
+                self._inflight.pop(inflight_key, None)
+
+    def stats(self) -> dict:
+        """
+        Get batching counters
+
+        Returns:
+            Dictionary with loads, collapsed loads, batches and mean batch size
+        """
+        return {
+            "loads": self.loads,
+            "collapsed": self.collapsed,
+            "batches": self.batches,
+            "mean_batch_size": round(self.batched_keys / self.batches, 2) if self.batches else 0.0,
+        }
+
+
+def request_key(query: Any) -> Optional[tuple]:
+    """
+    Identity of a PostgREST request builder
+
+    The key covers the method, path, query string and the headers that
+    change the response, plus the catalog_cache generation of the table's
+    namespace: catalog writes invalidate that namespace, so reads started
+    after a write never join one started before it.
+
+    Args:
+        query: postgrest request builder, e.g. db.table("clubs").select("*")
+
+    Returns:
+        Hashable key, or None if the request is not a read
+    """
+    request = getattr(query, "request", None)
+    if request is None or request.http_method not in ("GET", "HEAD"):
+        return None
+    table = str(request.path).rsplit("/", 1)[-1]
+    headers = tuple((name, request.headers.get(name)) for name in _KEY_HEADERS)
+    return (
+        catalog_cache.generation(table),
+        request.http_method,
+        str(request.path),
+        str(request.params),
+        headers,
+    )
+
+
+# Identical PostgREST reads in flight at the same time
+reads = SingleFlight("postgrest")
+
+
+async def execute(query: Any) -> APIResponse:
+    """
+    Execute a PostgREST query, sharing identical reads already in flight
+
+    Writes (and builders whose request cannot be inspected) are executed
+    directly.
+
+    Args:
+        query: postgrest request builder
+
+    Returns:
+        Query response (shared with concurrent identical reads; do not mutate)
+    """
+    key = request_key(query)
+    if key is None:
+        return await query.execute()
+    return await reads.do(key, query.execute)
+
+
+_loaders: list[BatchLoader] = []
+
+
+def register_loader(loader: BatchLoader) -> BatchLoader:
+    """Include a batch loader in coalescing_stats()"""
+    _loaders.append(loader)
+    return loader
+
+
+def by_id_loader(
+    table: str, columns: str = "*", key_column: str = "id", max_batch_size: int = 100
+) -> BatchLoader:
+    """
+    Create a registered loader that fetches rows of a table by key in one `in_` query per tick
+
+    Keys must be in the form the database returns them (e.g. lowercase
+    UUID strings); validate them first, since one malformed key fails the
+    whole batch.
+
+    Args:
+        table: Table name
+        columns: Columns to select
+        key_column: Unique column the keys refer to
+        max_batch_size: Most keys per query
+
+    Returns:
+        BatchLoader whose values are row dictionaries
+    """
+    async def fetch(client: Any, keys: list) -> dict:
+        query = client.table(table).select(columns).in_(key_column, keys)
+        response = await execute(query)
+        return {str(row[key_column]): row for row in response.data}
+
+    return register_loader(BatchLoader(
+        f"{table}.{key_column}",
+        fetch,
+        max_batch_size,
+        version=lambda: catalog_cache.generation(table),
+    ))
+
+
+def coalescing_stats() -> dict:
+    """
+    Get counters for shared reads and every registered batch loader
+
+    Returns:
+        Dictionary with "reads" and one entry per loader name
+    """
+    stats = {"reads": reads.stats()}
+    for loader in _loaders:
+        stats[loader.name] = loader.stats()
+    return stats
+
@@ -0,0 +1,354 @@
+"""
+Delta Sync
+Incremental in-memory mirrors of catalog tables, refreshed by change timestamp and delete tombstones
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
+
+from supabase import AsyncClient
+
+from app.core.config import get_tuning
+from app.utils.pagination import keyset_filter
+
+# Column every mirrored table keeps current on insert and update (set_updated_at trigger)
+CHANGE_COLUMN = "updated_at"
+
+# Deleted row keys, written by the record_catalog_tombstone triggers
+TOMBSTONE_TABLE = "catalog_tombstones"
+
+# Rows per request (PostgREST caps responses at its max-rows setting)
+SYNC_PAGE_SIZE = 1000
+
+# Changes stamped this long before the previous refresh began are re-read, since
+# a transaction can commit after a later-stamped one was already read (and app
+# and database clocks may differ); must exceed both. Re-reads are idempotent
+SYNC_OVERLAP_SECONDS = get_tuning().catalog_sync_overlap_seconds
+
+# Tombstones are assumed kept this long (see prune_catalog_tombstones); a mirror
+# last refreshed longer ago than this is reloaded in full
+TOMBSTONE_RETENTION_SECONDS = get_tuning().catalog_sync_tombstone_retention_seconds
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse a PostgREST timestamptz (naive values are taken as UTC)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def format_timestamp(value: datetime) -> str:
+    """Format a timestamp for a PostgREST filter (always with microseconds)"""
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+class TableMirror:
+    """
+    In-memory copy of one table, keyed by its primary key columns
+
+    Each key remembers when it last changed (its row's updated_at, or the
+    tombstone's deleted_at), so changes re-read inside the overlap window or
+    delivered out of order never replace a newer state with an older one.
+    """
+
+    def __init__(self, name: str, key_columns: tuple[str, ...], columns: str = "*"):
+        self.name = name
+        self.key_columns = key_columns
+        self.columns = columns
+        self.rows: dict[tuple, dict] = {}
+        self.watermark: Optional[datetime] = None
+        self._changed_at: dict[tuple, tuple[datetime, bool]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def key(self, row: dict) -> tuple:
+        """Primary key of a row (or of a tombstone's row_key)"""
+        return tuple(str(row[column]) for column in self.key_columns)
+
+    def reset(self, rows: Iterable[dict], watermark: Optional[datetime] = None) -> None:
+        """
+        Replace the whole mirror
+
+        Args:
+            rows: Every row of the table
+            watermark: Latest change already reflected (default: newest updated_at in rows)
+        """
+        self.rows = {}
+        self._changed_at = {}
+        self.watermark = None
+        self.apply_rows(rows)
+        if watermark is not None:
+            self.watermark = watermark
+
+    def apply_rows(self, rows: Iterable[dict]) -> int:
+        """
+        Upsert inserted or updated rows
+
+        Returns:
+            Number of rows whose content changed
+        """
+        changes = 0
+        for row in rows:
+            key = self.key(row)
+            changed_at = parse_timestamp(row.get(CHANGE_COLUMN))
+            if changed_at is not None:
+                seen = self._changed_at.get(key)
+                # Skip stale re-reads, and rows stamped the same instant as their delete
+                newer = seen is not None and seen[0] > changed_at
+                if newer or (seen is not None and seen[0] == changed_at and seen[1]):
+                    continue
+                self._changed_at[key] = (changed_at, False)
+                if self.watermark is None or changed_at > self.watermark:
+                    self.watermark = changed_at
+            if self.rows.get(key) != row:
+                self.rows[key] = row
+                changes += 1
+        return changes
+
+    def apply_tombstone(self, row_key: dict, deleted_at: datetime) -> int:
+        """
+        Remove a deleted row, unless it was re-created afterwards
+
+        Returns:
+            1 if a row was removed, otherwise 0
+        """
+        key = self.key(row_key)
+        seen = self._changed_at.get(key)
+        if seen is not None and seen[0] > deleted_at:
+            return 0
+        self._changed_at[key] = (deleted_at, True)
+        return 1 if self.rows.pop(key, None) is not None else 0
+
+    def forget_tombstones(self, before: datetime) -> None:
+        """Drop delete markers older than any change that can still be re-read"""
+        self._changed_at = {
+            key: seen for key, seen in self._changed_at.items() if not seen[1] or seen[0] >= before
+        }
+
+
+async def fetch_all(
+    db: AsyncClient,
+    table: str,
+    columns: str,
+    order: Iterable[str],
+    since: Optional[tuple[str, datetime]] = None,
+) -> list[dict]:
+    """
+    Read rows of a table page by page
+
+    Pages follow each other by keyset on the order columns rather than by
+    offset, so rows deleted or inserted during the read do not shift a
+    page boundary and make it skip rows.
+
+    Args:
+        db: Supabase client
+        table: Table name
+        columns: Columns to select (must include the order columns)
+        order: Columns giving a stable order (the last ones unique, e.g. the key)
+        since: Optional (column, timestamp): only rows with column > timestamp
+
+    Returns:
+        Matching rows
+    """
+    order = list(order)
+    rows: list[dict] = []
+    while True:
+        query = db.table(table).select(columns)
+        if since is not None:
+            query = query.gt(since[0], format_timestamp(since[1]))
+        if rows:
+            query = query.or_(keyset_filter(order, [rows[-1][column] for column in order]))
+        for column in order:
+            query = query.order(column, desc=False)
+        response = await query.limit(SYNC_PAGE_SIZE).execute()
+        rows.extend(response.data)
+        if len(response.data) < SYNC_PAGE_SIZE:
+            return rows
+
+
+class DeltaSync:
+    """
+    Keep table mirrors current by fetching only what changed
+
+    The first refresh loads every table in full. Later refreshes read rows
+    whose updated_at is past each table's watermark and tombstones past the
+    tombstone watermark, so their cost follows the number of changes rather
+    than the table size. Anything stamped within the overlap window before
+    the previous refresh began is read again, in case its transaction had
+    not committed yet. A full reload happens again when the last refresh is
+    older than the tombstone retention.
+    """
+
+    def __init__(
+        self,
+        mirrors: Iterable[TableMirror],
+        overlap_seconds: float = SYNC_OVERLAP_SECONDS,
+        retention_seconds: float = TOMBSTONE_RETENTION_SECONDS,
+    ):
+        self.mirrors = {mirror.name: mirror for mirror in mirrors}
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.retention_seconds = retention_seconds
+        self.tombstone_watermark: Optional[datetime] = None
+        self.loaded = False
+        self.last_refresh_at: Optional[float] = None
+        self.last_changes = 0
+        self.refreshes = 0
+        self.full_loads = 0
+        self._lock = asyncio.Lock()
+
+    def tables(self) -> dict[str, list[dict]]:
+        """Current rows of every mirror"""
+        return {name: list(mirror.rows.values()) for name, mirror in self.mirrors.items()}
+
+    async def refresh(self, db: AsyncClient) -> int:
+        """
+        Bring every mirror up to date
+
+        Concurrent callers wait for a single refresh.
+
+        Args:
+            db: Supabase client
+
+        Returns:
+            Number of rows inserted, changed or deleted (every row on a full load)
+        """
+        async with self._lock:
+            started = time.time()
+            stale = (
+                self.last_refresh_at is not None
+                and started - self.last_refresh_at > self.retention_seconds
+            )
+            if not self.loaded or stale:
+                changes = await self._load_all(db)
+                self.full_loads += 1
+            else:
+                changes = await self._load_changes(db, started)
+            self.loaded = True
+            self.last_refresh_at = started
+            self.last_changes = changes
+            self.refreshes += 1
+            return changes
+
+    async def _latest_tombstone(self, db: AsyncClient) -> Optional[datetime]:
+        query = db.table(TOMBSTONE_TABLE).select("deleted_at").order("deleted_at", desc=True)
+        response = await query.limit(1).execute()
+        return parse_timestamp(response.data[0]["deleted_at"]) if response.data else None
+
+    async def _load_all(self, db: AsyncClient) -> int:
+        # Read the tombstone high mark first, so deletes made while tables
+        # are being read are applied by the next refresh
+        tombstone_watermark = await self._latest_tombstone(db)
+        mirrors = list(self.mirrors.values())
+        results = await asyncio.gather(
+            *(fetch_all(db, m.name, m.columns, m.key_columns) for m in mirrors)
+        )
+        for mirror, rows in zip(mirrors, results):
+            mirror.reset(rows)
+        self.tombstone_watermark = tombstone_watermark
+        return sum(len(rows) for rows in results)
+
+    def _since(self, watermark: Optional[datetime], refresh_at: float) -> Optional[datetime]:
+        """Lower bound of the changes to read after a refresh that began at refresh_at"""
+        if watermark is None:
+            return None
+        return min(watermark, datetime.fromtimestamp(refresh_at, timezone.utc) - self.overlap)
+
+    async def _load_changes(self, db: AsyncClient, started: float) -> int:
+        mirrors = list(self.mirrors.values())
+        row_reads = []
+        for m in mirrors:
+            since = self._since(m.watermark, self.last_refresh_at)
+            row_reads.append(fetch_all(
+                db, m.name, m.columns, (CHANGE_COLUMN, *m.key_columns),
+                since=(CHANGE_COLUMN, since) if since is not None else None,
+            ))
+        since = self._since(self.tombstone_watermark, self.last_refresh_at)
+        tombstone_read = fetch_all(
+            db, TOMBSTONE_TABLE, "table_name,row_key,deleted_at", ("deleted_at", "id"),
+            since=("deleted_at", since) if since is not None else None,
+        )
+        *results, tombstones = await asyncio.gather(*row_reads, tombstone_read)
+
+        changes = 0
+        for mirror, rows in zip(mirrors, results):
+            changes += mirror.apply_rows(rows)
+        for tombstone in tombstones:
+            deleted_at = parse_timestamp(tombstone["deleted_at"])
+            mirror = self.mirrors.get(tombstone["table_name"])
+            if mirror is not None:
+                changes += mirror.apply_tombstone(tombstone["row_key"], deleted_at)
+            if self.tombstone_watermark is None or deleted_at > self.tombstone_watermark:
+                self.tombstone_watermark = deleted_at
+
+        # Markers older than what the next refresh can re-read protect nothing
+        for mirror in mirrors:
+            since = self._since(mirror.watermark, started)
+            if since is not None:
+                mirror.forget_tombstones(since)
+        return changes
+
+    def state(self) -> dict:
+        """Watermarks to persist next to the mirrored rows (see restore())"""
+        return {
+            "watermarks": {
+                name: format_timestamp(m.watermark) if m.watermark is not None else None
+                for name, m in self.mirrors.items()
+            },
+            "tombstone_watermark": (
+                format_timestamp(self.tombstone_watermark)
+                if self.tombstone_watermark is not None else None
+            ),
+            "last_refresh_at": self.last_refresh_at,
+        }
+
+    def restore(self, tables: dict[str, list[dict]], state: dict) -> None:
+        """
+        Resume from persisted rows and state, so the next refresh only reads changes
+
+        Args:
+            tables: Rows per mirrored table
+            state: Value returned by state() when the rows were saved
+        """
+        for name, mirror in self.mirrors.items():
+            mirror.reset(tables.get(name, []), parse_timestamp(state["watermarks"].get(name)))
+        self.tombstone_watermark = parse_timestamp(state.get("tombstone_watermark"))
+        self.last_refresh_at = state.get("last_refresh_at")
+        self.loaded = True
+
+    def stats(self) -> dict:
+        """
+        Get sync status
+
+        Returns:
+            Dictionary with watermarks per table, lag in seconds (time since
+            the last completed refresh began), row counts and refresh counters
+        """
+        state = self.state()
+        return {
+            "loaded": self.loaded,
+            "watermarks": state["watermarks"],
+            "tombstone_watermark": state["tombstone_watermark"],
+            "lag_seconds": (
+                round(time.time() - self.last_refresh_at, 3)
+                if self.last_refresh_at is not None else None
+            ),
+            "rows": {name: len(m) for name, m in self.mirrors.items()},
+            "last_changes": self.last_changes,
+            "refreshes": self.refreshes,
+            "full_loads": self.full_loads,
+        }
+
+
+# Mirrors of the public catalog (clubs, majors and their links)
+catalog_sync = DeltaSync([
+    TableMirror("clubs", ("id",)),
+    TableMirror("majors", ("id",)),
+    TableMirror("club_majors", ("club_id", "major_id")),
+    TableMirror("club_tags", ("club_id", "tag")),
+])
@@ -2,17 +2,90 @@
 BetterBobcats Backend API
 FastAPI application providing REST API endpoints for clubs, majors, and platform data
 """
-from dotenv import load_dotenv
-from fastapi import FastAPI
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from app.core.compression import CompressionMiddleware
+from app.core.config import Settings, get_settings
+from app.core.limits import BodySizeLimitMiddleware
+from app.core.metrics import METRICS_ENABLED, MetricsMiddleware, render_metrics
+from app.core.profiling import ProfilingMiddleware, profiling_enabled
+from app.core.startup import startup_state
+from app.db.cache import catalog_cache
+from app.db.client import close_async_clients, get_async_db, warm_up
+from app.db.coalesce import coalescing_stats
+from app.db.sync import catalog_sync
+from app.services.career_paths import get_career_catalog
+from app.services.catalog_snapshot import catalog_snapshot
+from app.services.course_graph import get_course_catalog
+from app.services.renditions import shutdown_pool
+from app.utils.images import MAX_IMAGE_BYTES
+
+
+async def _build_local_catalogs() -> None:
+    """Validate and index the bundled course and career data (fails fast on bad data)"""
+    with startup_state.phase("course_graphs"):
+        courses = await asyncio.to_thread(get_course_catalog)
+    for conflict in courses.merge_conflicts:
+        logging.getLogger("uvicorn.error").warning(f"Combined course catalog: {conflict}")
+    with startup_state.phase("career_paths"):
+        await asyncio.to_thread(get_career_catalog)
+
+
+async def _warm_supabase(settings: Settings) -> None:
+    """Open pooled connections, load the catalog snapshot and preload catalog caches"""
+    with startup_state.phase("supabase_warmup", optional=True):
+        await asyncio.wait_for(
+            warm_up(settings.startup_warm_connections), settings.startup_timeout_seconds
+        )
+    if catalog_snapshot.enabled:
+        with startup_state.phase("catalog_snapshot", optional=True):
+            await catalog_snapshot.load_file()
+        catalog_snapshot.start(get_async_db)
+    if settings.startup_preload_caches and catalog_snapshot.current() is None:
+        with startup_state.phase("catalog_caches", optional=True):
+            db = await get_async_db()
+            await asyncio.wait_for(
+                asyncio.gather(clubs.preload(db), majors.preload(db)),
+                settings.startup_timeout_seconds,
+            )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Prepare everything the first request needs, then release it on shutdown
+
+    Settings and the bundled course and career data must load or startup
+    fails. Building that data (in a worker thread) overlaps with Supabase
+    warm-up and cache preloading, which are bounded by
+    STARTUP_TIMEOUT_SECONDS and only recorded if they fail, so the API still
+    starts (and serves the snapshot, if any) while Supabase is unreachable.
+    """
+    with startup_state.phase("settings"):
+        settings = get_settings()
+    await asyncio.gather(_build_local_catalogs(), _warm_supabase(settings))
+    startup_state.mark_ready()
+    logging.getLogger("uvicorn.error").info(startup_state.summary())
+
+    yield
+
+    startup_state.mark_stopping()
+    await catalog_snapshot.stop()
+    await close_async_clients()
+    shutdown_pool()
 
-# Load environment variables from .env file
-load_dotenv()
 
 app = FastAPI(
     title="BetterBobcats API",
     description="Open-source platform for UC Merced students",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS configuration
@@ -29,6 +102,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Cap image upload bodies (file limit plus room for multipart framing)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_bytes=MAX_IMAGE_BYTES + 64 * 1024,
+    path_suffixes=("/upload-logo", "/upload-banner"),
+)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_bytes=2 * MAX_IMAGE_BYTES + 64 * 1024,
+    path_suffixes=("/upload-assets",),
+)
+
+# brotli/gzip for responses over COMPRESS_MIN_BYTES not already compressed from a cached payload
+app.add_middleware(CompressionMiddleware)
+
+# Opt-in request profiling (PROFILE_TOKEN / PROFILE_SAMPLE_RATE); not installed otherwise
+if profiling_enabled():
+    app.add_middleware(ProfilingMiddleware)
+
+# Per-route request counts, status codes and latency (outermost, so it times everything)
+app.add_middleware(MetricsMiddleware)
+
 
 @app.get("/")
 async def root():
@@ -38,14 +133,48 @@ async def root():
 
 @app.get("/health")
 async def health():
-    """Health check endpoint"""
-    return {"status": "healthy"}
+    """Health check endpoint (liveness, readiness and component stats)"""
+    return {
+        "status": "healthy",
+        "ready": startup_state.ready,
+        "startup": startup_state.stats(),
+        "cache": catalog_cache.stats(),
+        "coalescing": coalescing_stats(),
+        "snapshot": catalog_snapshot.stats(),
+        "sync": catalog_sync.stats(),
+    }
+
+
+@app.get("/health/live")
+async def liveness():
+    """Liveness probe: the process is up and serving requests"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness():
+    """Readiness probe: 200 once startup has finished, 503 before that and during shutdown"""
+    stats = startup_state.stats()
+    if not startup_state.ready:
+        return JSONResponse(status_code=503, content={"status": "not ready", **stats})
+    return {"status": "ready", **stats}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics (routes, Supabase calls, cache and coalescing counters)"""
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
 
 
 # API Routers
-from app.api import clubs, majors
+from app.api import careers, clubs, courses, majors
 
 # Admin router removed - admin auth now handled via Supabase Auth in Next.js
 # app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
 app.include_router(clubs.router, prefix="/api/clubs", tags=["clubs"])
 app.include_router(majors.router, prefix="/api/majors", tags=["majors"])
+app.include_router(courses.router, prefix="/api/courses", tags=["courses"])
+app.include_router(careers.router, prefix="/api/careers", tags=["careers"])
@@ -3,7 +3,14 @@ Career Path Models
 Pydantic models for career path data matching frontend TypeScript types
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Union
+
+
+class CourseResources(BaseModel):
+    """Study resources for a course in a career path"""
+    videos: Optional[list[str]] = None
+    websites: Optional[list[str]] = None
+    tools: Optional[list[str]] = None
 
 
 class ExpandedInfo(BaseModel):
@@ -13,6 +20,10 @@ class ExpandedInfo(BaseModel):
     learning_outcomes: Optional[list[str]] = Field(default=None, alias="learningOutcomes")
     topics: Optional[list[str]] = None
     career_relevance: Optional[str] = Field(default=None, alias="careerRelevance")
+    real_world_applications: Optional[list[str]] = Field(
+        default=None, alias="realWorldApplications"
+    )
+    resources: Optional[CourseResources] = None
     additional_notes: Optional[str] = Field(default=None, alias="additionalNotes")
     
     class Config:
@@ -27,7 +38,9 @@ class TierCourse(BaseModel):
     full_name: str = Field(alias="fullName")
     description: str
     resources: Optional[list[str]] = None
-    tier: int
+    tier: Union[int, float] = Field(
+        ..., description="Tier number (half tiers such as 1.5 are allowed)"
+    )
     prerequisites: Optional[list[str]] = None
     expanded_info: Optional[ExpandedInfo] = Field(default=None, alias="expandedInfo")
     
@@ -16,6 +16,7 @@ class ClubBase(BaseModel):
     slug: Optional[str] = Field(None, description="URL-friendly slug for the club")
     is_active: bool = Field(True, description="Whether the club is currently active")
     display_order: int = Field(0, description="Order for displaying clubs (lower numbers appear first)")
+    is_all_majors: bool = Field(False, description="Whether the club is relevant to every major")
     logo_url: Optional[str] = Field(None, description="URL to the club's logo image")
     banner_url: Optional[str] = Field(None, description="URL to the club's banner image")
 
@@ -29,6 +30,12 @@ class Club(ClubBase):
     """Complete club model matching database schema"""
     id: UUID = Field(..., description="Unique identifier for the club")
     created_at: datetime = Field(..., description="Timestamp when the club was created")
+    logo_renditions: Optional[dict[str, dict[str, str]]] = Field(
+        None, description="Resized logo URLs keyed by format, then width in pixels"
+    )
+    banner_renditions: Optional[dict[str, dict[str, str]]] = Field(
+        None, description="Resized banner URLs keyed by format, then width in pixels"
+    )
     
     class Config:
         json_schema_extra = {
@@ -40,8 +47,11 @@ class Club(ClubBase):
                 "slug": "acm",
                 "is_active": True,
                 "display_order": 0,
+                "is_all_majors": False,
                 "logo_url": "https://example.com/logo.png",
                 "banner_url": "https://example.com/banner.png",
+                "logo_renditions": {"webp": {"64": "https://example.com/logo-64.webp"}},
+                "banner_renditions": {"webp": {"640": "https://example.com/banner-640.webp"}},
                 "created_at": "2025-01-02T00:00:00Z"
             }
         }
@@ -52,3 +52,43 @@ class Course(BaseModel):
 class CourseGraph(BaseModel):
     """Course graph containing all courses"""
     courses: list[Course] = Field(..., description="List of all courses")
+
+
+class PlanRequest(BaseModel):
+    """Request for a semester plan covering a major's remaining courses"""
+    major: str = Field(..., description="Major slug, e.g. 'cs-cse'")
+    completed: list[str] = Field(
+        default_factory=list, description="IDs of courses already completed"
+    )
+    max_courses: int = Field(5, ge=1, le=12, description="Maximum courses per semester")
+    max_units: Optional[int] = Field(
+        None, ge=1, description="Maximum units per semester (optional)"
+    )
+    units_per_course: int = Field(
+        4, ge=0, description="Units assumed for courses not listed in 'units'"
+    )
+    units: dict[str, int] = Field(default_factory=dict, description="Units per course ID")
+    start_semester: Semester = Field(Semester.FALL, description="Semester the plan starts in")
+    strict_offering: bool = Field(
+        True, description="Only schedule a course in the semester it is offered (Course.semester)"
+    )
+    include_categories: bool = Field(True, description="Schedule GenEd/Elective category nodes")
+
+
+class PlannedSemester(BaseModel):
+    """One semester of a plan"""
+    number: int = Field(..., description="Semester number, starting at 1")
+    semester: Semester = Field(..., description="Fall or spring")
+    courses: list[str] = Field(..., description="Course IDs taken this semester")
+    units: int = Field(..., description="Total units this semester")
+
+
+class SemesterPlan(BaseModel):
+    """Schedule of a major's remaining courses"""
+    major: str
+    semesters: list[PlannedSemester]
+    semester_count: int = Field(..., description="Number of semesters in the plan")
+    critical_path: list[str] = Field(
+        ..., description="Longest prerequisite chain among remaining courses"
+    )
+    unknown_courses: list[str] = Field(..., description="Completed IDs that are not in the major")
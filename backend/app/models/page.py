@@ -0,0 +1,17 @@
+"""
+Page Model
+Generic response model for cursor-paginated list endpoints
+"""
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of results from a keyset-paginated list endpoint"""
+    items: list[T] = Field(..., description="Items on this page, in sort order")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page (null on the last page)"
+    )
@@ -0,0 +1 @@
+"""Services Package - In-process engines used by the API routes"""
@@ -0,0 +1,154 @@
+"""
+Club Assets
+Content-addressed storage for club logos, banners and their renditions
+"""
+import asyncio
+import hashlib
+from typing import Optional
+
+from app.core.config import get_tuning
+from app.services.renditions import (
+    Rendition,
+    available_formats,
+    generate_renditions,
+    rendition_widths,
+)
+from app.utils.images import ImageInfo
+
+# Storage bucket name
+STORAGE_BUCKET = "club-assets"
+
+# Objects are addressed by content hash, so their URLs never change meaning
+# and can be cached for a year (Supabase Storage takes max-age in seconds)
+IMMUTABLE_MAX_AGE = str(get_tuning().asset_cache_max_age)
+
+
+def content_hash(data: bytes) -> str:
+    """Return the SHA-256 hex digest of an uploaded file"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def asset_folder(kind: str, digest: str) -> str:
+    """
+    Get the storage folder for one image
+
+    Args:
+        kind: "logo" or "banner"
+        digest: Content hash of the original file
+
+    Returns:
+        Folder path, e.g. "clubs/logo/<sha256>"
+    """
+    return f"clubs/{kind}/{digest}"
+
+
+async def _upload_object(storage, path: str, data: bytes, content_type: str) -> None:
+    """Upload one immutable object (upsert, since identical paths hold identical bytes)"""
+    await storage.upload(
+        path,
+        data,
+        file_options={
+            "content-type": content_type,
+            "cache-control": IMMUTABLE_MAX_AGE,
+            "upsert": "true",
+        },
+    )
+
+
+async def _public_url(storage, path: str) -> str:
+    """Get the public URL of an object"""
+    public_url_response = await storage.get_public_url(path)
+    # Handle both string and dict responses
+    if isinstance(public_url_response, dict):
+        return public_url_response.get(
+            "publicUrl", public_url_response.get("public_url", str(public_url_response))
+        )
+    return str(public_url_response)
+
+
+async def store_image(
+    storage, kind: str, data: bytes, info: ImageInfo, widths: tuple[int, ...]
+) -> tuple[str, dict[str, dict[str, str]]]:
+    """
+    Store an image and its renditions under a content-hash path
+
+    One list call on the image's folder tells which objects already exist.
+    Existing objects are not re-uploaded, and renditions are only generated
+    when at least one of them is missing, so re-uploading a file costs a
+    single storage request.
+
+    Args:
+        storage: Storage bucket client
+        kind: "logo" or "banner"
+        data: Original image bytes (already validated)
+        info: Image header information
+        widths: Rendition widths in pixels
+
+    Returns:
+        Tuple of (original URL, rendition URLs keyed by format, then width)
+
+    Raises:
+        ImageValidationError: If renditions are needed and the image cannot be decoded
+    """
+    folder = asset_folder(kind, content_hash(data))
+    existing = {entry["name"] for entry in await storage.list(folder)}
+
+    original = f"original.{info.extension}"
+    names = {
+        (fmt, str(width)): f"{width}.{fmt}"
+        for width in rendition_widths(widths, info.width)
+        for fmt in available_formats()
+    }
+
+    uploads = []
+    if original not in existing:
+        uploads.append(_upload_object(storage, f"{folder}/{original}", data, info.mime_type))
+
+    renditions: list[Rendition] = []
+    if not existing.issuperset(names.values()):
+        renditions = await generate_renditions(data, widths)
+        names = {(r.format, str(r.width)): f"{r.width}.{r.format}" for r in renditions}
+        uploads.extend(
+            _upload_object(storage, f"{folder}/{r.width}.{r.format}", r.data, r.mime_type)
+            for r in renditions
+            if f"{r.width}.{r.format}" not in existing
+        )
+    await asyncio.gather(*uploads)
+
+    rendition_urls: dict[str, dict[str, str]] = {}
+    for (fmt, width), name in names.items():
+        rendition_urls.setdefault(fmt, {})[width] = await _public_url(storage, f"{folder}/{name}")
+    return await _public_url(storage, f"{folder}/{original}"), rendition_urls
+
+
+async def store_club_images(
+    storage,
+    logo: Optional[tuple[bytes, ImageInfo]],
+    banner: Optional[tuple[bytes, ImageInfo]],
+    logo_widths: tuple[int, ...],
+    banner_widths: tuple[int, ...],
+) -> dict:
+    """
+    Store a logo and/or banner concurrently
+
+    Args:
+        storage: Storage bucket client
+        logo: (bytes, header info) of the logo, or None
+        banner: (bytes, header info) of the banner, or None
+        logo_widths: Logo rendition widths
+        banner_widths: Banner rendition widths
+
+    Returns:
+        Club columns to update (logo_url, logo_renditions, banner_url, banner_renditions)
+    """
+    jobs = {}
+    if logo is not None:
+        jobs["logo"] = store_image(storage, "logo", *logo, logo_widths)
+    if banner is not None:
+        jobs["banner"] = store_image(storage, "banner", *banner, banner_widths)
+
+    updates = {}
+    for kind, (url, renditions) in zip(jobs, await asyncio.gather(*jobs.values())):
+        updates[f"{kind}_url"] = url
+        updates[f"{kind}_renditions"] = renditions
+    return updates
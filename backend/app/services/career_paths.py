@@ -0,0 +1,107 @@
+"""
+Career Paths
+Career path configs validated once, pre-serialized and precompressed for serving
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from app.models.career import CareerPathConfig
+from app.utils.compression import precompress
+from app.utils.serialization import EncodedPayload, encode_payload
+
+# Career path data: <major-slug>/<career-slug>.json (CareerPathConfig, camelCase as in the frontend)
+CAREER_DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "careers"
+
+
+@dataclass(frozen=True)
+class CareerPath:
+    """A validated career path and its encoded response"""
+    major: str
+    career: str
+    config: CareerPathConfig
+    payload: EncodedPayload
+
+
+class CareerPathCatalog:
+    """
+    Every career path, keyed by major and career slug
+
+    Configs are validated against CareerPathConfig when the catalog is
+    built. Each one is encoded to JSON once (snake_case, nulls omitted) and
+    compressed with gzip and brotli, so requests only pick a body.
+    """
+
+    def __init__(self, configs: dict[tuple[str, str], CareerPathConfig]):
+        self.paths: dict[tuple[str, str], CareerPath] = {}
+        self.by_career: dict[str, list[CareerPath]] = {}
+        items = sorted(configs.items())
+        # Compression releases the GIL, so payloads are built in parallel (startup time)
+        with ThreadPoolExecutor() as pool:
+            payloads = pool.map(
+                lambda config: precompress(
+                    encode_payload(config.model_dump(mode="json", exclude_none=True))
+                ),
+                [config for _, config in items],
+            )
+            for ((major, career), config), payload in zip(items, payloads):
+                path = CareerPath(major=major, career=career, config=config, payload=payload)
+                self.paths[(major, career)] = path
+                self.by_career.setdefault(career, []).append(path)
+
+        self.index_payload = precompress(encode_payload([
+            {
+                "major": path.major,
+                "career": path.career,
+                "root_label": path.config.root_label,
+                "course_count": len(path.config.courses),
+            }
+            for path in self.paths.values()
+        ]))
+
+    def get(self, major: str, career: str) -> Optional[CareerPath]:
+        """Get a career path by major and career slug"""
+        return self.paths.get((major, career))
+
+    def find(self, career: str) -> list[CareerPath]:
+        """Get every career path with a career slug, across majors"""
+        return self.by_career.get(career, [])
+
+
+def load_career_configs(
+    directory: Path = CAREER_DATA_DIR,
+) -> dict[tuple[str, str], CareerPathConfig]:
+    """
+    Read and validate every career path file
+
+    Args:
+        directory: Folder of <major-slug>/<career-slug>.json files
+
+    Returns:
+        Configs keyed by (major slug, career slug)
+    """
+    return {
+        (path.parent.name, path.stem): CareerPathConfig.model_validate(
+            json.loads(path.read_text(encoding="utf-8"))
+        )
+        for path in sorted(directory.glob("*/*.json"))
+    }
+
+
+_catalog: Optional[CareerPathCatalog] = None
+
+
+def get_career_catalog() -> CareerPathCatalog:
+    """
+    Get the shared career path catalog, building it on first use
+
+    Raises:
+        pydantic.ValidationError: If a career path file does not match CareerPathConfig
+    """
+    global _catalog
+
+    if _catalog is None:
+        _catalog = CareerPathCatalog(load_career_configs())
+    return _catalog
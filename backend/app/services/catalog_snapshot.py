@@ -0,0 +1,674 @@
+"""
+Catalog Snapshot
+Local SQLite copy of the club and major catalog, shared by worker processes,
+for serving public reads without Supabase
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from bisect import bisect_right
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from supabase import AsyncClient
+
+from app.core.config import get_tuning
+from app.db.sync import catalog_sync
+from app.services.club_filters import ClubFilterIndex, PayloadMemo, sort_key
+from app.services.club_search import SearchIndex, document_tokens, tokenize, trigrams
+from app.services.course_graph import iter_bits
+from app.utils.pagination import nulls_last
+from app.utils.serialization import EncodedPayload
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - without file locks every process syncs (Windows)
+    fcntl = None
+
+# Serve public GET routes from the snapshot (writes always go to Supabase)
+SNAPSHOT_ENABLED = get_tuning().snapshot_enabled
+
+# SQLite file holding the last completed sync (survives restarts and Supabase outages)
+SNAPSHOT_PATH = get_tuning().snapshot_path
+
+# Seconds between syncs (writes made through this API also trigger one)
+SNAPSHOT_REFRESH_SECONDS = get_tuning().snapshot_refresh_seconds
+
+# Oldest snapshot that is served; past this, reads go to Supabase again
+SNAPSHOT_MAX_STALENESS_SECONDS = get_tuning().snapshot_max_staleness_seconds
+
+# How often worker processes check for a newer snapshot file (and sync requests)
+SNAPSHOT_POLL_SECONDS = get_tuning().snapshot_poll_seconds
+
+# Bytes of the snapshot file each process maps into memory (shared through the page cache)
+SNAPSHOT_MMAP_BYTES = get_tuning().snapshot_mmap_bytes
+
+# Response header carrying the age in seconds of the snapshot a read was served from
+SNAPSHOT_AGE_HEADER = "X-Snapshot-Age"
+
+# Major list order (id breaks ties); shared with GET /api/majors/
+MAJOR_SORT_KEYS = ["name", "id"]
+MAJOR_SORT_KEY_TYPES = ["text", "uuid"]
+
+# Synced tables and their key columns (rows are stored whole, as JSON)
+SNAPSHOT_TABLES = {name: mirror.key_columns for name, mirror in catalog_sync.mirrors.items()}
+
+# Club fields each process keeps in memory: sort keys, filter flags and the search tie-break
+CLUB_INDEX_FIELDS = ("id", "display_order", "created_at", "is_all_majors", "is_active", "name")
+
+# Positions bound per club_view lookup (below SQLite's host parameter limit)
+ROW_LOOKUP_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE clubs (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE majors (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE club_majors (
+    club_id TEXT NOT NULL, major_id TEXT NOT NULL, data TEXT NOT NULL,
+    PRIMARY KEY (club_id, major_id)
+);
+CREATE TABLE club_tags (
+    club_id TEXT NOT NULL, tag TEXT NOT NULL, data TEXT NOT NULL,
+    PRIMARY KEY (club_id, tag)
+);
+CREATE TABLE club_view (position INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE, data TEXT NOT NULL);
+CREATE TABLE search_postings (
+    token TEXT NOT NULL, club_id TEXT NOT NULL, weight REAL NOT NULL,
+    PRIMARY KEY (token, club_id)
+) WITHOUT ROWID;
+CREATE TABLE snapshot_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+class SortedRows:
+    """
+    Rows in list order with keyset paging and by-ID lookup
+
+    Immutable once built; encoded responses are memoized per query.
+    """
+
+    def __init__(self, rows: Iterable[dict], sort_keys: list[str]):
+        self.sort_keys = sort_keys
+        self.rows = sorted(rows, key=self.key)
+        self.keys = [self.key(row) for row in self.rows]
+        self.by_id = {str(row["id"]): row for row in self.rows}
+        self._payloads = PayloadMemo()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def key(self, row: dict) -> tuple:
+        """Comparable sort key of a row (NULLs last; see nulls_last)"""
+        return nulls_last(row.get(key) for key in self.sort_keys)
+
+    def page(self, after: Optional[list], limit: int) -> tuple[list[dict], bool]:
+        """
+        Get one page of rows
+
+        Args:
+            after: Decoded cursor (sort-key values of the previous page's last row)
+            limit: Page size
+
+        Returns:
+            (rows, whether more rows follow)
+
+        Raises:
+            ValueError: If the cursor values cannot be compared with the sort keys
+        """
+        start = 0
+        if after is not None:
+            try:
+                start = bisect_right(self.keys, nulls_last(after))
+            except TypeError as e:
+                raise ValueError("Invalid cursor") from e
+        return self.rows[start:start + limit], start + limit < len(self.rows)
+
+    def payload(self, key: tuple, build: Callable[[], object]) -> EncodedPayload:
+        """Get a pre-encoded response for a query, encoding it on first use"""
+        return self._payloads.get(key, build)
+
+
+class SnapshotRows:
+    """
+    Served club rows in list order, read from the snapshot file on demand
+
+    Supports the sequence access ClubFilterIndex uses (len and integer
+    positions), so filtered pages decode only the rows they return.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, count: int):
+        self._conn = conn
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position: int) -> dict:
+        row = self._conn.execute(
+            "SELECT data FROM club_view WHERE position = ?", (position,)
+        ).fetchone()
+        if row is None:
+            raise IndexError(position)
+        return json.loads(row[0])
+
+    def many(self, positions: Iterable[int]) -> list[dict]:
+        """Rows at several positions, in the given order, looked up by primary key"""
+        wanted = list(positions)
+        found: dict[int, dict] = {}
+        for i in range(0, len(wanted), ROW_LOOKUP_CHUNK):
+            chunk = wanted[i:i + ROW_LOOKUP_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            query = f"SELECT position, data FROM club_view WHERE position IN ({placeholders})"
+            for position, data in self._conn.execute(query, chunk):
+                found[position] = json.loads(data)
+        return [found[position] for position in wanted]
+
+
+class SnapshotClubIndex(ClubFilterIndex):
+    """ClubFilterIndex built from slim club rows, serving full rows from the snapshot file"""
+
+    def __init__(self, slim_rows: list[dict], memberships: Iterable[dict], rows: SnapshotRows):
+        super().__init__(slim_rows, memberships)
+        self.rows = rows
+
+    def rows_for(self, bits: int) -> list[dict]:
+        return self.rows.many(iter_bits(bits))
+
+
+class SnapshotPostings:
+    """
+    Search postings read from the snapshot file
+
+    Supports the mapping access SearchIndex uses (`token in postings` and
+    `postings[token]` giving {club id: weight}).
+    """
+
+    def __init__(self, conn: sqlite3.Connection, vocabulary: Iterable[str]):
+        self._conn = conn
+        self._vocabulary = set(vocabulary)
+
+    def __contains__(self, token: str) -> bool:
+        return token in self._vocabulary
+
+    def __getitem__(self, token: str) -> dict[str, float]:
+        query = "SELECT club_id, weight FROM search_postings WHERE token = ?"
+        return dict(self._conn.execute(query, (token,)))
+
+
+class SnapshotSearchIndex(SearchIndex):
+    """
+    Read-only SearchIndex whose postings stay in the snapshot file
+
+    Ranking is SearchIndex's own. Only the vocabulary, its trigrams and the
+    slim club rows are held in memory; predicates passed to search() see
+    the slim rows (id, name, is_active, ...), and results carry full rows
+    (read through the club index).
+    """
+
+    def __init__(self, conn: sqlite3.Connection, slim_rows: Iterable[dict], clubs: ClubFilterIndex):
+        super().__init__()
+        self._clubs = clubs
+        for row in slim_rows:
+            self.rows[row["id"]] = row
+            self._names[row["id"]] = " ".join(tokenize(row.get("name")))
+        vocabulary = conn.execute("SELECT DISTINCT token FROM search_postings ORDER BY token")
+        self._vocabulary = [token for (token,) in vocabulary]
+        for token in self._vocabulary:
+            for gram in trigrams(token):
+                self._trigrams[gram].add(token)
+        self._postings = SnapshotPostings(conn, self._vocabulary)
+
+    def upsert(self, row: dict) -> None:
+        raise TypeError("Snapshot search index is read-only")
+
+    def remove(self, club_id: str) -> None:
+        raise TypeError("Snapshot search index is read-only")
+
+    def search(self, query: str, limit: int = 10, predicate=None) -> list[tuple[dict, float]]:
+        clubs = self._clubs
+        results = super().search(query, limit, predicate)
+        return [(clubs.rows[clubs.positions[row["id"]]], score) for row, score in results]
+
+
+class CatalogData:
+    """
+    One synced copy of the catalog, served from the snapshot file
+
+    Club rows and search postings stay in the SQLite file, which every
+    process opens read-only and maps into memory (PRAGMA mmap_size), so the
+    page cache holds one copy however many workers serve it. Each process
+    keeps only compact indexes: club sort keys and filter bitsets
+    (ClubFilterIndex), the search vocabulary, and the major list (small).
+    Files are replaced, never modified, so a loaded copy stays consistent;
+    close() releases the file once a newer copy has been swapped in.
+
+    Raises:
+        sqlite3.Error: If the file is missing or not a snapshot
+    """
+
+    def __init__(self, path: str):
+        stat = os.stat(path)
+        self.inode = stat.st_ino
+        conn = sqlite3.connect(
+            f"file:{path}?mode=ro&immutable=1", uri=True, check_same_thread=False
+        )
+        conn.execute(f"PRAGMA mmap_size = {SNAPSHOT_MMAP_BYTES}")
+        meta = dict(conn.execute("SELECT key, value FROM snapshot_meta"))
+        self.synced_at = float(meta["synced_at"])
+
+        slim_rows = []
+        for (data,) in conn.execute("SELECT data FROM club_view ORDER BY position"):
+            row = json.loads(data)
+            slim_rows.append({field: row[field] for field in CLUB_INDEX_FIELDS if field in row})
+        memberships = (
+            {"club_id": club_id, "major_id": major_id}
+            for club_id, major_id in conn.execute("SELECT club_id, major_id FROM club_majors")
+        )
+        self.clubs = SnapshotClubIndex(slim_rows, memberships, SnapshotRows(conn, len(slim_rows)))
+        self.search = SnapshotSearchIndex(conn, slim_rows, self.clubs)
+        self.majors = SortedRows(
+            (json.loads(data) for (data,) in conn.execute("SELECT data FROM majors")),
+            MAJOR_SORT_KEYS,
+        )
+        self._conn = conn
+
+    def age(self) -> float:
+        """Seconds since the sync this copy came from"""
+        return max(0.0, time.time() - self.synced_at)
+
+    def club(self, club_id: str) -> Optional[dict]:
+        """Club row by ID, or None"""
+        position = self.clubs.positions.get(club_id)
+        return None if position is None else self.clubs.rows[position]
+
+    def close(self) -> None:
+        """Close the snapshot file (after this copy has been replaced)"""
+        self._conn.close()
+
+
+def snapshot_headers(data: Optional[CatalogData]) -> dict:
+    """Response headers for a read served from a snapshot (none for live reads)"""
+    if data is None:
+        return {}
+    return {SNAPSHOT_AGE_HEADER: str(int(data.age()))}
+
+
+def write_snapshot(
+    path: str, tables: dict[str, list[dict]], synced_at: float, sync_state: dict
+) -> None:
+    """
+    Write a snapshot file atomically (readers never see a partial file)
+
+    Besides the synced tables, the file holds the served club rows (with
+    their tags) in list order and the club search postings.
+
+    Args:
+        path: Target SQLite file
+        tables: Rows per table in SNAPSHOT_TABLES
+        synced_at: Unix time the rows were read
+        sync_state: Delta sync watermarks the rows reflect
+    """
+    tags: dict[str, list[str]] = {}
+    for row in tables["club_tags"]:
+        tags.setdefault(str(row["club_id"]), []).append(row["tag"])
+    clubs = sorted(
+        ({**row, "tags": tags.get(str(row["id"]), [])} for row in tables["clubs"]), key=sort_key
+    )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(_SCHEMA)
+        for table, key_columns in SNAPSHOT_TABLES.items():
+            columns = ", ".join((*key_columns, "data"))
+            placeholders = ", ".join("?" * (len(key_columns) + 1))
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} ({columns}) VALUES ({placeholders})",
+                (
+                    (*(str(row[column]) for column in key_columns), json.dumps(row, default=str))
+                    for row in tables[table]
+                ),
+            )
+        conn.executemany(
+            "INSERT INTO club_view (position, id, data) VALUES (?, ?, ?)",
+            ((i, str(row["id"]), json.dumps(row, default=str)) for i, row in enumerate(clubs)),
+        )
+        conn.executemany(
+            "INSERT INTO search_postings (token, club_id, weight) VALUES (?, ?, ?)",
+            (
+                (token, str(row["id"]), weight)
+                for row in clubs
+                for token, weight in document_tokens(row).items()
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO snapshot_meta (key, value) VALUES (?, ?)",
+            [("synced_at", repr(synced_at)), ("sync_state", json.dumps(sync_state))],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+
+
+def write_sync_meta(path: str, synced_at: float, sync_state: dict) -> None:
+    """
+    Record a sync next to the snapshot file (atomically)
+
+    Syncs that bring no changes only update this file, so the snapshot
+    itself is never modified in place.
+
+    Args:
+        path: Snapshot file
+        synced_at: Unix time of the sync
+        sync_state: Delta sync watermarks after the sync
+    """
+    tmp_path = f"{path}.meta.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"synced_at": synced_at, "sync_state": sync_state}, f)
+    os.replace(tmp_path, f"{path}.meta")
+
+
+def read_sync_meta(path: str) -> Optional[dict]:
+    """The last sync recorded by write_sync_meta, or None"""
+    try:
+        with open(f"{path}.meta", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_snapshot(path: str) -> tuple[dict[str, list[dict]], float, Optional[dict]]:
+    """
+    Read the synced tables of a snapshot file
+
+    Args:
+        path: SQLite file written by write_snapshot
+
+    Returns:
+        (rows per table, Unix time of the sync, delta sync watermarks),
+        taking the time and watermarks of a later sync that found no changes
+
+    Raises:
+        sqlite3.Error: If the file is missing or not a snapshot
+    """
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        tables = {
+            table: [json.loads(data) for (data,) in conn.execute(f"SELECT data FROM {table}")]
+            for table in SNAPSHOT_TABLES
+        }
+        meta = dict(conn.execute("SELECT key, value FROM snapshot_meta"))
+    finally:
+        conn.close()
+    synced_at = float(meta["synced_at"])
+    sync_state = json.loads(meta["sync_state"]) if "sync_state" in meta else None
+    later = read_sync_meta(path)
+    if later is not None and later["synced_at"] > synced_at:
+        synced_at, sync_state = later["synced_at"], later["sync_state"]
+    return tables, synced_at, sync_state
+
+
+class CatalogSnapshot:
+    """
+    Periodically synced local catalog for public reads
+
+    One process (the holder of a lock on SNAPSHOT_PATH.lock) pulls changes
+    to clubs, majors, club_majors and club_tags from Supabase every
+    SNAPSHOT_REFRESH_SECONDS, and soon after writes made through this API in
+    any process. When something changed it writes a new SNAPSHOT_PATH;
+    every process picks up new files within SNAPSHOT_POLL_SECONDS and serves
+    them through CatalogData. If the syncing process exits, another one
+    takes the lock over. On start the last file is loaded first, so reads
+    keep working when Supabase is down at boot. current() returns the data
+    only while it is younger than SNAPSHOT_MAX_STALENESS_SECONDS; routes
+    fall back to Supabase otherwise.
+    """
+
+    def __init__(
+        self,
+        path: str = SNAPSHOT_PATH,
+        refresh_seconds: float = SNAPSHOT_REFRESH_SECONDS,
+        max_staleness: float = SNAPSHOT_MAX_STALENESS_SECONDS,
+        enabled: bool = SNAPSHOT_ENABLED,
+        poll_seconds: float = SNAPSHOT_POLL_SECONDS,
+    ):
+        self.path = path
+        self.refresh_seconds = refresh_seconds
+        self.max_staleness = max_staleness
+        self.enabled = enabled
+        self.poll_seconds = poll_seconds
+        self.data: Optional[CatalogData] = None
+        self.leader = False
+        self.last_error: Optional[str] = None
+        self.syncs = 0
+        self.reloads = 0
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock_file = None
+        self._last_sync: Optional[float] = None
+        self._wake_seen: Optional[int] = None
+        self._meta_seen: Optional[int] = None
+
+    def current(self) -> Optional[CatalogData]:
+        """The snapshot to serve reads from, or None (disabled, not loaded or too stale)"""
+        data = self.data
+        if not self.enabled or data is None or data.age() > self.max_staleness:
+            return None
+        return data
+
+    async def load_file(self) -> bool:
+        """
+        Load the snapshot file, if there is one
+
+        Returns:
+            Whether a snapshot was loaded
+        """
+        def load() -> CatalogData:
+            data = CatalogData(self.path)
+            later = read_sync_meta(self.path)
+            if later is not None and later["synced_at"] > data.synced_at:
+                data.synced_at = later["synced_at"]
+            return data
+
+        try:
+            self._swap(await asyncio.to_thread(load))
+            self.reloads += 1
+            return True
+        except (OSError, sqlite3.Error, KeyError, ValueError) as e:
+            self.last_error = f"Failed to load snapshot: {str(e)}"
+            return False
+
+    async def sync(self, db: AsyncClient) -> CatalogData:
+        """
+        Pull catalog changes from Supabase, persist them and swap them in
+
+        Only rows changed since the last sync are fetched (see
+        app.db.sync); the file is rewritten and reloaded only when
+        something changed. The first sync in a process resumes from the
+        watermarks stored in the file.
+
+        Args:
+            db: Supabase client
+
+        Returns:
+            The current snapshot
+        """
+        if not catalog_sync.loaded and os.path.exists(self.path):
+            try:
+                tables, _, sync_state = await asyncio.to_thread(read_snapshot, self.path)
+                if sync_state is not None:
+                    catalog_sync.restore(tables, sync_state)
+            except (sqlite3.Error, KeyError, ValueError):
+                pass
+
+        changes = await catalog_sync.refresh(db)
+        synced_at = catalog_sync.last_refresh_at
+        sync_state = catalog_sync.state()
+
+        if changes or self.data is None:
+            tables = catalog_sync.tables()
+
+            def persist() -> CatalogData:
+                write_snapshot(self.path, tables, synced_at, sync_state)
+                write_sync_meta(self.path, synced_at, sync_state)
+                return CatalogData(self.path)
+
+            self._swap(await asyncio.to_thread(persist))
+        else:
+            await asyncio.to_thread(write_sync_meta, self.path, synced_at, sync_state)
+            self.data.synced_at = synced_at
+        self.syncs += 1
+        self.last_error = None
+        return self.data
+
+    def _swap(self, data: CatalogData) -> None:
+        """
+        Serve a newly loaded copy and close the one it replaces
+
+        Routes read a copy synchronously right after current(), so no
+        request still holds the old one once the event loop runs this.
+        """
+        previous, self.data = self.data, data
+        if previous is not None:
+            previous.close()
+
+    def request_sync(self) -> None:
+        """Sync soon (after a write through this API), instead of waiting for the next interval"""
+        if self._wake is None:
+            return
+        if self.leader:
+            self._wake.set()
+            return
+        # Another process syncs; it polls the modification time of this file
+        try:
+            with open(f"{self.path}.wake", "a"):
+                pass
+            os.utime(f"{self.path}.wake")
+        except OSError:
+            pass
+
+    def start(self, get_db: Callable[[], Awaitable[AsyncClient]]) -> None:
+        """
+        Start the background sync task (no-op when disabled)
+
+        Args:
+            get_db: Returns the Supabase client to sync with
+        """
+        if not self.enabled or self._task is not None:
+            return
+        self._wake = asyncio.Event()
+        self._last_sync = None
+        self._task = asyncio.create_task(self._run(get_db))
+
+    async def stop(self) -> None:
+        """Stop the background sync task and give up the sync lock"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+            self.leader = False
+
+    def _acquire_lead(self) -> bool:
+        """Take the sync lock if no other process holds it"""
+        if self.leader:
+            return True
+        if fcntl is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            lock_file = open(f"{self.path}.lock", "a")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return False
+            self._lock_file = lock_file
+        self.leader = True
+        return True
+
+    def _mtime(self, path: str) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _sync_due(self, woken: bool) -> bool:
+        if woken or self._last_sync is None:
+            return True
+        wake = self._mtime(f"{self.path}.wake")
+        if wake != self._wake_seen:
+            self._wake_seen = wake
+            return True
+        return time.monotonic() - self._last_sync >= self.refresh_seconds
+
+    async def _follow(self) -> None:
+        """Pick up a snapshot file (or sync time) written by the syncing process"""
+        try:
+            inode = os.stat(self.path).st_ino
+        except OSError:
+            return
+        if self.data is None or inode != self.data.inode:
+            await self.load_file()
+            return
+        meta = self._mtime(f"{self.path}.meta")
+        if meta != self._meta_seen:
+            self._meta_seen = meta
+            later = read_sync_meta(self.path)
+            if later is not None and later["synced_at"] > self.data.synced_at:
+                self.data.synced_at = later["synced_at"]
+
+    async def _run(self, get_db: Callable[[], Awaitable[AsyncClient]]) -> None:
+        if self.data is None:
+            await self.load_file()
+        while True:
+            woken = self._wake.is_set()
+            self._wake.clear()
+            if self._acquire_lead():
+                if self._sync_due(woken):
+                    self._last_sync = time.monotonic()
+                    try:
+                        await self.sync(await get_db())
+                    except Exception as e:
+                        self.last_error = f"Failed to sync snapshot: {str(e)}"
+            else:
+                await self._follow()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get snapshot status
+
+        Returns:
+            Dictionary with enabled, serving, role (syncing or following
+            another process), age in seconds, row counts, completed syncs,
+            file reloads and the last error
+        """
+        data = self.data
+        return {
+            "enabled": self.enabled,
+            "serving": self.current() is not None,
+            "role": "sync" if self.leader else "follow",
+            "age_seconds": round(data.age(), 3) if data is not None else None,
+            "max_staleness_seconds": self.max_staleness,
+            "clubs": len(data.clubs) if data is not None else 0,
+            "majors": len(data.majors) if data is not None else 0,
+            "syncs": self.syncs,
+            "reloads": self.reloads,
+            "last_error": self.last_error,
+        }
+
+
+# Shared catalog snapshot
+catalog_snapshot = CatalogSnapshot()
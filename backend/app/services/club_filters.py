@@ -0,0 +1,236 @@
+"""
+Club Filters
+In-memory bitset index of club membership per major, for filtered catalog browsing
+"""
+import asyncio
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+
+from supabase import AsyncClient
+
+from app.core.config import get_tuning
+from app.db.sync import fetch_all
+from app.services.course_graph import iter_bits
+from app.utils.pagination import nulls_last
+from app.utils.serialization import EncodedPayload, encode_payload
+
+# List order of GET /api/clubs (id breaks ties); positions in the index follow it
+SORT_KEYS = ["display_order", "created_at", "id"]
+
+# Column type of each sort key, for validating cursors (see pagination.CURSOR_TYPES)
+SORT_KEY_TYPES = ["int", "timestamp", "uuid"]
+
+# Tables whose change counters (public.catalog_versions) invalidate the index
+VERSIONED_TABLES = ["clubs", "club_majors"]
+
+# How often the change counters are polled; between polls the index is served as is
+VERSION_CHECK_SECONDS = get_tuning().club_filter_version_check_seconds
+
+# Most encoded responses memoized per index (least recently used are dropped)
+PAYLOAD_MEMO_ENTRIES = get_tuning().club_filter_payload_entries
+
+
+def sort_key(row: dict) -> tuple:
+    """Comparable sort key of a club row (SORT_KEYS order, NULLs last; see nulls_last)"""
+    return nulls_last(row.get(key) for key in SORT_KEYS)
+
+
+class PayloadMemo:
+    """
+    Encoded responses of an immutable index, keyed by query
+
+    Keys come from request parameters (filters, cursor, page size), so the
+    memo is a bounded LRU rather than a plain dict.
+    """
+
+    def __init__(self, max_entries: int = PAYLOAD_MEMO_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, EncodedPayload] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple, build: Callable[[], object]) -> EncodedPayload:
+        """Get the encoded response for a query, encoding it on first use"""
+        payload = self._entries.get(key)
+        if payload is not None:
+            self._entries.move_to_end(key)
+            return payload
+        payload = self._entries[key] = encode_payload(build())
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return payload
+
+
+class ClubFilterIndex:
+    """
+    Immutable membership index over every club
+
+    Clubs are stored in list order, and each filter is an integer bitset over
+    those positions: one per major (from club_majors), one shared set of
+    is_all_majors clubs that belong to every major, and one of active clubs.
+    A filtered page is a couple of integer ANDs plus a walk over the set
+    bits from the cursor's position, so no query reaches Postgres.
+    """
+
+    def __init__(self, clubs: Iterable[dict], memberships: Iterable[dict]):
+        self.rows = sorted(clubs, key=sort_key)
+        self.keys = [sort_key(row) for row in self.rows]
+        self.positions = {str(row["id"]): i for i, row in enumerate(self.rows)}
+        self.all_bits = (1 << len(self.rows)) - 1
+        self.all_majors_bits = 0
+        self.active_bits = 0
+        for i, row in enumerate(self.rows):
+            if row.get("is_all_majors"):
+                self.all_majors_bits |= 1 << i
+            if row.get("is_active", True):
+                self.active_bits |= 1 << i
+
+        self.major_bits: dict[str, int] = {}
+        for membership in memberships:
+            position = self.positions.get(str(membership["club_id"]))
+            if position is not None:
+                major_id = str(membership["major_id"])
+                self.major_bits[major_id] = self.major_bits.get(major_id, 0) | 1 << position
+        self._payloads = PayloadMemo()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def matches(self, major_id: Optional[str] = None, is_active: Optional[bool] = None) -> int:
+        """
+        Get the bitset of clubs passing the filters
+
+        Args:
+            major_id: Major UUID (clubs linked to it, plus is_all_majors clubs)
+            is_active: Only active (True) or only inactive (False) clubs
+
+        Returns:
+            Bitset over club positions
+        """
+        bits = self.all_bits
+        if major_id is not None:
+            bits &= self.major_bits.get(major_id, 0) | self.all_majors_bits
+        if is_active is not None:
+            bits &= self.active_bits if is_active else ~self.active_bits
+        return bits
+
+    def contains(self, club_id: str, bits: int) -> bool:
+        """Whether a club is in a bitset from matches()"""
+        position = self.positions.get(str(club_id))
+        return position is not None and (bits >> position) & 1 == 1
+
+    def rows_for(self, bits: int) -> list[dict]:
+        """Rows of every club in a bitset, in list order"""
+        return [self.rows[i] for i in iter_bits(bits)]
+
+    def page(self, bits: int, after: Optional[list], limit: int) -> tuple[list[dict], bool]:
+        """
+        Get the rows of one page of a filtered list
+
+        Args:
+            bits: Bitset from matches()
+            after: Decoded cursor (sort-key values of the previous page's last row)
+            limit: Page size
+
+        Returns:
+            (rows, whether more rows follow)
+
+        Raises:
+            ValueError: If the cursor values cannot be compared with the sort keys
+        """
+        start = 0
+        if after is not None:
+            try:
+                start = bisect_right(self.keys, nulls_last(after))
+            except TypeError as e:
+                raise ValueError("Invalid cursor") from e
+
+        rows = []
+        for position in iter_bits(bits >> start):
+            if len(rows) == limit:
+                return rows, True
+            rows.append(self.rows[start + position])
+        return rows, False
+
+    def payload(self, key: tuple, build: Callable[[], object]) -> EncodedPayload:
+        """
+        Get a pre-encoded response for a query, encoding it on first use
+
+        Args:
+            key: Query key, e.g. ("page", major_id, True, cursor, 50)
+            build: Returns the JSON-compatible response content
+
+        Returns:
+            Encoded payload with its ETag
+        """
+        return self._payloads.get(key, build)
+
+
+class ClubFilters:
+    """
+    Club filter index kept in sync with Supabase
+
+    Statement triggers on clubs and club_majors bump per-table counters in
+    public.catalog_versions, including for writes made outside this API
+    (club requests, admin RPCs, cascades). The counters are polled at most
+    every CLUB_FILTER_VERSION_CHECK_SECONDS and the index is rebuilt when
+    they move. Writes made through this API invalidate it immediately.
+    """
+
+    def __init__(self, check_seconds: float = VERSION_CHECK_SECONDS):
+        self.check_seconds = check_seconds
+        self.index: Optional[ClubFilterIndex] = None
+        self._version: Optional[tuple] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def ensure_loaded(self, db: AsyncClient) -> ClubFilterIndex:
+        """
+        Build the index, or rebuild it if the tables changed since it was built
+
+        Concurrent callers wait for a single check or load.
+
+        Args:
+            db: Supabase client
+
+        Returns:
+            The current index
+        """
+        if self._fresh():
+            return self.index
+        async with self._lock:
+            if not self._fresh():
+                version = await self._fetch_version(db)
+                if self.index is None or version != self._version:
+                    clubs, memberships = await asyncio.gather(
+                        fetch_all(db, "clubs", "*", ("id",)),
+                        fetch_all(db, "club_majors", "club_id,major_id", ("club_id", "major_id")),
+                    )
+                    self.index = ClubFilterIndex(clubs, memberships)
+                    self._version = version
+                self._checked_at = time.monotonic()
+        return self.index
+
+    def _fresh(self) -> bool:
+        return self.index is not None and time.monotonic() - self._checked_at < self.check_seconds
+
+    async def _fetch_version(self, db: AsyncClient) -> tuple:
+        """Current change counters of the indexed tables"""
+        response = await (
+            db.table("catalog_versions")
+            .select("name,version")
+            .in_("name", VERSIONED_TABLES)
+            .execute()
+        )
+        return tuple(sorted((row["name"], row["version"]) for row in response.data))
+
+    def invalidate(self) -> None:
+        """Rebuild on the next request (after clubs or club_majors are written here)"""
+        self.index = None
+
+
+# Shared club filter index
+club_filters = ClubFilters()
@@ -0,0 +1,297 @@
+"""
+Club Bulk Import
+Streams NDJSON or CSV club rows, validates them and inserts them in batches
+"""
+import asyncio
+import codecs
+import csv
+import io
+import json
+from collections import Counter
+from typing import Any, AsyncIterator, Optional
+
+from postgrest.exceptions import APIError
+from pydantic import ValidationError
+from supabase import AsyncClient
+
+from app.core.config import get_tuning
+from app.models.club import ClubCreate
+from app.utils.slug import allocate_slugs, generate_slug, next_available_slug
+
+# Rows per multi-row insert
+IMPORT_BATCH_SIZE = 500
+
+# Postgres error code for unique constraint violations
+UNIQUE_VIOLATION = "23505"
+
+# Insert attempts per row, in the one-by-one retry, when a concurrent create claims its slug
+SLUG_INSERT_ATTEMPTS = get_tuning().slug_insert_attempts
+
+# Slugs per exact-match lookup and base slugs per prefix lookup (keeps PostgREST URLs short)
+SLUG_IN_CHUNK = 200
+SLUG_PREFIX_CHUNK = 50
+
+NDJSON_CONTENT_TYPES = {
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/jsonl",
+    "application/json-lines",
+}
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a byte stream into text lines without buffering the whole body
+
+    Args:
+        chunks: Raw request body chunks
+
+    Yields:
+        Decoded lines without line terminators (a UTF-8 BOM is dropped)
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, Any]]:
+    """
+    Parse NDJSON lines into records
+
+    Args:
+        lines: Text lines
+
+    Yields:
+        (row number, record dict) or (row number, ValueError) for bad lines
+    """
+    row = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("Row must be a JSON object")
+            yield row, record
+        except ValueError as e:
+            yield row, ValueError(f"Invalid JSON: {e}")
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, Any]]:
+    """
+    Parse CSV lines into records keyed by the header row
+
+    Quoted fields may span lines: lines are accumulated until the quotes
+    balance, then parsed as one row.
+
+    Args:
+        lines: Text lines
+
+    Yields:
+        (row number, record dict) or (row number, ValueError) for bad rows
+    """
+    header: Optional[list[str]] = None
+    pending = ""
+    row = 0
+    async for line in lines:
+        pending = f"{pending}\n{line}" if pending else line
+        if pending.count('"') % 2:
+            continue
+
+        text, pending = pending, ""
+        if not text.strip():
+            continue
+        values = next(csv.reader(io.StringIO(text)))
+
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+
+        row += 1
+        if len(values) != len(header):
+            yield row, ValueError(f"Expected {len(header)} columns, got {len(values)}")
+            continue
+        # Empty cells fall back to model defaults
+        yield row, {name: value for name, value in zip(header, values) if value != ""}
+
+    if pending.strip():
+        yield row + 1, ValueError("Unterminated quoted field")
+
+
+def _error_message(error: Exception) -> str:
+    """Flatten a validation or database error into one line"""
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" for e in error.errors()
+        )
+    if isinstance(error, APIError):
+        return error.message or str(error)
+    return str(error)
+
+
+async def _fetch_taken_slugs(db: AsyncClient, bases: list[str], duplicated: set[str]) -> set[str]:
+    """
+    Fetch existing slugs that could collide with the given bases
+
+    One `in` query finds which bases already exist; prefix lookups (base and
+    base-*) are only made for those, and for bases repeated within the import.
+
+    Args:
+        db: Supabase client
+        bases: Distinct base slugs in the batch (from generate_slug)
+        duplicated: Bases that occur more than once in the import
+
+    Returns:
+        Set of existing slugs
+    """
+    exact = await asyncio.gather(*(
+        db.table("clubs").select("slug").in_("slug", bases[start:start + SLUG_IN_CHUNK]).execute()
+        for start in range(0, len(bases), SLUG_IN_CHUNK)
+    ))
+    taken = {row["slug"] for response in exact for row in response.data}
+
+    prefixed = [base for base in bases if base in taken or base in duplicated]
+    suffixed = await asyncio.gather(*(
+        db.table("clubs").select("slug").or_(
+            ",".join(f"slug.like.{base}-*" for base in prefixed[start:start + SLUG_PREFIX_CHUNK])
+        ).execute()
+        for start in range(0, len(prefixed), SLUG_PREFIX_CHUNK)
+    ))
+    taken.update(row["slug"] for response in suffixed for row in response.data)
+    return taken
+
+
+async def _insert_batch(
+    db: AsyncClient, batch: list[tuple[int, ClubCreate]], claimed: set[str], seen_bases: set[str]
+) -> list[dict]:
+    """
+    Assign slugs to a batch of validated rows and insert them in one request
+
+    If the multi-row insert fails, rows are retried one by one so a single
+    bad row does not fail the whole batch (see _insert_one).
+
+    Args:
+        db: Supabase client
+        batch: (row number, validated club) pairs
+        claimed: Slugs assigned earlier in this import (updated in place)
+        seen_bases: Base slugs seen earlier in this import (updated in place)
+
+    Returns:
+        Per-row results
+    """
+    # Provided slugs are normalized too, since bases go into PostgREST prefix filters
+    bases = [
+        (generate_slug(club.slug) if club.slug else "") or generate_slug(club.name)
+        for _, club in batch
+    ]
+    counts = Counter(bases)
+    duplicated = {base for base in counts if base in seen_bases or counts[base] > 1}
+    seen_bases.update(bases)
+
+    taken = await _fetch_taken_slugs(db, sorted(set(bases)), duplicated)
+    slugs = allocate_slugs(bases, taken | claimed)
+    claimed.update(slugs)
+
+    records = [{**club.model_dump(), "slug": slug} for (_, club), slug in zip(batch, slugs)]
+    try:
+        response = await db.table("clubs").insert(records).execute()
+        return [
+            {"row": row, "status": "created", "id": created["id"], "slug": created["slug"]}
+            for (row, _), created in zip(batch, response.data)
+        ]
+    except APIError:
+        pass
+
+    results = []
+    for (row, _), record, base in zip(batch, records, bases):
+        results.append(await _insert_one(db, row, record, base, claimed))
+    return results
+
+
+async def _insert_one(
+    db: AsyncClient, row: int, record: dict, base: str, claimed: set[str]
+) -> dict:
+    """
+    Insert one club, re-allocating its slug if a concurrent create claimed it
+
+    Like create_club: on a unique violation the taken slugs for the base are
+    read again and the next free one is tried, up to SLUG_INSERT_ATTEMPTS.
+
+    Args:
+        db: Supabase client
+        row: Row number in the import
+        record: Insert payload (its slug is replaced on retry)
+        base: Base slug of the club
+        claimed: Slugs assigned earlier in this import (updated in place)
+
+    Returns:
+        Result for the row
+    """
+    error: Optional[APIError] = None
+    for attempt in range(SLUG_INSERT_ATTEMPTS):
+        if attempt:
+            taken = await _fetch_taken_slugs(db, [base], {base})
+            record = {**record, "slug": next_available_slug(base, taken | claimed)}
+            claimed.add(record["slug"])
+        try:
+            response = await db.table("clubs").insert(record).execute()
+        except APIError as e:
+            error = e
+            if e.code != UNIQUE_VIOLATION:
+                break
+            continue
+        created = response.data[0]
+        return {"row": row, "status": "created", "id": created["id"], "slug": created["slug"]}
+    return {"row": row, "status": "error", "error": _error_message(error)}
+
+
+async def import_clubs(db: AsyncClient, records: AsyncIterator[tuple[int, Any]]) -> dict:
+    """
+    Validate and insert streamed club records in batches
+
+    Args:
+        db: Supabase client
+        records: (row number, record dict or parse error) pairs
+
+    Returns:
+        Report with counts and one result per row, in row order
+    """
+    results: list[dict] = []
+    batch: list[tuple[int, ClubCreate]] = []
+    claimed: set[str] = set()
+    seen_bases: set[str] = set()
+
+    async for row, record in records:
+        if isinstance(record, Exception):
+            results.append({"row": row, "status": "error", "error": str(record)})
+            continue
+        try:
+            batch.append((row, ClubCreate.model_validate(record)))
+        except ValidationError as e:
+            results.append({"row": row, "status": "error", "error": _error_message(e)})
+            continue
+
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            results.extend(await _insert_batch(db, batch, claimed, seen_bases))
+            batch = []
+
+    if batch:
+        results.extend(await _insert_batch(db, batch, claimed, seen_bases))
+
+    results.sort(key=lambda result: result["row"])
+    created = sum(1 for result in results if result["status"] == "created")
+    return {
+        "total": len(results),
+        "created": created,
+        "failed": len(results) - created,
+        "results": results,
+    }
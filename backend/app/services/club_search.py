@@ -0,0 +1,326 @@
+"""
+Club Search
+In-memory inverted index with prefix and trigram (typo-tolerant) matching for club search
+"""
+import asyncio
+import heapq
+import re
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Any, Iterable, Optional
+
+from supabase import AsyncClient
+
+from app.core.config import get_tuning
+from app.db.sync import fetch_all
+
+# Field weights: a hit in the name counts three times a hit in the description
+FIELD_WEIGHTS = {"name": 3.0, "slug": 2.0, "tags": 2.0, "description": 1.0}
+
+# Score multipliers for how a query token matched an indexed token
+EXACT_MATCH = 1.0
+PREFIX_MATCH = 0.8
+FUZZY_MATCH = 0.6
+
+# Minimum trigram (Dice) similarity for a typo match, and shortest token to fuzz
+FUZZY_THRESHOLD = 0.45
+MIN_FUZZY_LENGTH = 3
+
+# Most vocabulary tokens a prefix may expand to (keeps one- and two-letter
+# keystrokes from scoring a large share of the vocabulary)
+MAX_PREFIX_EXPANSIONS = 64
+
+# Bonus when the whole query is a prefix of the club name
+NAME_PREFIX_BONUS = 2.0
+
+# Full reload interval, to pick up writes made outside this process
+SEARCH_REFRESH_SECONDS = get_tuning().club_search_refresh_seconds
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase and strip accents"""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: Any) -> list[str]:
+    """
+    Split text into lowercase alphanumeric tokens
+
+    Args:
+        text: A string, a list of strings (e.g. tags), or None
+
+    Returns:
+        Tokens in order of appearance
+    """
+    if not text:
+        return []
+    if isinstance(text, (list, tuple)):
+        text = " ".join(str(part) for part in text)
+    return _TOKEN_RE.findall(normalize(str(text)))
+
+
+def trigrams(token: str) -> set[str]:
+    """Trigrams of a token padded with boundary markers ("$ab", "abc", "bc$")"""
+    padded = f"${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def document_tokens(row: dict) -> dict[str, float]:
+    """Indexed tokens of a club row, each with the weight of the best field it appears in"""
+    weights: dict[str, float] = {}
+    for field, weight in FIELD_WEIGHTS.items():
+        for token in tokenize(row.get(field)):
+            weights[token] = max(weights.get(token, 0.0), weight)
+    return weights
+
+
+def with_tags(row: dict) -> dict:
+    """Flatten a club row selected with club_tags(tag) into a row with a tags list"""
+    row = dict(row)
+    row["tags"] = [tag["tag"] for tag in row.pop("club_tags", None) or []]
+    return row
+
+
+class SearchIndex:
+    """
+    Inverted index over club documents
+
+    Postings map each token to {club id: field weight}; a sorted vocabulary
+    answers prefix lookups with bisect, and a trigram index over the
+    vocabulary finds tokens within a few typos. Documents can be added,
+    replaced and removed one at a time; vocabulary entries are dropped once
+    no document uses them.
+    """
+
+    def __init__(self):
+        self.rows: dict[str, dict] = {}
+        self._doc_tokens: dict[str, dict[str, float]] = {}
+        self._names: dict[str, str] = {}
+        self._postings: dict[str, dict[str, float]] = defaultdict(dict)
+        self._vocabulary: list[str] = []
+        self._trigrams: dict[str, set[str]] = defaultdict(set)
+        self._expansions: dict[str, list[tuple[str, float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def upsert(self, row: dict) -> None:
+        """
+        Add or replace one club
+
+        Args:
+            row: Club row (must include id; name, slug, description and tags are indexed)
+        """
+        club_id = str(row["id"])
+        self.remove(club_id)
+
+        weights = document_tokens(row)
+        self.rows[club_id] = row
+        self._doc_tokens[club_id] = weights
+        self._names[club_id] = " ".join(tokenize(row.get("name")))
+        for token, weight in weights.items():
+            if token not in self._postings:
+                insort(self._vocabulary, token)
+                for gram in trigrams(token):
+                    self._trigrams[gram].add(token)
+            self._postings[token][club_id] = weight
+        self._expansions.clear()
+
+    def remove(self, club_id: str) -> None:
+        """
+        Remove one club (no-op if it is not indexed)
+
+        Args:
+            club_id: Club UUID
+        """
+        weights = self._doc_tokens.pop(club_id, None)
+        if weights is None:
+            return
+        del self.rows[club_id]
+        del self._names[club_id]
+        for token in weights:
+            postings = self._postings[token]
+            postings.pop(club_id, None)
+            if not postings:
+                del self._postings[token]
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+                for gram in trigrams(token):
+                    self._trigrams[gram].discard(token)
+                    if not self._trigrams[gram]:
+                        del self._trigrams[gram]
+        self._expansions.clear()
+
+    def _expand(self, token: str, prefix: bool) -> list[tuple[str, float]]:
+        """
+        Find indexed tokens matching a query token, with match multipliers
+
+        Exact and prefix matches come from the sorted vocabulary; tokens of
+        similar length sharing enough trigrams count as typo matches.
+        Expansions are memoized until the index changes.
+        """
+        key = f"{int(prefix)}{token}"
+        cached = self._expansions.get(key)
+        if cached is not None:
+            return cached
+
+        matches: dict[str, float] = {}
+        if token in self._postings:
+            matches[token] = EXACT_MATCH
+
+        if prefix:
+            vocabulary = self._vocabulary
+            i = bisect_left(vocabulary, token)
+            end = min(len(vocabulary), i + MAX_PREFIX_EXPANSIONS)
+            while i < end and vocabulary[i].startswith(token):
+                matches.setdefault(vocabulary[i], PREFIX_MATCH)
+                i += 1
+
+        if len(token) >= MIN_FUZZY_LENGTH:
+            grams = trigrams(token)
+            shared: dict[str, int] = defaultdict(int)
+            for gram in grams:
+                for candidate in self._trigrams.get(gram, ()):
+                    shared[candidate] += 1
+            for candidate, count in shared.items():
+                if candidate in matches or abs(len(candidate) - len(token)) > 2:
+                    continue
+                similarity = 2 * count / (len(grams) + len(candidate) + 2)
+                if similarity >= FUZZY_THRESHOLD:
+                    matches[candidate] = FUZZY_MATCH * similarity
+
+        result = sorted(matches.items(), key=lambda item: -item[1])
+        self._expansions[key] = result
+        return result
+
+    def search(
+        self, query: str, limit: int = 10, predicate=None
+    ) -> list[tuple[dict, float]]:
+        """
+        Rank clubs for a query
+
+        Every query token is matched exactly, as a typo, and (for the last
+        token, which the user may still be typing) as a prefix. Clubs that
+        match more query tokens rank first, then by score.
+
+        Args:
+            query: Search text
+            limit: Maximum number of results
+            predicate: Optional filter on club rows (e.g. active only)
+
+        Returns:
+            (club row, score) pairs, best first
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        scores: dict[str, float] = defaultdict(float)
+        matched: dict[str, int] = defaultdict(int)
+        for position, token in enumerate(tokens):
+            best: dict[str, float] = {}
+            for candidate, multiplier in self._expand(token, prefix=position == len(tokens) - 1):
+                for club_id, weight in self._postings[candidate].items():
+                    score = weight * multiplier
+                    if score > best.get(club_id, 0.0):
+                        best[club_id] = score
+            for club_id, score in best.items():
+                scores[club_id] += score
+                matched[club_id] += 1
+
+        phrase = " ".join(tokens)
+        results = []
+        for club_id, score in scores.items():
+            row = self.rows[club_id]
+            if predicate is not None and not predicate(row):
+                continue
+            if self._names[club_id].startswith(phrase):
+                score += NAME_PREFIX_BONUS
+            results.append((matched[club_id], score, row))
+
+        top = heapq.nsmallest(
+            limit, results, key=lambda item: (-item[0], -item[1], item[2].get("name") or "")
+        )
+        return [(row, round(score, 4)) for _, score, row in top]
+
+
+class ClubSearch:
+    """
+    Club search index kept in sync with Supabase
+
+    The index is loaded on first use (every club with its tags, paged past
+    PostgREST's row cap) and fully reloaded every
+    CLUB_SEARCH_REFRESH_SECONDS (to pick up writes made elsewhere). Club
+    writes made through this API update it incrementally in between.
+    """
+
+    def __init__(self, refresh_seconds: float = SEARCH_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self.index = SearchIndex()
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def ensure_loaded(self, db: AsyncClient) -> SearchIndex:
+        """
+        Load or refresh the index if it is missing or stale
+
+        Concurrent callers wait for a single load.
+
+        Args:
+            db: Supabase client
+
+        Returns:
+            The current index
+        """
+        if self._fresh():
+            return self.index
+        async with self._lock:
+            if not self._fresh():
+                rows = await fetch_all(db, "clubs", "*,club_tags(tag)", ("id",))
+                self.rebuild(with_tags(row) for row in rows)
+        return self.index
+
+    def _fresh(self) -> bool:
+        if self._loaded_at is None:
+            return False
+        return time.monotonic() - self._loaded_at < self.refresh_seconds
+
+    def rebuild(self, rows: Iterable[dict]) -> None:
+        """Replace the whole index"""
+        index = SearchIndex()
+        for row in rows:
+            index.upsert(row)
+        self.index = index
+        self._loaded_at = time.monotonic()
+
+    def upsert(self, rows: Iterable[dict]) -> None:
+        """
+        Apply created or updated clubs (ignored until the index is first loaded)
+
+        Rows written through the API carry no tags; an updated club keeps
+        the tags it was indexed with.
+        """
+        if self._loaded_at is None:
+            return
+        for row in rows:
+            if "tags" not in row:
+                indexed = self.index.rows.get(str(row["id"]))
+                row = {**row, "tags": indexed.get("tags", []) if indexed is not None else []}
+            self.index.upsert(row)
+
+    def remove(self, club_ids: Iterable[str]) -> None:
+        """Drop deleted clubs"""
+        for club_id in club_ids:
+            self.index.remove(str(club_id))
+
+    def invalidate(self) -> None:
+        """Force a full reload on the next search (e.g. after a bulk import)"""
+        self._loaded_at = None
+
+
+# Shared club search index
+club_search = ClubSearch()
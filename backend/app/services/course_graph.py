@@ -0,0 +1,311 @@
+"""
+Course Graph Engine
+Precomputed prerequisite indexes (topological order and transitive closures as bitsets)
+"""
+import json
+from collections import deque
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from app.models.course import Course, CourseGraph
+from app.utils.serialization import EncodedPayload, encode_payload
+
+# Course data, one CourseGraph JSON file per major (file name is the major slug)
+COURSE_DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "courses"
+
+# Index key for the combined catalog of every major
+CATALOG = "all"
+
+
+class CourseGraphError(ValueError):
+    """Raised when a course graph is invalid (unknown prerequisite or cycle)"""
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Yield the positions of the set bits of a bitset, lowest first"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class CourseGraphIndex:
+    """
+    Immutable prerequisite index over one course graph
+
+    Courses are stored in topological order (prerequisites before the
+    courses that need them), and each course is identified by its position.
+    Direct and transitive prerequisite/dependent sets are Python ints used as
+    bitsets over those positions, so set queries are a handful of integer
+    operations and results come out already topologically sorted.
+    """
+
+    def __init__(self, graph: CourseGraph):
+        by_id: dict[str, Course] = {}
+        for course in graph.courses:
+            if course.id in by_id:
+                raise CourseGraphError(f"Duplicate course id '{course.id}'")
+            by_id[course.id] = course
+        for course in graph.courses:
+            for prerequisite in course.prerequisites:
+                if prerequisite not in by_id:
+                    raise CourseGraphError(
+                        f"Course '{course.id}' requires unknown course '{prerequisite}'"
+                    )
+
+        self.courses: list[Course] = [by_id[course_id] for course_id in _topological_order(by_id)]
+        self.positions: dict[str, int] = {course.id: i for i, course in enumerate(self.courses)}
+        self.rows: list[dict] = [course.model_dump(mode="json") for course in self.courses]
+
+        size = len(self.courses)
+        self.prerequisite_bits: list[int] = [0] * size
+        self.dependent_bits: list[int] = [0] * size
+        self.ancestor_bits: list[int] = [0] * size
+        self.descendant_bits: list[int] = [0] * size
+
+        for i, course in enumerate(self.courses):
+            for prerequisite in set(course.prerequisites):
+                p = self.positions[prerequisite]
+                self.prerequisite_bits[i] |= 1 << p
+                self.dependent_bits[p] |= 1 << i
+                # Prerequisites come earlier in topological order, so their
+                # ancestor sets are already complete
+                self.ancestor_bits[i] |= self.ancestor_bits[p] | (1 << p)
+
+        for i in reversed(range(size)):
+            for d in iter_bits(self.dependent_bits[i]):
+                self.descendant_bits[i] |= self.descendant_bits[d] | (1 << d)
+
+        self._payloads: dict[tuple, EncodedPayload] = {}
+
+    def __len__(self) -> int:
+        return len(self.courses)
+
+    def __contains__(self, course_id: str) -> bool:
+        return course_id in self.positions
+
+    @property
+    def order(self) -> list[str]:
+        """Course IDs in topological order"""
+        return [course.id for course in self.courses]
+
+    def position(self, course_id: str) -> int:
+        """
+        Get a course's position in the index
+
+        Raises:
+            KeyError: If the course is not in this graph
+        """
+        return self.positions[course_id]
+
+    def bits_for(self, course_ids: Iterable[str]) -> int:
+        """Build a bitset from course IDs (unknown IDs are ignored)"""
+        bits = 0
+        for course_id in course_ids:
+            position = self.positions.get(course_id)
+            if position is not None:
+                bits |= 1 << position
+        return bits
+
+    def ids(self, bits: int) -> list[str]:
+        """Course IDs of a bitset, in topological order"""
+        return [self.courses[i].id for i in iter_bits(bits)]
+
+    def rows_for(self, bits: int) -> list[dict]:
+        """Course rows of a bitset, in topological order"""
+        return [self.rows[i] for i in iter_bits(bits)]
+
+    def prerequisites(self, course_id: str, transitive: bool = False) -> int:
+        """Bitset of a course's direct (or all transitive) prerequisites"""
+        i = self.position(course_id)
+        return self.ancestor_bits[i] if transitive else self.prerequisite_bits[i]
+
+    def unlocks(self, course_id: str, transitive: bool = False) -> int:
+        """Bitset of the courses that directly (or eventually) require a course"""
+        i = self.position(course_id)
+        return self.descendant_bits[i] if transitive else self.dependent_bits[i]
+
+    def payload(self, key: tuple, build: Callable[[], object]) -> EncodedPayload:
+        """
+        Get a pre-encoded response for a query, encoding it on first use
+
+        The index is immutable, so every query result can be encoded once
+        and served from memory afterwards.
+
+        Args:
+            key: Query key, e.g. ("prerequisites", "cse-030", True)
+            build: Returns the JSON-compatible response content
+
+        Returns:
+            Encoded payload with its ETag
+        """
+        payload = self._payloads.get(key)
+        if payload is None:
+            payload = self._payloads[key] = encode_payload(build())
+        return payload
+
+
+def _topological_order(by_id: dict[str, Course]) -> list[str]:
+    """
+    Order courses so prerequisites come first (Kahn's algorithm)
+
+    Courses that become ready together keep their file order, so the
+    result is deterministic.
+
+    Raises:
+        CourseGraphError: If the prerequisites contain a cycle
+    """
+    remaining = {course_id: len(set(course.prerequisites)) for course_id, course in by_id.items()}
+    dependents: dict[str, list[str]] = {course_id: [] for course_id in by_id}
+    for course_id, course in by_id.items():
+        for prerequisite in set(course.prerequisites):
+            dependents[prerequisite].append(course_id)
+
+    ready = deque(course_id for course_id, count in remaining.items() if count == 0)
+    order: list[str] = []
+    while ready:
+        course_id = ready.popleft()
+        order.append(course_id)
+        for dependent in dependents[course_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+
+    if len(order) < len(by_id):
+        raise CourseGraphError(f"Prerequisite cycle: {' -> '.join(_find_cycle(by_id, set(order)))}")
+    return order
+
+
+def _find_cycle(by_id: dict[str, Course], acyclic: set[str]) -> list[str]:
+    """Follow prerequisites among the unordered courses until one repeats"""
+    course_id = next(course_id for course_id in by_id if course_id not in acyclic)
+    path: list[str] = []
+    seen: dict[str, int] = {}
+    while course_id not in seen:
+        seen[course_id] = len(path)
+        path.append(course_id)
+        course_id = next(p for p in by_id[course_id].prerequisites if p not in acyclic)
+    return path[seen[course_id]:] + [course_id]
+
+
+def _requires(by_id: dict[str, Course], course_id: str, target: str) -> bool:
+    """Whether a course requires target, directly or transitively"""
+    stack = [course_id]
+    seen = {course_id}
+    while stack:
+        current = stack.pop()
+        if current == target:
+            return True
+        for prerequisite in by_id[current].prerequisites if current in by_id else ():
+            if prerequisite not in seen:
+                seen.add(prerequisite)
+                stack.append(prerequisite)
+    return False
+
+
+def merge_graphs(
+    graphs: dict[str, CourseGraph], conflicts: Optional[list[str]] = None
+) -> CourseGraph:
+    """
+    Combine per-major graphs into one catalog graph
+
+    Majors share course IDs (e.g. "math-021"). The first major (by slug)
+    provides a shared course's details, and its prerequisites are the union
+    across majors. Majors can disagree on direction (one lists A before B,
+    another B before A), which no single graph shows: a prerequisite that
+    would close such a cycle is left out of the combined graph, so the
+    earlier major's order wins and each major's own graph is unaffected.
+
+    Args:
+        graphs: Course graphs keyed by major slug
+        conflicts: Optional list that receives a description of each
+            prerequisite left out
+
+    Returns:
+        Combined course graph (acyclic if every major's graph is)
+    """
+    merged: dict[str, Course] = {}
+    for major in sorted(graphs):
+        for course in graphs[major].courses:
+            if course.id not in merged:
+                merged[course.id] = course.model_copy(update={"prerequisites": []})
+        for course in graphs[major].courses:
+            existing = merged[course.id]
+            for prerequisite in course.prerequisites:
+                if prerequisite in existing.prerequisites:
+                    continue
+                if _requires(merged, prerequisite, course.id):
+                    if conflicts is not None:
+                        conflicts.append(
+                            f"{major}: {course.id} requires {prerequisite}, "
+                            f"but {prerequisite} already requires {course.id} in an earlier major"
+                        )
+                    continue
+                existing.prerequisites.append(prerequisite)
+    return CourseGraph(courses=list(merged.values()))
+
+
+class CourseCatalog:
+    """
+    Course graph indexes for every major, plus the combined catalog
+
+    merge_conflicts lists prerequisites left out of the combined catalog
+    because majors order the same courses differently (see merge_graphs).
+    """
+
+    def __init__(self, graphs: dict[str, CourseGraph]):
+        self.majors: dict[str, CourseGraphIndex] = {}
+        self.merge_conflicts: list[str] = []
+        for major, graph in sorted(graphs.items()):
+            try:
+                self.majors[major] = CourseGraphIndex(graph)
+            except CourseGraphError as e:
+                raise CourseGraphError(f"{major}: {e}")
+        self.catalog = CourseGraphIndex(merge_graphs(graphs, self.merge_conflicts))
+
+    def get(self, major: Optional[str] = None) -> Optional[CourseGraphIndex]:
+        """
+        Get the index for a major, or the combined catalog
+
+        Args:
+            major: Major slug, or None / "all" for the combined catalog
+
+        Returns:
+            The index, or None if the major is unknown
+        """
+        if major is None or major == CATALOG:
+            return self.catalog
+        return self.majors.get(major)
+
+
+def load_course_graphs(directory: Path = COURSE_DATA_DIR) -> dict[str, CourseGraph]:
+    """
+    Read and validate every course graph file in a directory
+
+    Args:
+        directory: Folder of <major-slug>.json files
+
+    Returns:
+        Course graphs keyed by major slug
+    """
+    return {
+        path.stem: CourseGraph.model_validate(json.loads(path.read_text(encoding="utf-8")))
+        for path in sorted(directory.glob("*.json"))
+    }
+
+
+_catalog: Optional[CourseCatalog] = None
+
+
+def get_course_catalog() -> CourseCatalog:
+    """
+    Get the shared course catalog, building it on first use
+
+    Raises:
+        CourseGraphError: If a course graph is invalid
+    """
+    global _catalog
+
+    if _catalog is None:
+        _catalog = CourseCatalog(load_course_graphs())
+    return _catalog
@@ -0,0 +1,141 @@
+"""
+Image Renditions
+Resizes club logos and banners into modern formats on a process pool
+"""
+import asyncio
+import io
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from PIL import Image, ImageOps, features
+
+from app.core.config import get_tuning
+from app.utils.images import MAX_IMAGE_DIMENSION, ImageValidationError
+
+# Rendition widths in pixels (logos are square, banners keep their aspect ratio)
+LOGO_WIDTHS = (64, 128, 256)
+BANNER_WIDTHS = (640, 1280)
+
+# Encoder settings per output format
+ENCODE_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "avif": {"format": "AVIF", "quality": 60, "speed": 6},
+}
+
+MIME_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+
+# Worker processes for encoding (CPU-bound, so it must stay off the event loop)
+RENDITION_WORKERS = get_tuning().rendition_workers
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+@dataclass(frozen=True)
+class Rendition:
+    """One resized, re-encoded copy of an image"""
+    width: int
+    height: int
+    format: str
+    data: bytes
+
+    @property
+    def mime_type(self) -> str:
+        return MIME_TYPES[self.format]
+
+
+def available_formats() -> tuple[str, ...]:
+    """Return the output formats supported by this Pillow build (AVIF is optional)"""
+    return tuple(fmt for fmt in ENCODE_OPTIONS if fmt != "avif" or features.check("avif"))
+
+
+def rendition_widths(widths: tuple[int, ...], source_width: int) -> list[int]:
+    """
+    Get the widths actually produced for a source image
+
+    Images are never upscaled: widths larger than the original are clamped
+    to the original width (and deduplicated).
+
+    Args:
+        widths: Requested widths in pixels
+        source_width: Width of the original image
+
+    Returns:
+        Distinct output widths, largest first
+    """
+    return sorted({min(width, source_width) for width in widths}, reverse=True)
+
+
+def render(data: bytes, widths: tuple[int, ...], formats: tuple[str, ...]) -> list[Rendition]:
+    """
+    Resize an image to each width and encode it in each format
+
+    Runs in a worker process. Output widths follow rendition_widths().
+
+    Args:
+        data: Original image bytes (already validated)
+        widths: Target widths in pixels
+        formats: Output formats (keys of ENCODE_OPTIONS)
+
+    Returns:
+        Renditions for every (width, format) pair
+
+    Raises:
+        ImageValidationError: If the image cannot be decoded
+    """
+    Image.MAX_IMAGE_PIXELS = MAX_IMAGE_DIMENSION * MAX_IMAGE_DIMENSION
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            # Let the JPEG decoder downscale while decoding when possible
+            source.draft("RGB", (max(widths), max(widths)))
+            image = ImageOps.exif_transpose(source)
+            image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+    except (OSError, ValueError, SyntaxError, Image.DecompressionBombError) as e:
+        raise ImageValidationError("Image could not be decoded") from e
+
+    renditions = []
+    for width in rendition_widths(widths, image.width):
+        height = max(1, round(image.height * width / image.width))
+        resized = image if (width, height) == image.size else image.resize(
+            (width, height), Image.Resampling.LANCZOS, reducing_gap=3.0
+        )
+        for fmt in formats:
+            buffer = io.BytesIO()
+            resized.save(buffer, **ENCODE_OPTIONS[fmt])
+            renditions.append(
+                Rendition(width=width, height=height, format=fmt, data=buffer.getvalue())
+            )
+    return renditions
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Get or create the shared rendition process pool"""
+    global _pool
+
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=RENDITION_WORKERS)
+    return _pool
+
+
+async def generate_renditions(data: bytes, widths: tuple[int, ...]) -> list[Rendition]:
+    """
+    Produce renditions of an image on the process pool
+
+    Args:
+        data: Original image bytes (already validated)
+        widths: Target widths in pixels
+
+    Returns:
+        Renditions for every width in every available format
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_pool(), render, data, widths, available_formats())
+
+
+def shutdown_pool() -> None:
+    """Stop the rendition worker processes"""
+    global _pool
+
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
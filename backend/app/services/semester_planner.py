@@ -0,0 +1,220 @@
+"""
+Semester Planner
+Schedules a major's remaining courses into as few semesters as possible
+"""
+from typing import Optional
+
+from app.core.config import get_tuning
+from app.db.cache import TTLCache
+from app.models.course import PlanRequest, Semester
+from app.services.course_graph import CourseGraphIndex, iter_bits
+from app.utils.serialization import EncodedPayload, encode_payload
+
+TERMS = (Semester.FALL, Semester.SPRING)
+
+# Plans keyed by (major, completed courses, options); students toggling
+# courses back and forth hit the same keys
+plan_cache = TTLCache(
+    ttl_seconds=get_tuning().plan_cache_ttl_seconds,
+    max_entries=get_tuning().plan_cache_max_entries,
+    max_bytes=get_tuning().plan_cache_max_bytes,
+)
+
+
+class PlanError(ValueError):
+    """Raised when the remaining courses cannot be scheduled under the given limits"""
+
+
+class SemesterPlanner:
+    """
+    Critical-path list scheduler over one major's CourseGraphIndex
+
+    Everything that does not depend on the student is computed once per
+    major: per-term offering bitsets and, for strict and relaxed offering,
+    each course's height (semesters from taking it to finishing everything
+    it unlocks) and the resulting priority order. A plan then only walks
+    that order once per semester with bitset checks, so replanning after a
+    student toggles a course is cheap, and repeated states come from
+    plan_cache.
+
+    Minimum-length scheduling with per-semester caps is NP-hard; scheduling
+    the longest remaining prerequisite chain first is the standard heuristic
+    and is optimal when the cap never binds.
+    """
+
+    def __init__(self, major: str, index: CourseGraphIndex):
+        self.major = major
+        self.index = index
+        self.term_bits = {
+            term: index.bits_for(course.id for course in index.courses if course.semester == term)
+            for term in TERMS
+        }
+        self.category_bits = index.bits_for(
+            course.id for course in index.courses if course.is_category
+        )
+        self.heights = {strict: self._heights(strict) for strict in (True, False)}
+        self.priority = {
+            strict: sorted(range(len(index)), key=lambda i: (-heights[i], i))
+            for strict, heights in self.heights.items()
+        }
+
+    def _gap(self, course: int, dependent: int, strict: bool) -> int:
+        """Semesters between taking a course and the earliest start of a dependent"""
+        if strict and self.index.courses[course].semester == self.index.courses[dependent].semester:
+            return 2
+        return 1
+
+    def _heights(self, strict: bool) -> list[int]:
+        """Semesters from taking each course to finishing all of its dependents"""
+        heights = [1] * len(self.index)
+        for i in reversed(range(len(self.index))):
+            for d in iter_bits(self.index.dependent_bits[i]):
+                heights[i] = max(heights[i], self._gap(i, d, strict) + heights[d])
+        return heights
+
+    def critical_path(self, remaining: int, strict: bool) -> list[str]:
+        """Longest prerequisite chain among the remaining courses"""
+        heights = self.heights[strict]
+        prerequisite_bits = self.index.prerequisite_bits
+        candidates = [i for i in iter_bits(remaining) if not prerequisite_bits[i] & remaining]
+        if not candidates:
+            return []
+
+        path = [max(candidates, key=lambda i: (heights[i], -i))]
+        while True:
+            current = path[-1]
+            dependents = list(iter_bits(self.index.dependent_bits[current] & remaining))
+            if not dependents:
+                break
+            path.append(
+                max(dependents, key=lambda d: (heights[d] + self._gap(current, d, strict), -d))
+            )
+        return [self.index.courses[i].id for i in path]
+
+    def plan(self, request: PlanRequest) -> dict:
+        """
+        Schedule every course that is not completed yet
+
+        Each semester takes the available courses (all prerequisites done
+        in earlier semesters, offered that term) with the longest remaining
+        chains first, until the course or unit cap is reached.
+
+        Args:
+            request: Completed courses and scheduling limits
+
+        Returns:
+            SemesterPlan-shaped dictionary
+
+        Raises:
+            PlanError: If a course exceeds the unit cap or can never be scheduled
+        """
+        index = self.index
+        strict = request.strict_offering
+        unknown = [course_id for course_id in request.completed if course_id not in index]
+
+        done = index.bits_for(request.completed)
+        if not request.include_categories:
+            done |= self.category_bits
+        remaining = ((1 << len(index)) - 1) & ~done
+
+        units = [request.units.get(course.id, request.units_per_course) for course in index.courses]
+        if request.max_units is not None:
+            too_large = [
+                index.courses[i].id for i in iter_bits(remaining) if units[i] > request.max_units
+            ]
+            if too_large:
+                raise PlanError(
+                    f"Courses exceed max_units={request.max_units}: {', '.join(too_large)}"
+                )
+
+        critical_path = self.critical_path(remaining, strict)
+        start = TERMS.index(request.start_semester)
+        semesters = []
+        idle = 0
+        while remaining:
+            term = TERMS[(start + len(semesters)) % 2]
+            offered = self.term_bits[term] if strict else remaining
+            chosen = 0
+            count = 0
+            total_units = 0
+            for i in self.priority[strict]:
+                bit = 1 << i
+                if not remaining & bit & offered or index.prerequisite_bits[i] & ~done:
+                    continue
+                if request.max_units is not None and total_units + units[i] > request.max_units:
+                    continue
+                chosen |= bit
+                count += 1
+                total_units += units[i]
+                if count == request.max_courses:
+                    break
+
+            # A course offered in neither of two consecutive terms can never be taken
+            idle = idle + 1 if not chosen else 0
+            if idle == 2:
+                raise PlanError(f"Courses cannot be scheduled: {', '.join(index.ids(remaining))}")
+
+            semesters.append({
+                "number": len(semesters) + 1,
+                "semester": term.value,
+                "courses": index.ids(chosen),
+                "units": total_units,
+            })
+            done |= chosen
+            remaining &= ~chosen
+
+        return {
+            "major": self.major,
+            "semesters": semesters,
+            "semester_count": len(semesters),
+            "critical_path": critical_path,
+            "unknown_courses": unknown,
+        }
+
+    def plan_payload(self, request: PlanRequest) -> EncodedPayload:
+        """
+        Get an encoded plan, reusing the cached plan for the same state
+
+        Args:
+            request: Completed courses and scheduling limits
+
+        Returns:
+            Encoded SemesterPlan with its ETag
+        """
+        key = (
+            self.major,
+            self.index.bits_for(request.completed),
+            tuple(sorted(set(request.completed) - set(self.index.positions))),
+            request.max_courses,
+            request.max_units,
+            request.units_per_course,
+            tuple(sorted(request.units.items())),
+            request.start_semester,
+            request.strict_offering,
+            request.include_categories,
+        )
+        payload = plan_cache.get(key)
+        if payload is None:
+            payload = encode_payload(self.plan(request))
+            plan_cache.set(key, payload)
+        return payload
+
+
+_planners: dict[str, SemesterPlanner] = {}
+
+
+def get_planner(major: str, index: CourseGraphIndex) -> SemesterPlanner:
+    """
+    Get the planner for a major's index, building it on first use
+
+    Args:
+        major: Major slug
+        index: The major's course graph index
+
+    Returns:
+        Shared planner for that index
+    """
+    planner: Optional[SemesterPlanner] = _planners.get(major)
+    if planner is None or planner.index is not index:
+        planner = _planners[major] = SemesterPlanner(major, index)
+    return planner
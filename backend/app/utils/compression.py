@@ -0,0 +1,152 @@
+"""
+Compression utilities
+Precompressed (gzip / brotli) variants of encoded payloads and Accept-Encoding negotiation
+"""
+import asyncio
+import gzip
+from dataclasses import replace
+from typing import Iterable, Optional
+
+from app.core.config import get_tuning
+from app.utils.serialization import EncodedPayload
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional, gzip is used without it
+    brotli = None
+
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_BYTES = get_tuning().compress_min_bytes
+
+# Compression levels: payloads are compressed once and served many times, so
+# precompression uses the strongest settings
+GZIP_LEVEL = get_tuning().compress_gzip_level
+BROTLI_QUALITY = get_tuning().compress_brotli_quality
+
+# Levels for compression done while a request waits (responses compressed on
+# the fly, and cached payloads compressed on their first compressed request)
+DYNAMIC_GZIP_LEVEL = get_tuning().compress_dynamic_gzip_level
+DYNAMIC_BROTLI_QUALITY = get_tuning().compress_dynamic_brotli_quality
+
+# Bodies at least this large are compressed in a worker thread, off the event loop
+THREAD_COMPRESS_BYTES = get_tuning().compress_thread_min_bytes
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Content codings this process can produce, most preferred first"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Compress a body with one content coding
+
+    Args:
+        body: Uncompressed bytes
+        encoding: "br" or "gzip"
+        level: Brotli quality or gzip level (defaults to the precompression settings)
+
+    Returns:
+        Compressed bytes
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY if level is None else level)
+    # mtime=0 keeps the output deterministic
+    return gzip.compress(body, compresslevel=GZIP_LEVEL if level is None else level, mtime=0)
+
+
+async def compress_dynamic(body: bytes, encoding: str) -> bytes:
+    """
+    Compress a body at the dynamic levels, in a worker thread if it is large
+
+    Args:
+        body: Uncompressed bytes
+        encoding: "br" or "gzip"
+
+    Returns:
+        Compressed bytes
+    """
+    level = DYNAMIC_BROTLI_QUALITY if encoding == "br" else DYNAMIC_GZIP_LEVEL
+    if len(body) >= THREAD_COMPRESS_BYTES:
+        return await asyncio.to_thread(compress, body, encoding, level)
+    return compress(body, encoding, level)
+
+
+async def payload_variant(payload: EncodedPayload, encoding: str) -> bytes:
+    """
+    Get a payload's body in one content coding, compressing it on first use
+
+    The compressed bytes are kept in the payload's `encodings`, so a payload
+    held in a cache is compressed once per coding rather than per request.
+
+    Args:
+        payload: Encoded payload
+        encoding: "br" or "gzip"
+
+    Returns:
+        Compressed bytes
+    """
+    variant = payload.encodings.get(encoding)
+    if variant is None:
+        variant = await compress_dynamic(payload.body, encoding)
+        payload.encodings[encoding] = variant
+    return variant
+
+
+def precompress(payload: EncodedPayload) -> EncodedPayload:
+    """
+    Attach compressed variants to an encoded payload
+
+    Variants that do not shrink the body are dropped.
+
+    Args:
+        payload: Encoded payload
+
+    Returns:
+        The payload with `encodings` filled in (unchanged if the body is small)
+    """
+    if len(payload.body) < MIN_COMPRESS_BYTES:
+        return payload
+
+    encodings = {}
+    for encoding in available_encodings():
+        compressed = compress(payload.body, encoding)
+        if len(compressed) < len(payload.body):
+            encodings[encoding] = compressed
+    return replace(payload, encodings=encodings)
+
+
+def negotiate(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """
+    Pick a content coding from an Accept-Encoding header
+
+    Args:
+        accept_encoding: Accept-Encoding header value (or None)
+        available: Codings the server can send, most preferred first
+
+    Returns:
+        The coding to use, or None for the identity (uncompressed) body
+    """
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+
+    best = None
+    best_weight = 0.0
+    for coding in available:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
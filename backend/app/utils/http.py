@@ -0,0 +1,182 @@
+"""
+HTTP caching utilities
+Conditional GET support (ETag / Last-Modified / 304) for JSON endpoints
+"""
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from starlette.types import Receive, Scope, Send
+
+from app.core.config import get_tuning
+from app.utils.compression import (
+    MIN_COMPRESS_BYTES,
+    available_encodings,
+    negotiate,
+    payload_variant,
+)
+from app.utils.serialization import EncodedPayload
+
+# Cache-Control header per route, overridable with environment variables
+CACHE_CONTROL = {
+    "clubs.list": get_tuning().cache_control_clubs_list,
+    "clubs.detail": get_tuning().cache_control_clubs_detail,
+    "majors.list": get_tuning().cache_control_majors_list,
+    "majors.detail": get_tuning().cache_control_majors_detail,
+    "courses": get_tuning().cache_control_courses,
+    "careers": get_tuning().cache_control_careers,
+}
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """
+    Parse a Supabase timestamp (ISO 8601 string or datetime)
+
+    Args:
+        value: Timestamp value from a database row
+
+    Returns:
+        Timezone-aware datetime, or None if the value is missing or invalid
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def row_last_modified(row: dict) -> Optional[datetime]:
+    """
+    Get the Last-Modified time of a single row
+
+    Only `updated_at` is used: `created_at` does not change on edits, so it
+    would let clients keep a stale copy after an update.
+
+    Args:
+        row: Database row
+
+    Returns:
+        Last modification time, or None if the row has no updated_at
+    """
+    return parse_timestamp(row.get("updated_at"))
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    """Check an If-Modified-Since header against a Last-Modified time"""
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    Evaluate conditional request headers
+
+    If-None-Match takes precedence; If-Modified-Since is only checked when
+    If-None-Match is absent (RFC 9110).
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+        last_modified: Current modification time of the resource (optional)
+
+    Returns:
+        True if the client's copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        return _not_modified_since(if_modified_since, last_modified)
+
+    return False
+
+
+class PayloadResponse(Response):
+    """
+    200 response for an EncodedPayload in a negotiated content coding
+
+    The compressed body is taken from the payload's variants, or compressed
+    when the response is sent (off the event loop for large bodies) and kept
+    on the payload for the next request.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, payload: EncodedPayload, encoding: Optional[str], headers: dict):
+        self.payload = payload
+        self.encoding = encoding
+        super().__init__(content=payload.body, headers=headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.encoding is not None:
+            self.body = await payload_variant(self.payload, self.encoding)
+            self.headers["Content-Length"] = str(len(self.body))
+        await super().__call__(scope, receive, send)
+
+
+def conditional_response(
+    request: Request, payload: EncodedPayload, cache_control: str, headers: Optional[dict] = None
+) -> Response:
+    """
+    Serve a pre-encoded JSON payload, honoring conditional GET headers
+
+    Payloads of at least COMPRESS_MIN_BYTES (or carrying precompressed
+    variants) are sent in the best coding the client accepts, with
+    Content-Encoding. Each coding gets its own ETag (e.g. "<hash>-br"),
+    since the bytes differ.
+
+    Args:
+        request: Incoming request
+        payload: Encoded body with its ETag (see app.utils.serialization)
+        cache_control: Cache-Control header value for this route
+        headers: Extra response headers (e.g. X-Snapshot-Age)
+
+    Returns:
+        304 Not Modified if the client's copy is current, otherwise a 200
+        JSON response, both with ETag and Cache-Control headers
+    """
+    etag = payload.etag
+    encoding = None
+    headers = {**(headers or {}), "Cache-Control": cache_control}
+    if len(payload.body) >= MIN_COMPRESS_BYTES:
+        codings = available_encodings()
+    else:
+        codings = tuple(payload.encodings)
+    if codings:
+        headers["Vary"] = "Accept-Encoding"
+        encoding = negotiate(request.headers.get("accept-encoding"), codings)
+        if encoding is not None:
+            etag = f'{etag[:-1]}-{encoding}"'
+            headers["Content-Encoding"] = encoding
+    headers["ETag"] = etag
+    if payload.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            payload.last_modified.astimezone(timezone.utc), usegmt=True
+        )
+
+    if is_not_modified(request, etag, payload.last_modified):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+
+    return PayloadResponse(payload, encoding, headers)
@@ -0,0 +1,251 @@
+"""
+Image upload utilities
+Size-capped chunked reads and header-only type/dimension detection
+"""
+import struct
+from dataclasses import dataclass
+
+from fastapi import UploadFile
+
+# Maximum size of a club logo or banner upload
+MAX_IMAGE_BYTES = 2 * 1024 * 1024
+
+# Read uploads in chunks of this size
+CHUNK_SIZE = 64 * 1024
+
+# Reject images larger than this on either side (decompression bomb guard)
+MAX_IMAGE_DIMENSION = 8192
+
+# Accepted aspect ratios (width / height), matching the admin upload form
+LOGO_ASPECT_RATIOS = [(0.9, 1.1)]
+BANNER_ASPECT_RATIOS = [(1.6, 2.0), (2.8, 3.2)]
+
+# EXIF orientations (tag 0x0112) that turn the image by 90 degrees, swapping width and height
+TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+class ImageValidationError(ValueError):
+    """Raised when an upload is not an acceptable image"""
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    """
+    Image type and dimensions read from the file header
+
+    width and height are as displayed, i.e. after the EXIF orientation is
+    applied (renditions are sized from the transposed image too).
+    """
+    mime_type: str
+    extension: str
+    width: int
+    height: int
+    orientation: int = 1
+
+
+def sniff_image_type(header: bytes) -> tuple[str, str]:
+    """
+    Detect the image type from magic bytes
+
+    Args:
+        header: First bytes of the file (at least 12)
+
+    Returns:
+        Tuple of (mime type, file extension)
+
+    Raises:
+        ImageValidationError: If the bytes are not a PNG, JPEG or WebP image
+    """
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png", "png"
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg", "jpg"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp", "webp"
+    raise ImageValidationError("File must be a PNG, JPEG or WebP image")
+
+
+def _exif_orientation(tiff: bytes) -> int:
+    """Read the orientation tag from EXIF data (a TIFF structure); 1 if absent or invalid"""
+    if tiff.startswith(b"Exif\x00\x00"):
+        tiff = tiff[6:]
+    order = {b"II": "<", b"MM": ">"}.get(tiff[:2])
+    if order is None or len(tiff) < 8:
+        return 1
+    (ifd,) = struct.unpack(order + "I", tiff[4:8])
+    if ifd + 2 > len(tiff):
+        return 1
+    (count,) = struct.unpack(order + "H", tiff[ifd:ifd + 2])
+    for entry in range(ifd + 2, min(ifd + 2 + count * 12, len(tiff) - 11), 12):
+        tag, kind = struct.unpack(order + "HH", tiff[entry:entry + 4])
+        # Orientation is one SHORT, stored in the first bytes of the value field
+        if tag == 0x0112 and kind == 3:
+            (value,) = struct.unpack(order + "H", tiff[entry + 8:entry + 10])
+            return value if 1 <= value <= 8 else 1
+    return 1
+
+
+def _png_header(data: bytes) -> tuple[int, int, int]:
+    """Read width/height from the PNG IHDR chunk and the orientation from an eXIf chunk"""
+    if len(data) < 24 or data[12:16] != b"IHDR":
+        raise ImageValidationError("Invalid PNG header")
+    width, height = struct.unpack(">II", data[16:24])
+    # eXIf must come before the image data
+    offset = 8
+    while offset + 8 <= len(data):
+        (length,) = struct.unpack(">I", data[offset:offset + 4])
+        chunk = data[offset + 4:offset + 8]
+        if chunk in (b"IDAT", b"IEND"):
+            break
+        if chunk == b"eXIf":
+            return width, height, _exif_orientation(data[offset + 8:offset + 8 + length])
+        offset += 12 + length
+    return width, height, 1
+
+
+def _jpeg_header(data: bytes) -> tuple[int, int, int]:
+    """Walk JPEG markers up to the first start-of-frame segment, noting the EXIF orientation"""
+    orientation = 1
+    offset = 2
+    while offset + 4 <= len(data):
+        if data[offset] != 0xFF:
+            raise ImageValidationError("Invalid JPEG header")
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            offset += 2
+            continue
+        (length,) = struct.unpack(">H", data[offset + 2:offset + 4])
+        # APP1 holds the EXIF data, before the frame header
+        if marker == 0xE1 and data[offset + 4:offset + 10] == b"Exif\x00\x00":
+            orientation = _exif_orientation(data[offset + 10:offset + 2 + length])
+        # SOF0..SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if offset + 9 > len(data):
+                break
+            height, width = struct.unpack(">HH", data[offset + 5:offset + 9])
+            return width, height, orientation
+        offset += 2 + length
+    raise ImageValidationError("Could not read JPEG dimensions")
+
+
+def _webp_orientation(data: bytes) -> int:
+    """Read the orientation from the EXIF chunk of an extended (VP8X) WebP file"""
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk = data[offset:offset + 4]
+        size = int.from_bytes(data[offset + 4:offset + 8], "little")
+        if chunk == b"EXIF":
+            return _exif_orientation(data[offset + 8:offset + 8 + size])
+        # Chunks are padded to an even size
+        offset += 8 + size + (size & 1)
+    return 1
+
+
+def _webp_header(data: bytes) -> tuple[int, int, int]:
+    """Read width/height from the first WebP chunk (VP8, VP8L or VP8X) and the orientation"""
+    chunk = data[12:16]
+    if chunk == b"VP8X" and len(data) >= 30:
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        # Bit 3 of the VP8X flags marks an EXIF chunk
+        orientation = _webp_orientation(data) if data[20] & 0x08 else 1
+        return width, height, orientation
+    if chunk == b"VP8L" and len(data) >= 25:
+        bits = int.from_bytes(data[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, 1
+    if chunk == b"VP8 " and len(data) >= 30:
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF, 1
+    raise ImageValidationError("Invalid WebP header")
+
+
+def read_image_info(data: bytes) -> ImageInfo:
+    """
+    Read image type, dimensions and EXIF orientation without decoding pixels
+
+    Args:
+        data: Image bytes (only headers and metadata chunks are inspected)
+
+    Returns:
+        ImageInfo with mime type, extension, displayed width and height, and orientation
+
+    Raises:
+        ImageValidationError: If the type is unsupported or the header is invalid
+    """
+    mime_type, extension = sniff_image_type(data[:12])
+    if extension == "png":
+        width, height, orientation = _png_header(data)
+    elif extension == "jpg":
+        width, height, orientation = _jpeg_header(data)
+    else:
+        width, height, orientation = _webp_header(data)
+    if orientation in TRANSPOSED_ORIENTATIONS:
+        width, height = height, width
+    return ImageInfo(
+        mime_type=mime_type, extension=extension, width=width, height=height,
+        orientation=orientation,
+    )
+
+
+def check_dimensions(info: ImageInfo, aspect_ratios: list[tuple[float, float]], label: str) -> None:
+    """
+    Check image dimensions against size and aspect ratio limits
+
+    Args:
+        info: Image header information
+        aspect_ratios: Accepted (min, max) width/height ranges
+        label: Image kind for error messages (e.g. "Logo")
+
+    Raises:
+        ImageValidationError: If the image is empty, too large or has the wrong shape
+    """
+    if info.width <= 0 or info.height <= 0:
+        raise ImageValidationError(f"{label} has invalid dimensions")
+    if info.width > MAX_IMAGE_DIMENSION or info.height > MAX_IMAGE_DIMENSION:
+        raise ImageValidationError(
+            f"{label} must be at most {MAX_IMAGE_DIMENSION}x{MAX_IMAGE_DIMENSION} pixels"
+        )
+    ratio = info.width / info.height
+    if not any(low <= ratio <= high for low, high in aspect_ratios):
+        raise ImageValidationError(
+            f"{label} has an unsupported aspect ratio ({info.width}x{info.height})"
+        )
+
+
+async def read_capped(file: UploadFile, max_bytes: int, label: str) -> tuple[bytes, ImageInfo]:
+    """
+    Read an image upload in chunks, aborting as soon as it exceeds the cap
+
+    The magic bytes are checked on the first chunk, so non-images are rejected
+    before the rest of the file is read. Memory use is bounded by max_bytes
+    plus one chunk.
+
+    Args:
+        file: Uploaded file
+        max_bytes: Maximum accepted size in bytes
+        label: Image kind for error messages (e.g. "Logo")
+
+    Returns:
+        Tuple of (file bytes, image header information)
+
+    Raises:
+        ImageValidationError: If the file is too large or not a supported image
+    """
+    chunks: list[bytes] = []
+    size = 0
+    while chunk := await file.read(CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_bytes:
+            max_mb = max_bytes // (1024 * 1024)
+            raise ImageValidationError(f"{label} file size must be ≤ {max_mb} MB")
+        if not chunks:
+            sniff_image_type(chunk[:12])
+        chunks.append(chunk)
+
+    data = b"".join(chunks)
+    if not data:
+        raise ImageValidationError(f"{label} file is empty")
+    return data, read_image_info(data)
@@ -0,0 +1,140 @@
+"""
+Keyset pagination utilities
+Opaque cursors and PostgREST filters for cursor-based paging on sort keys
+"""
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Iterable, Sequence
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_timestamp(value: Any) -> bool:
+    try:
+        datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _is_uuid(value: Any) -> bool:
+    try:
+        uuid.UUID(value)
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return True
+
+
+# Checks of cursor values by sort-column type, so a tampered cursor is rejected
+# here instead of failing in Postgres (22P02) or comparing wrongly in memory
+CURSOR_TYPES = {
+    "int": _is_int,
+    "text": lambda value: isinstance(value, str),
+    "timestamp": _is_timestamp,
+    "uuid": _is_uuid,
+}
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """
+    Encode the sort-key values of the last returned row as an opaque cursor
+
+    Args:
+        values: Sort-key values in ORDER BY order
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[str]) -> list[Any]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor string from a previous page
+        types: CURSOR_TYPES name of each sort column, in ORDER BY order
+            (any value may also be null)
+
+    Returns:
+        Sort-key values in ORDER BY order
+
+    Raises:
+        ValueError: If the cursor is malformed or a value does not fit its column
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Invalid cursor")
+    for value, column_type in zip(values, types):
+        if value is not None and not CURSOR_TYPES[column_type](value):
+            raise ValueError("Invalid cursor")
+    return values
+
+
+def _quote(value: Any) -> str:
+    """Quote a value for use inside a PostgREST logic tree"""
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def nulls_last(values: Iterable[Any]) -> tuple:
+    """
+    Comparable key for sort-key values in ascending order with NULLs last
+
+    Matches PostgreSQL's default ascending order, so in-memory indexes page
+    the same way as the queries, and rows with missing values compare
+    without a TypeError.
+
+    Args:
+        values: Sort-key values (e.g. from a row or a decoded cursor)
+
+    Returns:
+        Tuple of (is null, value) pairs
+    """
+    return tuple((value is None, value) for value in values)
+
+
+def keyset_filter(columns: list[str], values: list[Any]) -> str:
+    """
+    Build a PostgREST `or` filter selecting rows after a cursor
+
+    For ascending columns (a, b, c) and cursor values (x, y, z) this expresses
+    (a, b, c) > (x, y, z) as:
+        a.gt.x, and(a.eq.x, b.gt.y), and(a.eq.x, b.eq.y, c.gt.z)
+
+    NULLs sort last (PostgreSQL's ascending default): a non-null cursor value
+    is also followed by the NULLs of its column (a.is.null), and a NULL
+    cursor value is matched with is.null and followed only by later columns.
+
+    Args:
+        columns: Sort columns in ORDER BY order (all ascending, last one unique)
+        values: Cursor values for those columns
+
+    Returns:
+        Filter string for `.or_()`
+    """
+    branches = []
+    for i, column in enumerate(columns):
+        if values[i] is None:
+            continue
+        prefix = [
+            f"{columns[j]}.is.null" if values[j] is None else f"{columns[j]}.eq.{_quote(values[j])}"
+            for j in range(i)
+        ]
+        for condition in (f"{column}.gt.{_quote(values[i])}", f"{column}.is.null"):
+            if prefix:
+                branches.append(f"and({','.join((*prefix, condition))})")
+            else:
+                branches.append(condition)
+    return ",".join(branches)
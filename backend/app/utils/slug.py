@@ -3,6 +3,7 @@ Utility functions for slug generation
 """
 import re
 import unicodedata
+from typing import Iterable
 
 
 def generate_slug(text: str) -> str:
@@ -33,3 +34,61 @@ def generate_slug(text: str) -> str:
     
     return text
 
+
+
+def next_available_slug(base: str, taken: Iterable[str]) -> str:
+    """
+    Pick the first free slug for a base slug
+    
+    Args:
+        base: Base slug from generate_slug()
+        taken: Existing slugs that share the base as a prefix
+        
+    Returns:
+        The base itself if free, otherwise base-N with the lowest free N >= 1
+    
+    Example:
+        next_available_slug("acm", ["acm", "acm-1", "acm-3"])
+        -> "acm-2"
+    """
+    taken = set(taken)
+    if base not in taken:
+        return base
+    
+    # Collect numeric suffixes in use for this base
+    suffix_pattern = re.compile(rf"^{re.escape(base)}-(\d+)$")
+    used = {int(match.group(1)) for match in map(suffix_pattern.match, taken) if match}
+    
+    counter = 1
+    while counter in used:
+        counter += 1
+    return f"{base}-{counter}"
+
+
+def allocate_slugs(bases: list[str], taken: Iterable[str]) -> list[str]:
+    """
+    Assign a free slug to each base in order, without reusing any slug
+    
+    Args:
+        bases: Base slugs, one per new club (duplicates allowed)
+        taken: Existing slugs that share any of the bases as a prefix
+        
+    Returns:
+        One unique slug per base, in the same order
+    """
+    claimed = set(taken)
+    slugs = []
+    next_suffix: dict[str, int] = {}
+    for base in bases:
+        if base not in claimed:
+            slug = base
+        else:
+            # Resume from the last suffix handed out for this base
+            counter = next_suffix.get(base, 1)
+            while f"{base}-{counter}" in claimed:
+                counter += 1
+            next_suffix[base] = counter + 1
+            slug = f"{base}-{counter}"
+        claimed.add(slug)
+        slugs.append(slug)
+    return slugs
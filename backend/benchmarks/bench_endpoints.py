@@ -0,0 +1,413 @@
+"""
+Endpoint Benchmark
+Throughput and latency percentiles for every clubs and majors route
+
+Runs the FastAPI app in-process (httpx ASGI transport) against the
+in-memory Supabase stand-in in benchmarks/fake_supabase.py, seeded with a
+synthetic catalog per size. Each scenario is warmed up, then sent
+--requests times by --concurrency workers. Reported per route:
+throughput, p50/p95/p99/max latency, Supabase calls per request and the
+stand-in's own time per request (already included in the latency).
+
+Read scenarios run before write scenarios, so reads see the seeded
+catalog with warm caches. Upload scenarios re-send the same image, so
+after the first (warm-up) request they measure the content-addressed
+path that skips re-encoding.
+
+Results are saved as JSON (with the git commit) so runs can be compared.
+
+Usage (from backend/):
+    python -m benchmarks.bench_endpoints
+    python -m benchmarks.bench_endpoints --sizes 100 1000 --requests 500 --latency-ms 5
+    python -m benchmarks.bench_endpoints --only clubs.search majors. --compare results/old.json
+"""
+import argparse
+import asyncio
+import io
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+import httpx
+
+from benchmarks.fake_supabase import FakeSupabase, install, seed_catalog
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# Percentiles reported per route
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class Scenario:
+    """One benchmarked request shape"""
+    name: str
+    method: str
+    route: str
+    build: Callable[[int], dict]
+    expected_status: int = 200
+    write: bool = False
+    prepare: Optional[Callable[[int], None]] = field(default=None, repr=False)
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def git_revision() -> dict:
+    """Current commit and whether the tree has uncommitted changes"""
+    def run(*args: str) -> str:
+        try:
+            return subprocess.run(
+                ["git", *args], capture_output=True, text=True, check=True, timeout=30
+            ).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            return ""
+
+    return {"commit": run("rev-parse", "HEAD") or None, "dirty": bool(run("status", "--porcelain"))}
+
+
+def make_png(width: int, height: int) -> bytes:
+    """Encode a synthetic gradient image"""
+    from PIL import Image
+
+    image = Image.new("RGB", (width, height))
+    image.putdata([
+        (x * 255 // width, y * 255 // height, 128) for y in range(height) for x in range(width)
+    ])
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def reset_app_state() -> None:
+    """Drop every in-process cache and index so each catalog size starts cold"""
+    from app.db.cache import catalog_cache
+    from app.services.club_filters import club_filters
+    from app.services.club_search import club_search
+
+    catalog_cache.clear()
+    club_search.invalidate()
+    club_filters.invalidate()
+
+
+def build_scenarios(fake: FakeSupabase, first_pages: dict, run_id: str) -> list[Scenario]:
+    """
+    Scenarios for every route in app/api/clubs.py and app/api/majors.py
+
+    Args:
+        fake: Seeded stand-in (for IDs, slugs and rows prepared per request)
+        first_pages: First page responses of the club and major lists (for cursors)
+        run_id: Suffix keeping names created by this run unique
+
+    Returns:
+        Scenarios, reads first
+    """
+    clubs = fake.table("clubs")
+    majors = fake.table("majors")
+    club_ids = [row["id"] for row in clubs]
+    major_ids = [row["id"] for row in majors]
+    slug = clubs[0]["slug"]
+    queries = [
+        "robotics", "chess club", "data sci", "photgraphy", "esports team", "mock", "engneering",
+    ]
+
+    logo = make_png(256, 256)
+    banner = make_png(640, 360)
+    spare_majors: list[str] = []
+
+    def prepare_spare_major(i: int) -> None:
+        spare_majors.append(fake.insert("majors", [{"name": f"Spare Major {run_id}-{i}"}])[0]["id"])
+
+    def import_body(i: int) -> dict:
+        lines = [
+            json.dumps({
+                "name": f"Imported Club {run_id}-{i}-{j}", "description": "Bulk imported club",
+            })
+            for j in range(10)
+        ]
+        return {
+            "url": "/api/clubs/import",
+            "content": "\n".join(lines).encode(),
+            "headers": {"content-type": "application/x-ndjson"},
+        }
+
+    return [
+        Scenario("clubs.list", "GET", "/api/clubs/", lambda i: {"url": "/api/clubs/"}),
+        Scenario("clubs.list_next_page", "GET", "/api/clubs/", lambda i: {
+            "url": "/api/clubs/", "params": {"cursor": first_pages["clubs"]["next_cursor"]},
+        }),
+        Scenario("clubs.list_unpaged", "GET", "/api/clubs/", lambda i: {
+            "url": "/api/clubs/", "params": {"paginate": "false"},
+        }),
+        Scenario("clubs.list_by_major", "GET", "/api/clubs/", lambda i: {
+            "url": "/api/clubs/",
+            "params": {"major_id": major_ids[i % len(major_ids)], "is_active": "true"},
+        }),
+        Scenario("clubs.search", "GET", "/api/clubs/search", lambda i: {
+            "url": "/api/clubs/search", "params": {"q": queries[i % len(queries)]},
+        }),
+        Scenario("clubs.get", "GET", "/api/clubs/{club_id}", lambda i: {
+            "url": f"/api/clubs/{club_ids[i % len(club_ids)]}",
+        }),
+        Scenario("majors.list", "GET", "/api/majors/", lambda i: {"url": "/api/majors/"}),
+        Scenario("majors.list_next_page", "GET", "/api/majors/", lambda i: {
+            "url": "/api/majors/", "params": {"cursor": first_pages["majors"]["next_cursor"]},
+        }),
+        Scenario("majors.list_unpaged", "GET", "/api/majors/", lambda i: {
+            "url": "/api/majors/", "params": {"paginate": "false"},
+        }),
+        Scenario("majors.get", "GET", "/api/majors/{major_id}", lambda i: {
+            "url": f"/api/majors/{major_ids[i % len(major_ids)]}",
+        }),
+        Scenario("clubs.create", "POST", "/api/clubs/", lambda i: {
+            "url": "/api/clubs/",
+            "data": {"name": f"Bench Club {run_id}-{i}", "description": "Created by the benchmark"},
+        }, expected_status=201, write=True),
+        Scenario("clubs.update", "PATCH", "/api/clubs/{club_id}", lambda i: {
+            "url": f"/api/clubs/{club_ids[i % len(club_ids)]}", "json": {"display_order": i % 10},
+        }, write=True),
+        Scenario("clubs.import", "POST", "/api/clubs/import", import_body, write=True),
+        Scenario("clubs.upload_logo", "POST", "/api/clubs/{club_slug}/upload-logo", lambda i: {
+            "url": f"/api/clubs/{slug}/upload-logo",
+            "files": {"file": ("logo.png", logo, "image/png")},
+        }, write=True),
+        Scenario("clubs.upload_banner", "POST", "/api/clubs/{club_slug}/upload-banner", lambda i: {
+            "url": f"/api/clubs/{slug}/upload-banner",
+            "files": {"file": ("banner.png", banner, "image/png")},
+        }, write=True),
+        Scenario("clubs.upload_assets", "POST", "/api/clubs/{club_slug}/upload-assets", lambda i: {
+            "url": f"/api/clubs/{slug}/upload-assets",
+            "files": {
+                "logo": ("logo.png", logo, "image/png"),
+                "banner": ("banner.png", banner, "image/png"),
+            },
+        }, write=True),
+        Scenario("majors.create", "POST", "/api/majors/", lambda i: {
+            "url": "/api/majors/", "json": {"name": f"Bench Major {run_id}-{i}"},
+        }, expected_status=201, write=True),
+        Scenario("majors.update", "PATCH", "/api/majors/{major_id}", lambda i: {
+            "url": f"/api/majors/{major_ids[i % len(major_ids)]}",
+            "json": {"name": f"Renamed Major {run_id}-{i}"},
+        }, write=True),
+        Scenario("majors.delete", "DELETE", "/api/majors/{major_id}", lambda i: {
+            "url": f"/api/majors/{spare_majors[i]}",
+        }, expected_status=204, write=True, prepare=prepare_spare_major),
+    ]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    fake: FakeSupabase,
+    scenario: Scenario,
+    requests: int,
+    warmup: int,
+    concurrency: int,
+) -> dict:
+    """
+    Warm up, then send a scenario's requests from concurrent workers
+
+    Returns:
+        Result row (latencies in milliseconds)
+    """
+    total = warmup + requests
+    if scenario.prepare is not None:
+        for i in range(total):
+            scenario.prepare(i)
+
+    errors: dict[str, int] = {}
+
+    async def send(i: int) -> float:
+        request = scenario.build(i)
+        start = time.perf_counter()
+        response = await client.request(scenario.method, **request)
+        elapsed = time.perf_counter() - start
+        if response.status_code != scenario.expected_status:
+            key = str(response.status_code)
+            errors[key] = errors.get(key, 0) + 1
+        return elapsed
+
+    for i in range(warmup):
+        await send(i)
+
+    latencies: list[float] = []
+    counter = iter(range(warmup, total))
+    upstream_before, busy_before = fake.requests, fake.busy_seconds
+
+    async def worker() -> None:
+        for i in counter:
+            latencies.append(await send(i))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    result = {
+        "name": scenario.name,
+        "method": scenario.method,
+        "route": scenario.route,
+        "requests": requests,
+        "concurrency": concurrency,
+        "throughput_rps": round(requests / wall, 1) if wall else None,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+        "upstream_calls_per_request": round((fake.requests - upstream_before) / requests, 2),
+        "stand_in_ms_per_request": round((fake.busy_seconds - busy_before) / requests * 1000, 3),
+        "errors": errors,
+        # Latencies of a run with unexpected statuses do not measure the route
+        "valid": not errors,
+    }
+    for p in PERCENTILES:
+        result[f"p{p}_ms"] = round(percentile(ordered, p) * 1000, 3)
+    return result
+
+
+async def run_size(size: int, args: argparse.Namespace) -> list[dict]:
+    """Seed a catalog of `size` clubs and majors and run every selected scenario"""
+    from app.main import app
+    from app.services.renditions import shutdown_pool
+
+    fake = FakeSupabase(latency=args.latency_ms / 1000)
+    seed_catalog(fake, clubs=size, majors=size, seed=args.seed)
+    install(fake)
+    reset_app_state()
+
+    transport = httpx.ASGITransport(app=app)
+    results = []
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            first_pages = {
+                "clubs": (await client.get("/api/clubs/")).json(),
+                "majors": (await client.get("/api/majors/")).json(),
+            }
+            run_id = f"{size}-{int(time.time())}"
+            for scenario in build_scenarios(fake, first_pages, run_id):
+                if args.only and not any(scenario.name.startswith(prefix) for prefix in args.only):
+                    continue
+                result = await run_scenario(
+                    client, fake, scenario, args.requests, args.warmup, args.concurrency
+                )
+                result["size"] = size
+                results.append(result)
+                print_row(result)
+    finally:
+        shutdown_pool()
+    return results
+
+
+def print_header() -> None:
+    print(
+        f"{'size':>6} {'scenario':<24} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+        f" {'calls/req':>10} {'stand-in ms':>12} {'errors':>7}"
+    )
+
+
+def print_row(result: dict) -> None:
+    print(
+        f"{result['size']:>6} {result['name']:<24} {result['throughput_rps']:>9.1f}"
+        f" {result['p50_ms']:>9.3f} {result['p95_ms']:>9.3f} {result['p99_ms']:>9.3f}"
+        f" {result['upstream_calls_per_request']:>10.2f} {result['stand_in_ms_per_request']:>12.3f}"
+        f" {sum(result['errors'].values()):>7}"
+    )
+
+
+def compare(results: list[dict], baseline_path: str) -> None:
+    """Print p50/p95/throughput changes against a saved run"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["size"], r["name"]): r for r in json.load(f)["results"]}
+
+    def change(new: float, old: float) -> str:
+        return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+    print(f"\nCompared with {baseline_path}:")
+    print(f"{'size':>6} {'scenario':<24} {'rps':>9} {'p50':>9} {'p95':>9}")
+    for result in results:
+        old = baseline.get((result["size"], result["name"]))
+        if old is None:
+            continue
+        print(
+            f"{result['size']:>6} {result['name']:<24}"
+            f" {change(result['throughput_rps'], old['throughput_rps']):>9}"
+            f" {change(result['p50_ms'], old['p50_ms']):>9}"
+            f" {change(result['p95_ms'], old['p95_ms']):>9}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000],
+                        help="Catalog sizes (clubs and majors each)")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent clients")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Simulated Supabase round trip per call")
+    parser.add_argument("--seed", type=int, default=0, help="Catalog random seed")
+    parser.add_argument("--only", nargs="+", default=None,
+                        help="Run scenarios whose name starts with one of these prefixes")
+    parser.add_argument("--output", default=None,
+                        help="Results file (default: benchmarks/results/...)")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare with")
+    args = parser.parse_args()
+
+    revision = git_revision()
+    print_header()
+    results = []
+    for size in args.sizes:
+        results.extend(asyncio.run(run_size(size, args)))
+
+    from app.utils.serialization import orjson
+
+    report = {
+        "benchmark": "endpoints",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        **revision,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "encoder": "orjson" if orjson is not None else "json",
+        "settings": {
+            key: getattr(args, key)
+            for key in ("sizes", "requests", "warmup", "concurrency", "latency_ms", "seed", "only")
+        },
+        "valid": all(result["valid"] for result in results),
+        "results": results,
+    }
+    output = args.output
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        commit = (revision["commit"] or "nogit")[:10]
+        output = os.path.join(RESULTS_DIR, f"endpoints_{commit}_{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+    failed = [result for result in results if not result["valid"]]
+    if failed:
+        for result in failed:
+            print(
+                f"{result['size']} {result['name']}: unexpected statuses {result['errors']}",
+                file=sys.stderr,
+            )
+        sys.exit(f"{len(failed)} scenario(s) failed; results are marked invalid")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Serialization Benchmark
+Compares the legacy club list path with the fast serialization path
+
+Legacy path: build Club(**row) per row, then let FastAPI validate and
+serialize the list again through response_model=List[Club].
+Fast path: project trusted rows onto Club fields and encode once
+(orjson when installed). Cached path: serve the encoded bytes from
+catalog_cache.
+
+Usage (from backend/):
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --sizes 10 1000 --repeat 20
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.db.cache import TTLCache
+from app.models.club import Club
+from app.utils.serialization import encode_payload, orjson, project_rows
+
+
+def make_rows(count: int) -> list[dict]:
+    """Build synthetic club rows shaped like Supabase responses"""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "id": str(uuid.UUID(int=i + 1)),
+            "name": f"Club {i}",
+            "description": f"Synthetic description for club number {i}. " * 3,
+            "website": f"https://example.com/clubs/{i}",
+            "slug": f"club-{i}",
+            "is_active": True,
+            "is_all_majors": i % 5 == 0,
+            "display_order": i % 10,
+            "logo_url": f"https://cdn.example.com/clubs/club-{i}/logo.png",
+            "banner_url": None,
+            "created_at": (base + timedelta(minutes=i)).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+_response_field = create_model_field(
+    name="Response_get_all_clubs", type_=List[Club], mode="serialization"
+)
+_loop = asyncio.new_event_loop()
+
+
+def legacy_path(rows: list[dict]) -> bytes:
+    """Club(**row) per row, then FastAPI response_model validation + JSONResponse"""
+    content = [Club(**row) for row in rows]
+    serialized = _loop.run_until_complete(
+        serialize_response(field=_response_field, response_content=content)
+    )
+    return JSONResponse(content=serialized).body
+
+
+def fast_path(rows: list[dict]) -> bytes:
+    """Project trusted rows and encode once"""
+    return encode_payload(project_rows(rows, Club)).body
+
+
+def validated_fast_path(rows: list[dict]) -> bytes:
+    """Validate each row once, then encode once"""
+    return encode_payload([Club.model_validate(row).model_dump(mode="json") for row in rows]).body
+
+
+def cached_path(cache: TTLCache, rows: list[dict]) -> bytes:
+    """Serve encoded bytes from the catalog cache (encoded on first call only)"""
+    payload = cache.get(("clubs", "all"))
+    if payload is None:
+        payload = encode_payload(project_rows(rows, Club))
+        cache.set(("clubs", "all"), payload)
+    return payload.body
+
+
+def timeit(fn, repeat: int) -> float:
+    """Return the best wall time in milliseconds over repeat runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"encoder: {'orjson' if orjson is not None else 'json (stdlib)'}")
+    print(
+        f"{'clubs':>8} {'legacy ms':>12} {'validated ms':>14} {'fast ms':>10} "
+        f"{'cached ms':>11} {'speedup':>9}"
+    )
+    for size in args.sizes:
+        rows = make_rows(size)
+        cache = TTLCache(ttl_seconds=300, max_entries=16, max_bytes=256 * 1024 * 1024)
+        legacy = timeit(lambda: legacy_path(rows), args.repeat)
+        validated = timeit(lambda: validated_fast_path(rows), args.repeat)
+        fast = timeit(lambda: fast_path(rows), args.repeat)
+        cached = timeit(lambda: cached_path(cache, rows), args.repeat)
+        print(
+            f"{size:>8} {legacy:>12.3f} {validated:>14.3f} {fast:>10.3f} "
+            f"{cached:>11.4f} {legacy / fast:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Worker Scaling Benchmark
+Throughput, latency and memory of the gunicorn server at different worker counts
+
+Starts `gunicorn -c gunicorn.conf.py benchmarks.fake_app:app` (the real
+production config, against the seeded Supabase stand-in) once per worker
+count and snapshot setting, waits for /health/ready, then sends the public
+read scenarios over TCP from --concurrency clients. Reported per run and
+scenario: throughput and p50/p95 latency; per run: the summed proportional
+set size (PSS) of the workers, which counts pages shared between workers
+(the preloaded app, the mapped snapshot) once.
+
+Throughput only scales with workers up to the CPUs available to the
+server and this client together; the CPU count is saved with the results.
+
+Usage (from backend/):
+    python -m benchmarks.bench_workers
+    python -m benchmarks.bench_workers --workers 1 4 --snapshot on off --size 10000
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+import httpx
+
+from benchmarks.bench_endpoints import RESULTS_DIR, git_revision, percentile
+from benchmarks.fake_supabase import FakeSupabase, seed_catalog
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds to wait for every worker to report ready
+STARTUP_TIMEOUT = 120
+
+
+def read_scenarios(fake: FakeSupabase) -> list[tuple[str, Callable[[int], dict]]]:
+    """Public read requests (name, request builder) against the seeded catalog"""
+    club_ids = [row["id"] for row in fake.table("clubs")]
+    major_ids = [row["id"] for row in fake.table("majors")]
+    queries = ["robotics", "chess club", "data sci", "photgraphy", "esports team"]
+    return [
+        ("clubs.list", lambda i: {"url": "/api/clubs/"}),
+        ("clubs.list_by_major", lambda i: {
+            "url": "/api/clubs/",
+            "params": {"major_id": major_ids[i % len(major_ids)], "is_active": "true"},
+        }),
+        ("clubs.search", lambda i: {
+            "url": "/api/clubs/search", "params": {"q": queries[i % len(queries)]},
+        }),
+        ("clubs.get", lambda i: {"url": f"/api/clubs/{club_ids[i % len(club_ids)]}"}),
+        ("majors.list", lambda i: {"url": "/api/majors/"}),
+    ]
+
+
+def worker_pids(master_pid: int) -> list[int]:
+    """Child processes of the gunicorn master"""
+    pids = []
+    for task in os.listdir(f"/proc/{master_pid}/task"):
+        try:
+            with open(f"/proc/{master_pid}/task/{task}/children", encoding="ascii") as f:
+                pids.extend(int(pid) for pid in f.read().split())
+        except OSError:
+            continue
+    return pids
+
+
+def pss_mb(pid: int) -> float:
+    """Proportional set size of a process in MiB (0 if unavailable)"""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def start_server(workers: int, snapshot: bool, port: int, args: argparse.Namespace, tmp: str):
+    """Start gunicorn and wait until every worker reports ready"""
+    env = {
+        **os.environ,
+        "WEB_CONCURRENCY": str(workers),
+        "PORT": str(port),
+        "SNAPSHOT_ENABLED": "true" if snapshot else "false",
+        "SNAPSHOT_PATH": os.path.join(tmp, "catalog.sqlite3"),
+        "PROMETHEUS_MULTIPROC_DIR": os.path.join(tmp, "prometheus"),
+        "BENCH_SIZE": str(args.size),
+        "BENCH_SEED": str(args.seed),
+        "BENCH_LATENCY_MS": str(args.latency_ms),
+    }
+    # Server logs (including access logs) go to a file, so they cost the workers what they would
+    # in production without filling the terminal
+    log_path = os.path.join(tmp, "gunicorn.log")
+    with open(log_path, "wb") as log:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "benchmarks.fake_app:app"],
+            cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT,
+        )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            with open(log_path, encoding="utf-8", errors="replace") as f:
+                tail = f.read()[-2000:]
+            raise RuntimeError(f"gunicorn exited with status {process.returncode}:\n{tail}")
+        if len(worker_pids(process.pid)) == workers:
+            try:
+                # Connections land on any worker; several readies in a row cover them all
+                if all(
+                    httpx.get(f"http://127.0.0.1:{port}/health/ready", timeout=5).status_code == 200
+                    for _ in range(workers * 4)
+                ):
+                    return process
+            except httpx.HTTPError:
+                pass
+        time.sleep(0.5)
+    stop_server(process)
+    raise RuntimeError("gunicorn workers did not become ready")
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+async def run_scenario(
+    port: int, name: str, build: Callable[[int], dict], args: argparse.Namespace
+) -> dict:
+    """Warm up, then send one scenario's requests from concurrent clients"""
+    errors: dict[str, int] = {}
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60
+    ) as client:
+        async def send(i: int) -> float:
+            start = time.perf_counter()
+            response = await client.get(**build(i))
+            elapsed = time.perf_counter() - start
+            if response.status_code != 200:
+                key = str(response.status_code)
+                errors[key] = errors.get(key, 0) + 1
+            return elapsed
+
+        await asyncio.gather(*(send(i) for i in range(args.warmup)))
+
+        latencies: list[float] = []
+        counter = iter(range(args.warmup, args.warmup + args.requests))
+
+        async def worker() -> None:
+            for i in counter:
+                latencies.append(await send(i))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        wall = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        "name": name,
+        "throughput_rps": round(args.requests / wall, 1) if wall else None,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "errors": errors,
+        "valid": not errors,
+    }
+
+
+def run_config(workers: int, snapshot: bool, fake: FakeSupabase, args: argparse.Namespace) -> dict:
+    """Benchmark one worker count and snapshot setting"""
+    tmp = tempfile.mkdtemp(prefix="bench-workers-")
+    process = start_server(workers, snapshot, args.port, args, tmp)
+    try:
+        scenarios = []
+        for name, build in read_scenarios(fake):
+            result = asyncio.run(run_scenario(args.port, name, build, args))
+            scenarios.append(result)
+            print(
+                f"{workers:>7} {'on' if snapshot else 'off':>8} {name:<20}"
+                f" {result['throughput_rps']:>9.1f} {result['p50_ms']:>9.3f}"
+                f" {result['p95_ms']:>9.3f} {sum(result['errors'].values()):>7}"
+            )
+        pids = worker_pids(process.pid)
+        memory = round(sum(pss_mb(pid) for pid in pids), 1)
+        print(
+            f"{workers:>7} {'on' if snapshot else 'off':>8} {'workers PSS (MiB)':<20}"
+            f" {memory:>9.1f}"
+        )
+    finally:
+        stop_server(process)
+        shutil.rmtree(tmp, ignore_errors=True)
+    return {
+        "workers": workers,
+        "snapshot": snapshot,
+        "workers_pss_mb": memory,
+        "scenarios": scenarios,
+        "valid": all(result["valid"] for result in scenarios),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4],
+                        help="Worker counts (WEB_CONCURRENCY)")
+    parser.add_argument("--snapshot", nargs="+", choices=["on", "off"], default=["on", "off"],
+                        help="Run with the catalog snapshot on, off or both")
+    parser.add_argument("--size", type=int, default=1_000,
+                        help="Catalog size (clubs and majors each)")
+    parser.add_argument("--requests", type=int, default=1_000,
+                        help="Measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=50, help="Unmeasured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Simulated Supabase round trip per call")
+    parser.add_argument("--seed", type=int, default=0, help="Catalog random seed")
+    parser.add_argument("--port", type=int, default=18000, help="Port the server binds")
+    parser.add_argument("--output", default=None,
+                        help="Results file (default: benchmarks/results/...)")
+    args = parser.parse_args()
+
+    # Same seed and size as the server, so IDs in requests exist there
+    fake = FakeSupabase()
+    seed_catalog(fake, clubs=args.size, majors=args.size, seed=args.seed)
+
+    revision = git_revision()
+    print(
+        f"{'workers':>7} {'snapshot':>8} {'scenario':<20} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9}"
+        f" {'errors':>7}"
+    )
+    runs = [
+        run_config(workers, snapshot == "on", fake, args)
+        for snapshot in args.snapshot
+        for workers in args.workers
+    ]
+
+    report = {
+        "benchmark": "workers",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        **revision,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpus": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None,
+        "settings": {
+            key: getattr(args, key)
+            for key in ("workers", "snapshot", "size", "requests", "warmup", "concurrency",
+                        "latency_ms", "seed")
+        },
+        "valid": all(run["valid"] for run in runs),
+        "runs": runs,
+    }
+    output = args.output
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        commit = (revision["commit"] or "nogit")[:10]
+        output = os.path.join(RESULTS_DIR, f"workers_{commit}_{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {output}")
+
+    if not report["valid"]:
+        sys.exit("some scenarios returned unexpected statuses; results are marked invalid")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Benchmark App
+The FastAPI app served against a seeded Supabase stand-in, for benchmarks that
+need a real server (e.g. gunicorn with several workers)
+
+Catalog size, seed and simulated latency come from the environment, so every
+worker (and the benchmark driving it) sees the same catalog:
+    BENCH_SIZE        clubs and majors each (default: 1000)
+    BENCH_SEED        catalog random seed (default: 0)
+    BENCH_LATENCY_MS  simulated Supabase round trip per call (default: 0)
+
+Run with (from backend/):
+    gunicorn -c gunicorn.conf.py benchmarks.fake_app:app
+"""
+import os
+
+from benchmarks.fake_supabase import FakeSupabase, install, seed_catalog
+
+fake = FakeSupabase(latency=float(os.getenv("BENCH_LATENCY_MS", "0")) / 1000)
+seed_catalog(
+    fake,
+    clubs=int(os.getenv("BENCH_SIZE", "1000")),
+    majors=int(os.getenv("BENCH_SIZE", "1000")),
+    seed=int(os.getenv("BENCH_SEED", "0")),
+)
+install(fake)
+
+from app.main import app  # noqa: E402  (after install, so the app never sees real credentials)
+
+__all__ = ["app", "fake"]
@@ -0,0 +1,734 @@
+"""
+Fake Supabase
+In-memory PostgREST and Storage stand-in, served as an httpx transport
+
+Implements the subset of PostgREST the API uses: select with column lists
+and one level of embedded child tables (e.g. `*,club_tags(tag)`),
+eq/neq/gt/gte/lt/lte/like/ilike/in/is filters (negated with not.), or/and
+logic trees, order, limit/offset capped at max-rows (1000, as on Supabase),
+insert/update/delete with
+return=representation, unique and foreign key errors, the
+delete_major_if_unused RPC, the catalog_versions triggers and the
+updated_at / catalog_tombstones bookkeeping used by delta sync. Storage
+supports upload, list, download and HEAD on object paths.
+
+Rows are plain dictionaries. Equality and `in` filters on id and unique
+columns use hash indexes, and ordered reads reuse a sorted copy until the
+table is written, so the stand-in
+stays cheap next to the app even with 10k-row tables. Its own time is
+counted in `busy_seconds`, so benchmarks can report it separately.
+
+Usage:
+    fake = FakeSupabase(latency=0.002)
+    seed_catalog(fake, clubs=1_000, majors=1_000)
+    install(fake)  # route app.db.client's shared httpx client here
+"""
+import asyncio
+import json
+import os
+import random
+import re
+import time
+import uuid
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl, unquote
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is used without it
+    orjson = None
+
+# Query parameters that are not row filters
+_RESERVED_PARAMS = {"select", "order", "limit", "offset", "columns", "on_conflict"}
+
+# Unique columns per table (besides id)
+UNIQUE_COLUMNS = {"clubs": ("slug",), "majors": ("name",)}
+
+# Column defaults applied on insert (id and created_at are always filled in)
+DEFAULTS = {
+    "clubs": {
+        "website": None, "slug": None, "is_active": True, "display_order": 0,
+        "is_all_majors": False, "logo_url": None, "banner_url": None,
+    },
+}
+
+# Tables whose writes bump public.catalog_versions (statement triggers in the schema)
+VERSIONED_TABLES = ("clubs", "club_majors")
+
+# Tables with an updated_at trigger and a delete tombstone trigger, and the
+# key columns recorded in catalog_tombstones.row_key
+TOMBSTONE_KEYS = {
+    "clubs": ("id",),
+    "majors": ("id",),
+    "club_majors": ("club_id", "major_id"),
+    "club_tags": ("club_id", "tag"),
+}
+
+# Foreign key column per (child, parent) table, for embedded selects
+EMBED_KEYS = {
+    ("club_tags", "clubs"): "club_id",
+    ("club_majors", "clubs"): "club_id",
+    ("club_majors", "majors"): "major_id",
+}
+
+# PostgREST's db-max-rows on Supabase: no response carries more rows than this
+MAX_ROWS = 1000
+
+Predicate = Callable[[dict], bool]
+
+
+def _now() -> str:
+    # Fixed-width timestamps, so string comparisons in filters order correctly
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+def _split_top_level(expr: str) -> list[str]:
+    """Split a PostgREST list on commas outside parentheses and quotes"""
+    parts, depth, quoted, current = [], 0, False, []
+    for ch in expr:
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        if ch == "," and depth == 0 and not quoted:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+    if current:
+        parts.append("".join(current))
+    return parts
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    return value
+
+
+def _coerce(value: str, like: Any) -> Any:
+    """Convert a filter value to the type of the column value it is compared with"""
+    if isinstance(like, bool):
+        return value == "true"
+    if isinstance(like, (int, float)):
+        try:
+            return type(like)(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _like_pattern(value: str, ignore_case: bool) -> re.Pattern:
+    pattern = "".join(".*" if ch in "*%" else re.escape(ch) for ch in _unquote(value))
+    return re.compile(f"^{pattern}$", re.IGNORECASE if ignore_case else 0)
+
+
+def compile_condition(column: str, expr: str) -> Predicate:
+    """
+    Compile one PostgREST filter (e.g. "eq.5", "not.is.null") into a row predicate
+
+    Args:
+        column: Column name
+        expr: Operator and value
+
+    Returns:
+        Function returning whether a row passes
+    """
+    negate = expr.startswith("not.")
+    if negate:
+        expr = expr[4:]
+    op, _, value = expr.partition(".")
+
+    if op == "is":
+        expected = None if value == "null" else value == "true"
+        test = lambda v: v is expected if expected is None else v == expected  # noqa: E731
+    elif op == "in":
+        members = {_unquote(v) for v in _split_top_level(value[1:-1])}
+        test = lambda v: v is not None and str(v) in members  # noqa: E731
+    elif op in ("like", "ilike"):
+        pattern = _like_pattern(value, op == "ilike")
+        test = lambda v: v is not None and pattern.match(str(v)) is not None  # noqa: E731
+    else:
+        value = _unquote(value)
+        compare = {
+            "eq": lambda a, b: a == b,
+            "neq": lambda a, b: a != b,
+            "gt": lambda a, b: a > b,
+            "gte": lambda a, b: a >= b,
+            "lt": lambda a, b: a < b,
+            "lte": lambda a, b: a <= b,
+        }[op]
+
+        def test(v):
+            if v is None:
+                return False
+            return compare(v, _coerce(value, v))
+
+    if negate:
+        return lambda row: not test(row.get(column))
+    return lambda row: test(row.get(column))
+
+
+def compile_logic(expr: str, mode: str) -> Predicate:
+    """
+    Compile an or/and logic tree (without the outer parentheses)
+
+    Args:
+        expr: e.g. "a.gt.1,and(a.eq.1,b.gt.2)"
+        mode: "or" or "and"
+
+    Returns:
+        Row predicate
+    """
+    predicates = []
+    for part in _split_top_level(expr):
+        if part.startswith(("and(", "or(", "not.and(", "not.or(")):
+            negate = part.startswith("not.")
+            inner_mode, _, rest = part.removeprefix("not.").partition("(")
+            inner = compile_logic(rest[:-1], inner_mode)
+            predicates.append((lambda p: lambda row: not p(row))(inner) if negate else inner)
+        else:
+            column, _, condition = part.partition(".")
+            predicates.append(compile_condition(column, condition))
+    if mode == "and":
+        return lambda row: all(p(row) for p in predicates)
+    return lambda row: any(p(row) for p in predicates)
+
+
+def _group_by(rows: list[dict], column: str) -> dict[str, list[dict]]:
+    """Rows keyed by the string value of one column"""
+    groups: dict[str, list[dict]] = {}
+    for row in rows:
+        groups.setdefault(str(row.get(column)), []).append(row)
+    return groups
+
+
+def _sort_key(order: str) -> list[tuple[str, bool, bool]]:
+    """Parse an order parameter into (column, descending, nulls first) triples"""
+    specs = []
+    for spec in order.split(","):
+        column, *modifiers = spec.split(".")
+        descending = "desc" in modifiers
+        nulls_first = "nullsfirst" in modifiers or (descending and "nullslast" not in modifiers)
+        specs.append((column, descending, nulls_first))
+    return specs
+
+
+def _sorted(rows: list[dict], order: str) -> list[dict]:
+    result = list(rows)
+    for column, descending, nulls_first in reversed(_sort_key(order)):
+        present = [row for row in result if row.get(column) is not None]
+        missing = [row for row in result if row.get(column) is None]
+        present.sort(key=lambda row: row[column], reverse=descending)
+        result = missing + present if nulls_first else present + missing
+    return result
+
+
+class PostgrestError(Exception):
+    """Error returned as a PostgREST error body"""
+
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+    def response(self) -> httpx.Response:
+        body = {"code": self.code, "message": self.message, "details": None, "hint": None}
+        return httpx.Response(
+            self.status, content=_dumps(body), headers={"content-type": "application/json"}
+        )
+
+
+class FakeSupabase(httpx.AsyncBaseTransport):
+    """
+    In-memory Supabase (PostgREST + Storage) served over an httpx transport
+
+    Args:
+        latency: Seconds to sleep per request, simulating the network round trip
+        max_rows: Most rows a select returns, whatever its limit (PostgREST max-rows)
+    """
+
+    def __init__(self, latency: float = 0.0, max_rows: int = MAX_ROWS):
+        self.latency = latency
+        self.max_rows = max_rows
+        self.tables: dict[str, list[dict]] = {}
+        self.storage: dict[str, bytes] = {}
+        self.requests = 0
+        self.busy_seconds = 0.0
+        self._indexes: dict[str, dict[str, dict[str, dict]]] = {}
+        self._versions: dict[str, int] = {}
+        self._derived: dict[tuple, tuple[int, Any]] = {}
+        self.functions: dict[str, Callable[[dict], Any]] = {
+            "delete_major_if_unused": self._delete_major_if_unused,
+        }
+
+    # Table access
+
+    def table(self, name: str) -> list[dict]:
+        """Rows of a table (created empty on first use)"""
+        if name not in self.tables:
+            self.tables[name] = []
+            self._indexes[name] = {column: {} for column in ("id", *UNIQUE_COLUMNS.get(name, ()))}
+            self._versions[name] = 0
+        return self.tables[name]
+
+    def insert(self, name: str, rows: list[dict]) -> list[dict]:
+        """
+        Insert rows directly, applying defaults and constraints
+
+        Raises:
+            PostgrestError: On unique violations
+        """
+        table = self.table(name)
+        created = []
+        for row in rows:
+            record = {**DEFAULTS.get(name, {}), **row}
+            record.setdefault("id", str(uuid.uuid4()))
+            record.setdefault("created_at", _now())
+            if name in TOMBSTONE_KEYS:
+                record.setdefault("updated_at", _now())
+            created.append(record)
+        self._check_unique(name, created, replacing=[])
+        table.extend(created)
+        self._index(name, created)
+        self._changed(name)
+        return created
+
+    def _check_unique(self, name: str, rows: list[dict], replacing: list[dict]) -> None:
+        """Raise a 23505 error if rows would repeat a value of a unique column"""
+        replaced = {id(row) for row in replacing}
+        for column, index in self._indexes[name].items():
+            seen = set()
+            for row in rows:
+                value = row.get(column)
+                if value is None:
+                    continue
+                existing = index.get(str(value))
+                if str(value) in seen or (existing is not None and id(existing) not in replaced):
+                    raise PostgrestError(
+                        409, "23505",
+                        f'duplicate key value violates unique constraint "{name}_{column}_key"',
+                    )
+                seen.add(str(value))
+
+    def _index(self, name: str, rows: list[dict]) -> None:
+        for column, index in self._indexes[name].items():
+            for row in rows:
+                if row.get(column) is not None:
+                    index[str(row[column])] = row
+
+    def _unindex(self, name: str, rows: list[dict]) -> None:
+        for column, index in self._indexes[name].items():
+            for row in rows:
+                if row.get(column) is not None:
+                    index.pop(str(row[column]), None)
+
+    def _prefix_candidates(self, name: str, expr: str) -> Optional[list[dict]]:
+        """
+        Rows for an `or` of eq and prefix-like branches on one indexed column
+
+        Covers lookups like "slug.eq.acm,slug.like.acm-*" with a sorted key
+        list, as a btree index would. Returns None for any other tree.
+        """
+        column, exact, prefixes = None, [], []
+        for part in _split_top_level(expr):
+            branch_column, _, condition = part.partition(".")
+            op, _, value = condition.partition(".")
+            value = _unquote(value)
+            if column not in (None, branch_column) or branch_column not in self._indexes[name]:
+                return None
+            column = branch_column
+            if op == "eq":
+                exact.append(value)
+            elif op == "like" and value.endswith("*") and not any(ch in "*%_" for ch in value[:-1]):
+                prefixes.append(value[:-1])
+            else:
+                return None
+        if column is None:
+            return None
+
+        index = self._indexes[name][column]
+        keys = self._cached(("keys", name, column), name, lambda: sorted(index))
+        found = {k: index[k] for k in exact if k in index}
+        for prefix in prefixes:
+            i = bisect_left(keys, prefix)
+            while i < len(keys) and keys[i].startswith(prefix):
+                found[keys[i]] = index[keys[i]]
+                i += 1
+        return list(found.values())
+
+    def _cached(self, key: tuple, name: str, build: Callable[[], Any]) -> Any:
+        """Value derived from a table, rebuilt after the table is written"""
+        version, value = self._derived.get(key, (None, None))
+        if version != self._versions[name]:
+            value = build()
+            self._derived[key] = (self._versions[name], value)
+        return value
+
+    def _changed(self, name: str) -> None:
+        self._versions[name] += 1
+        if name in VERSIONED_TABLES:
+            versions = self.table("catalog_versions")
+            for row in versions:
+                if row["name"] == name:
+                    row["version"] += 1
+                    break
+            else:
+                versions.append({"name": name, "version": 1})
+
+    def _candidates(self, name: str, params: list[tuple[str, str]]) -> tuple[list[dict], list]:
+        """Rows to filter, narrowed by a hash index when possible, and the remaining filters"""
+        rows = self.tables[name]
+        indexes = self._indexes[name]
+        filters = []
+        for key, value in params:
+            if key in _RESERVED_PARAMS:
+                continue
+            if key in indexes and value.startswith(("eq.", "in.")) and rows is self.tables[name]:
+                if value.startswith("eq."):
+                    keys = [_unquote(value[3:])]
+                else:
+                    keys = [_unquote(v) for v in _split_top_level(value[4:-1])]
+                rows = [indexes[key][k] for k in dict.fromkeys(keys) if k in indexes[key]]
+                continue
+            if key == "or" and rows is self.tables[name]:
+                narrowed = self._prefix_candidates(name, value[1:-1])
+                if narrowed is not None:
+                    rows = narrowed
+            if key in ("or", "and"):
+                filters.append(compile_logic(value[1:-1], key))
+            else:
+                filters.append(compile_condition(key, value))
+        return rows, filters
+
+    def select(self, name: str, params: list[tuple[str, str]]) -> list[dict]:
+        """Rows matching PostgREST query parameters"""
+        self.table(name)
+        query = dict(params)
+        rows, filters = self._candidates(name, params)
+        order = query.get("order")
+        if order:
+            if rows is self.tables[name]:
+                rows = self._cached(
+                    ("order", name, order), name, lambda: _sorted(self.tables[name], order)
+                )
+            else:
+                rows = _sorted(rows, order)
+
+        offset = int(query.get("offset", 0))
+        limit = min(int(query.get("limit", self.max_rows)), self.max_rows)
+        matched = []
+        for row in rows:
+            if all(f(row) for f in filters):
+                matched.append(row)
+                if len(matched) >= offset + limit:
+                    break
+        matched = matched[offset:]
+
+        columns = query.get("select", "*")
+        if columns != "*":
+            matched = [self._project(name, row, _split_top_level(columns)) for row in matched]
+        return matched
+
+    def _project(self, name: str, row: dict, columns: list[str]) -> dict:
+        """Select columns of a row, embedding child rows for `table(columns)` entries"""
+        result = {}
+        for column in columns:
+            column = column.strip()
+            if column == "*":
+                result.update(row)
+            elif column.endswith(")"):
+                child, _, inner = column[:-1].partition("(")
+                key = EMBED_KEYS[(child, name)]
+                self.table(child)
+                groups = self._cached(
+                    ("embed", child, name), child, lambda: _group_by(self.table(child), key)
+                )
+                result[child] = [
+                    self._project(child, c, _split_top_level(inner))
+                    for c in groups.get(str(row["id"]), [])
+                ]
+            else:
+                result[column] = row.get(column)
+        return result
+
+    def update(self, name: str, params: list[tuple[str, str]], values: dict) -> list[dict]:
+        """
+        Update rows matching the filters
+
+        Raises:
+            PostgrestError: On unique violations
+        """
+        self.table(name)
+        rows, filters = self._candidates(name, params)
+        hit = [row for row in rows if all(f(row) for f in filters)]
+        if hit:
+            self._check_unique(name, [{**row, **values} for row in hit], replacing=hit)
+            self._unindex(name, hit)
+            for row in hit:
+                row.update(values)
+                if name in TOMBSTONE_KEYS:
+                    row["updated_at"] = _now()
+            self._index(name, hit)
+            self._changed(name)
+        return hit
+
+    def delete(self, name: str, params: list[tuple[str, str]]) -> list[dict]:
+        """
+        Delete rows matching the filters
+
+        Raises:
+            PostgrestError: If a major is still referenced by club_majors
+        """
+        self.table(name)
+        rows, filters = self._candidates(name, params)
+        hit = [row for row in rows if all(f(row) for f in filters)]
+        if not hit:
+            return []
+        if name == "majors":
+            links = self.table("club_majors")
+            linked = self._cached(
+                ("referenced", "club_majors", "major_id"), "club_majors",
+                lambda: {str(link["major_id"]) for link in links},
+            )
+            if any(str(row["id"]) in linked for row in hit):
+                raise PostgrestError(
+                    409, "23503",
+                    'update or delete on table "majors" violates foreign key constraint',
+                )
+        removed = {id(row) for row in hit}
+        self.tables[name] = [row for row in self.tables[name] if id(row) not in removed]
+        self._unindex(name, hit)
+        self._changed(name)
+        if name in TOMBSTONE_KEYS:
+            self._record_tombstones(name, hit)
+        return hit
+
+    def _record_tombstones(self, name: str, rows: list[dict]) -> None:
+        tombstones = self.table("catalog_tombstones")
+        deleted_at = _now()
+        for row in rows:
+            tombstones.append({
+                "id": len(tombstones) + 1,
+                "table_name": name,
+                "row_key": {column: row.get(column) for column in TOMBSTONE_KEYS[name]},
+                "deleted_at": deleted_at,
+            })
+        self._changed("catalog_tombstones")
+
+    def _delete_major_if_unused(self, args: dict) -> None:
+        major_id = str(args["p_major_id"])
+        if major_id not in self._indexes.get("majors", {}).get("id", {}):
+            raise PostgrestError(404, "P0002", f"Major {major_id} not found")
+        self.delete("majors", [("id", f"eq.{major_id}")])
+
+    # Transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        body = await request.aread()
+        start = time.perf_counter()
+        try:
+            return self._handle(request, body)
+        except PostgrestError as e:
+            return e.response()
+        finally:
+            self.requests += 1
+            self.busy_seconds += time.perf_counter() - start
+
+    def _handle(self, request: httpx.Request, body: bytes) -> httpx.Response:
+        path = unquote(request.url.path)
+        if path.startswith("/storage/v1/object/"):
+            return self._handle_storage(request, path[len("/storage/v1/object/"):], body)
+
+        match = re.match(r"^/rest/v1/(rpc/)?([^/]+)$", path)
+        if match is None:
+            return httpx.Response(404)
+        name = match.group(2)
+        if match.group(1):
+            function = self.functions.get(name)
+            if function is None:
+                raise PostgrestError(404, "PGRST202", f"Could not find the function public.{name}")
+            return self._json(200, function(json.loads(body or b"{}")))
+
+        params = parse_qsl(request.url.query.decode(), keep_blank_values=True)
+        method = request.method
+        if method in ("GET", "HEAD"):
+            rows = self.select(name, params)
+            response = self._json(200, rows)
+            response.headers["content-range"] = f"0-{max(len(rows) - 1, 0)}/*"
+            return httpx.Response(200, headers=response.headers) if method == "HEAD" else response
+
+        representation = "return=representation" in request.headers.get("prefer", "")
+        if method == "POST":
+            payload = json.loads(body)
+            rows = self.insert(name, payload if isinstance(payload, list) else [payload])
+            return self._json(201, rows) if representation else httpx.Response(201)
+        if method == "PATCH":
+            rows = self.update(name, params, json.loads(body))
+        elif method == "DELETE":
+            rows = self.delete(name, params)
+        else:
+            return httpx.Response(405)
+        return self._json(200, rows) if representation else httpx.Response(204)
+
+    def _handle_storage(self, request: httpx.Request, path: str, body: bytes) -> httpx.Response:
+        if path.startswith("list/"):
+            bucket = path[len("list/"):]
+            prefix = json.loads(body).get("prefix", "").strip("/")
+            folder = f"{bucket}/{prefix}/" if prefix else f"{bucket}/"
+            names = {
+                key[len(folder):].split("/", 1)[0]
+                for key in self.storage if key.startswith(folder)
+            }
+            return self._json(200, [{"name": n} for n in sorted(names)])
+
+        for marker in ("public/", "authenticated/", "info/"):
+            if path.startswith(marker):
+                path = path[len(marker):]
+                break
+        if request.method in ("POST", "PUT"):
+            self.storage[path] = body
+            return self._json(200, {"Key": path})
+        if request.method in ("GET", "HEAD"):
+            if path not in self.storage:
+                return self._json(
+                    404, {"statusCode": "404", "error": "not_found", "message": "Object not found"}
+                )
+            content = b"" if request.method == "HEAD" else self.storage[path]
+            return httpx.Response(200, content=content)
+        if request.method == "DELETE":
+            self.storage.pop(path, None)
+            return self._json(200, [])
+        return httpx.Response(405)
+
+    @staticmethod
+    def _json(status: int, content: Any) -> httpx.Response:
+        if content is None:
+            return httpx.Response(204 if status == 200 else status)
+        return httpx.Response(
+            status, content=_dumps(content), headers={"content-type": "application/json"}
+        )
+
+
+# Synthetic catalog vocabulary
+TOPICS = [
+    "Robotics", "Chess", "Hiking", "Film", "Debate", "Coding", "Astronomy", "Dance", "Jazz",
+    "Biology", "Chemistry", "Poetry", "Anime", "Gaming", "Photography", "Cycling", "Volleyball",
+    "Entrepreneurship", "Sustainability", "Cybersecurity", "Data Science", "Mock Trial",
+    "Pre-Med", "Engineering", "Theatre", "Ceramics", "Climbing", "Esports", "Mathematics", "Music",
+]
+FORMS = ["Club", "Society", "Association", "Team", "Collective", "Network", "Council", "Guild"]
+FIELDS = [
+    "Computer Science", "Mechanical Engineering", "Biology", "Psychology", "Economics",
+    "Physics", "Chemistry", "Political Science", "Mathematics", "Cognitive Science",
+    "Environmental Engineering", "Sociology", "History", "English", "Management",
+]
+WORDS = [
+    "students", "weekly", "meetings", "projects", "workshops", "community", "competitions",
+    "events", "learn", "build", "share", "campus", "industry", "mentorship", "research",
+    "outreach", "friendly", "beginners", "welcome", "social", "skills", "talks", "trips",
+]
+TAGS = [
+    "stem", "arts", "sports", "service", "cultural", "academic", "professional", "gaming",
+    "outdoors", "music", "wellness", "leadership", "networking", "volunteering", "tech",
+]
+
+
+def seed_catalog(fake: FakeSupabase, clubs: int, majors: int, seed: int = 0) -> None:
+    """
+    Fill the stand-in with a reproducible synthetic catalog
+
+    Each club links to one to three random majors and has up to three
+    tags; about 5% are all-majors clubs and 10% are inactive.
+
+    Args:
+        fake: Stand-in to seed
+        clubs: Number of clubs
+        majors: Number of majors
+        seed: Random seed (the same seed gives the same catalog)
+    """
+    rng = random.Random(seed)
+    base = datetime(2024, 8, 1, tzinfo=timezone.utc)
+
+    major_rows = [
+        {
+            "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            "name": f"{FIELDS[i % len(FIELDS)]} {i // len(FIELDS) + 1}",
+            "created_at": (base + timedelta(seconds=i)).isoformat(timespec="microseconds"),
+            "updated_at": (base + timedelta(seconds=i)).isoformat(timespec="microseconds"),
+        }
+        for i in range(majors)
+    ]
+    fake.insert("majors", major_rows)
+
+    club_rows = []
+    links = []
+    for i in range(clubs):
+        name = f"{rng.choice(TOPICS)} {rng.choice(FORMS)} {i}"
+        club_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+        club_rows.append({
+            "id": club_id,
+            "name": name,
+            "description": " ".join(rng.choice(WORDS) for _ in range(16)).capitalize() + ".",
+            "website": f"https://example.com/{slug}",
+            "slug": slug,
+            "is_active": rng.random() >= 0.1,
+            "is_all_majors": rng.random() < 0.05,
+            "display_order": rng.randrange(10),
+            "logo_url": f"https://cdn.example.com/clubs/{slug}/logo.png",
+            "banner_url": None,
+            "created_at": (base + timedelta(minutes=i)).isoformat(timespec="microseconds"),
+            "updated_at": (base + timedelta(minutes=i)).isoformat(timespec="microseconds"),
+        })
+        if major_rows:
+            for major in rng.sample(major_rows, min(len(major_rows), rng.randint(1, 3))):
+                stamp = base.isoformat(timespec="microseconds")
+                links.append({
+                    "club_id": club_id, "major_id": major["id"],
+                    "created_at": stamp, "updated_at": stamp,
+                })
+    fake.insert("clubs", club_rows)
+    fake.insert("club_majors", links)
+
+    # Drawn after the clubs, so the same seed still gives the same clubs and links
+    stamp = base.isoformat(timespec="microseconds")
+    fake.insert("club_tags", [
+        {"club_id": club["id"], "tag": tag, "created_at": stamp, "updated_at": stamp}
+        for club in club_rows
+        for tag in rng.sample(TAGS, rng.randint(0, 3))
+    ])
+
+
+def install(fake: FakeSupabase) -> None:
+    """
+    Route the app's async Supabase clients through the stand-in
+
+    Replaces the shared pooled httpx client (keeping InstrumentedTransport,
+    so /metrics still sees every call) and drops the client singletons.
+    Supabase credentials are set to placeholders if missing.
+    """
+    from app.core.metrics import InstrumentedTransport
+    from app.db import client
+
+    os.environ.setdefault("SUPABASE_URL", "http://supabase.local")
+    os.environ.setdefault("SUPABASE_KEY", "anon-key")
+    os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "service-role-key")
+    client._http_client = httpx.AsyncClient(transport=InstrumentedTransport(fake))
+    client._async_supabase_client = None
+    client._async_admin_client = None
@@ -0,0 +1,88 @@
+"""
+Gunicorn Configuration
+Production server: one Uvicorn worker process per available CPU, supervised by a gunicorn master
+
+Run with: gunicorn -c gunicorn.conf.py app.main:app
+"""
+import gc
+import os
+import shutil
+import tempfile
+
+
+def available_cpus() -> int:
+    """
+    CPUs this process may use: the container's CPU quota (cgroup v2), else
+    its CPU affinity, else the host CPU count
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max", encoding="utf-8") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, int(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+# Worker processes (WEB_CONCURRENCY overrides the CPU count)
+workers = int(os.getenv("WEB_CONCURRENCY", str(available_cpus())))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Railway sets PORT
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# Import the app once in the master, so workers fork with modules and bundled data already loaded
+preload_app = True
+
+# Restart a worker that stops answering its heartbeat; give in-flight requests time on shutdown
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+
+# Log to stdout/stderr like the single-process server
+accesslog = "-"
+errorlog = "-"
+
+# Prometheus counters are summed across workers from files in this directory
+# (must be set before prometheus_client is imported, i.e. before the app)
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "prometheus-multiproc")
+)
+
+# Workers serve public reads from one read-only catalog snapshot file, mapped once in the page
+# cache, instead of each holding its own catalog cache and indexes (read at import, like the above;
+# set SNAPSHOT_ENABLED=false in the environment to opt out)
+os.environ.setdefault("SNAPSHOT_ENABLED", "true")
+os.environ.setdefault(
+    "SNAPSHOT_PATH", os.path.join(tempfile.gettempdir(), "catalog-snapshot", "catalog.sqlite3")
+)
+
+
+def on_starting(server):
+    # Drop metric files left by a previous run
+    directory = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+
+
+def when_ready(server):
+    # Build the bundled course and career data once in the master: workers
+    # inherit it on fork (their lifespan finds it already built), and freezing
+    # the heap keeps the garbage collector from copying those pages per worker
+    from app.services.career_paths import get_career_catalog
+    from app.services.course_graph import get_course_catalog
+
+    get_course_catalog()
+    get_career_catalog()
+    gc.freeze()
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,378 @@
+"""
+Career Data Converter
+Regenerates app/data/careers/{major}/{career}.json from the frontend's career modules
+
+Each frontend career folder, degrees/{major}/careers/{career}/data/, holds
+tierCourses.ts (exported TierCourse arrays) and careerPathConfig.ts (one
+exported CareerPathConfig whose courses come from tierCourses.ts). Both are
+plain data: object and array literals, strings, numbers, spreads and
+references to other constants. This script evaluates that subset of
+TypeScript directly (no Node toolchain needed) and writes the config as
+JSON. Anything outside the subset is an error, so a module that starts
+computing its data fails the conversion instead of being half-read.
+
+Every folder with both modules is converted, except placeholders whose
+modules are still empty (mechanical-engineering/design-manufacturing).
+The frontend's cs-cse systems-infra and systems-infrastructure paths are
+separate modules with different content (the degrees page renders
+systems-infra from its static data, the systems-infrastructure page
+fetches /api/careers/systems-infrastructure), so each is served as
+written rather than merged here.
+
+Usage (from backend/):
+    python -m scripts.convert_career_data           # rewrite the JSON files
+    python -m scripts.convert_career_data --check   # exit 1 if any file is out of date
+"""
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+from app.services.career_paths import CAREER_DATA_DIR
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+FRONTEND_DEGREES_DIR = BACKEND_DIR.parent / "frontend" / "src" / "app" / "degrees"
+
+TOKEN_PATTERN = re.compile(r"""
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|`(?:[^`\\$]|\\.|\$(?!\{))*`)
+  | (?P<number>-?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<punct>\.\.\.|[{}\[\](),:;=.<>|&?*@+-])
+""", re.VERBOSE | re.DOTALL)
+
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+ESCAPE_PATTERN = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r?\n|.)")
+LITERALS = {"true": True, "false": False, "null": None}
+
+
+class ConversionError(ValueError):
+    """Raised when a module uses syntax outside the supported data subset"""
+
+
+def _unescape(body: str) -> str:
+    """Decode JavaScript string escapes"""
+    def replace(match: re.Match) -> str:
+        escape = match.group(1)
+        if escape.startswith("u{"):
+            return chr(int(escape[2:-1], 16))
+        if escape[0] in "ux" and len(escape) > 1:
+            code = int(escape[1:], 16)
+            # Surrogate pairs are joined after all escapes are decoded
+            return chr(code)
+        if escape in ("\n", "\r\n"):
+            return ""
+        return ESCAPES.get(escape, escape)
+
+    text = ESCAPE_PATTERN.sub(replace, body)
+    return text.encode("utf-16", "surrogatepass").decode("utf-16")
+
+
+def tokenize(source: str, path: Path) -> list[tuple[str, Any, int]]:
+    """
+    Split a module into (kind, value, line) tokens, dropping whitespace and comments
+
+    Raises:
+        ConversionError: On a character no token starts with
+    """
+    tokens = []
+    position = 0
+    while position < len(source):
+        match = TOKEN_PATTERN.match(source, position)
+        if match is None:
+            line = source.count("\n", 0, position) + 1
+            raise ConversionError(f"{path}:{line}: unexpected {source[position]!r}")
+        kind = match.lastgroup
+        text = match.group()
+        line = source.count("\n", 0, position) + 1
+        position = match.end()
+        if kind == "space":
+            continue
+        if kind == "string":
+            tokens.append(("string", _unescape(text[1:-1]), line))
+        elif kind == "number":
+            value = float(text) if any(c in text for c in ".eE") else int(text)
+            tokens.append(("number", value, line))
+        else:
+            tokens.append((kind, text, line))
+    return tokens
+
+
+class ModuleReader:
+    """
+    Evaluates the top-level constants of one data module
+
+    Args:
+        path: Module file
+        imports: Values importable from sibling modules, keyed by module
+            specifier (e.g. "./tierCourses") and exported name
+    """
+
+    def __init__(self, path: Path, imports: dict[str, dict[str, Any]]):
+        self.path = path
+        self.imports = imports
+        self.tokens = tokenize(path.read_text(encoding="utf-8"), path)
+        self.position = 0
+        self.scope: dict[str, Any] = {}
+        self.exports: dict[str, Any] = {}
+
+    # Token access
+
+    def _peek(self, offset: int = 0) -> tuple[str, Any, int]:
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else ("end", None, -1)
+
+    def _next(self) -> tuple[str, Any, int]:
+        token = self._peek()
+        self.position += 1
+        return token
+
+    def _error(self, message: str) -> ConversionError:
+        return ConversionError(f"{self.path}:{self._peek()[2]}: {message}")
+
+    def _expect(self, value: str) -> None:
+        kind, text, _ = self._peek()
+        if kind not in ("punct", "name") or text != value:
+            raise self._error(f"expected {value!r}, found {text!r}")
+        self.position += 1
+
+    def _accept(self, value: str) -> bool:
+        kind, text, _ = self._peek()
+        if kind in ("punct", "name") and text == value:
+            self.position += 1
+            return True
+        return False
+
+    # Statements
+
+    def read(self) -> dict[str, Any]:
+        """Evaluate the module and return its exported constants"""
+        while self._peek()[0] != "end":
+            if self._accept("import"):
+                self._import()
+            elif self._accept("export"):
+                if not self._accept("const"):
+                    raise self._error("only `export const` is supported")
+                name, value = self._const()
+                self.exports[name] = value
+            elif self._accept("const"):
+                self._const()
+            else:
+                raise self._error(f"unsupported statement {self._peek()[1]!r}")
+        return self.exports
+
+    def _import(self) -> None:
+        """import { a, b as c } from "module"; (type-only modules are skipped)"""
+        names: list[tuple[str, str]] = []
+        self._expect("{")
+        while not self._accept("}"):
+            name = self._name()
+            local = self._name() if self._accept("as") else name
+            names.append((name, local))
+            if not self._accept(","):
+                self._expect("}")
+                break
+        self._expect("from")
+        kind, specifier, _ = self._next()
+        if kind != "string":
+            raise self._error("expected a module specifier")
+        self._accept(";")
+        if specifier.startswith("@/types/"):
+            return
+        if specifier not in self.imports:
+            raise self._error(f"cannot import from {specifier!r}")
+        for name, local in names:
+            if name not in self.imports[specifier]:
+                raise self._error(f"{specifier!r} does not export {name!r}")
+            self.scope[local] = self.imports[specifier][name]
+
+    def _const(self) -> tuple[str, Any]:
+        """NAME (: type)? = value ;?"""
+        name = self._name()
+        if self._accept(":"):
+            # Type annotations carry no data; skip to the initializer
+            while not self._accept("="):
+                if self._next()[0] == "end":
+                    raise self._error("expected '='")
+        else:
+            self._expect("=")
+        value = self._value()
+        self._accept(";")
+        self.scope[name] = value
+        return name, value
+
+    def _name(self) -> str:
+        kind, text, _ = self._next()
+        if kind != "name":
+            self.position -= 1
+            raise self._error(f"expected a name, found {text!r}")
+        return text
+
+    # Expressions
+
+    def _value(self) -> Any:
+        kind, text, _ = self._peek()
+        if kind == "string":
+            self.position += 1
+            value = text
+            # Adjacent-line concatenation ('a' + 'b')
+            while self._accept("+"):
+                kind, text, _ = self._next()
+                if kind != "string":
+                    raise self._error("only strings can be concatenated")
+                value += text
+            return value
+        if kind == "number":
+            self.position += 1
+            return text
+        if kind == "punct" and text == "{":
+            return self._object()
+        if kind == "punct" and text == "[":
+            return self._array()
+        if kind == "name":
+            self.position += 1
+            if text in LITERALS:
+                return LITERALS[text]
+            if text not in self.scope:
+                raise self._error(f"unknown name {text!r}")
+            return self.scope[text]
+        raise self._error(f"unsupported value {text!r}")
+
+    def _object(self) -> dict:
+        self._expect("{")
+        result: dict[str, Any] = {}
+        while not self._accept("}"):
+            if self._accept("..."):
+                spread = self._value()
+                if not isinstance(spread, dict):
+                    raise self._error("only objects can be spread into objects")
+                result.update(spread)
+            else:
+                kind, key, _ = self._next()
+                if kind not in ("name", "string", "number"):
+                    raise self._error(f"unsupported key {key!r}")
+                key = str(key)
+                if self._accept(":"):
+                    result[key] = self._value()
+                elif key in self.scope:
+                    result[key] = self.scope[key]
+                else:
+                    raise self._error(f"unknown name {key!r}")
+            if not self._accept(","):
+                self._expect("}")
+                break
+        return result
+
+    def _array(self) -> list:
+        self._expect("[")
+        result: list[Any] = []
+        while not self._accept("]"):
+            if self._accept("..."):
+                spread = self._value()
+                if not isinstance(spread, list):
+                    raise self._error("only arrays can be spread into arrays")
+                result.extend(spread)
+            else:
+                result.append(self._value())
+            if not self._accept(","):
+                self._expect("]")
+                break
+        return result
+
+
+def convert_career(folder: Path) -> Optional[dict]:
+    """
+    Evaluate one career's data modules
+
+    Args:
+        folder: degrees/{major}/careers/{career}/data
+
+    Returns:
+        The exported CareerPathConfig as a dict, or None if the modules export nothing
+
+    Raises:
+        ConversionError: If a module is not plain data or the config is ambiguous
+    """
+    tier_courses = ModuleReader(folder / "tierCourses.ts", {}).read()
+    config_exports = ModuleReader(
+        folder / "careerPathConfig.ts", {"./tierCourses": tier_courses}
+    ).read()
+    if not config_exports:
+        return None
+    configs = [value for value in config_exports.values() if isinstance(value, dict)]
+    if len(configs) != 1:
+        raise ConversionError(f"{folder}: expected one exported config, found {len(configs)}")
+    return configs[0]
+
+
+def render(config: dict) -> str:
+    """Format a config the way the committed JSON files are written"""
+    return json.dumps(config, ensure_ascii=False, indent=2) + "\n"
+
+
+def convert_all(degrees_dir: Path) -> dict[Path, str]:
+    """
+    Convert every career folder under the frontend degrees directory
+
+    Returns:
+        File contents keyed by their path under CAREER_DATA_DIR
+    """
+    outputs = {}
+    for folder in sorted(degrees_dir.glob("*/careers/*/data")):
+        major, career = folder.parent.parent.parent.name, folder.parent.name
+        modules = (folder / "tierCourses.ts", folder / "careerPathConfig.ts")
+        if not all(module.exists() for module in modules):
+            continue
+        config = convert_career(folder)
+        if config is not None:
+            outputs[CAREER_DATA_DIR / major / f"{career}.json"] = render(config)
+    return outputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--frontend", type=Path, default=FRONTEND_DEGREES_DIR,
+                        help="Frontend degrees directory (default: ../frontend/src/app/degrees)")
+    parser.add_argument("--check", action="store_true",
+                        help="Report files that differ from a fresh conversion instead of writing")
+    args = parser.parse_args()
+
+    try:
+        outputs = convert_all(args.frontend)
+    except ConversionError as e:
+        sys.exit(f"Conversion failed: {e}")
+    if not outputs:
+        sys.exit(f"No career data found under {args.frontend}")
+
+    stale = sorted(set(CAREER_DATA_DIR.glob("*/*.json")) - set(outputs))
+    changed = [
+        path for path, content in outputs.items()
+        if not path.exists() or path.read_text(encoding="utf-8") != content
+    ]
+
+    if args.check:
+        for path in changed:
+            print(f"out of date: {path.relative_to(BACKEND_DIR)}")
+        for path in stale:
+            print(f"no frontend source: {path.relative_to(BACKEND_DIR)}")
+        if changed or stale:
+            sys.exit(
+                "Career data differs from the frontend; run python -m scripts.convert_career_data"
+            )
+        print(f"{len(outputs)} career files up to date")
+        return
+
+    for path in changed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(outputs[path], encoding="utf-8")
+    for path in stale:
+        path.unlink()
+    print(f"{len(changed)} written, {len(stale)} removed, {len(outputs) - len(changed)} unchanged")
+
+
+if __name__ == "__main__":
+    main()
@@ -38,7 +38,7 @@ const MajorsList = forwardRef<MajorsListRef>((props, ref) => {
     try {
       setIsLoading(true);
       const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
-      const response = await fetch(`${API_BASE_URL}/api/majors/`);
+      const response = await fetch(`${API_BASE_URL}/api/majors/?paginate=false`);
 
       if (!response.ok) {
         throw new Error("Failed to fetch majors");
@@ -65,9 +65,11 @@ export async function fetchCourseById(courseId: string): Promise<Course> {
 
 /**
  * Fetch career path configuration with tier courses
+ * Pass the major slug when the career slug exists in several majors
  */
-export async function fetchCareerPath(careerPath: string) {
-  const response = await fetch(`${API_BASE_URL}/api/careers/${careerPath}`);
+export async function fetchCareerPath(careerPath: string, major?: string) {
+  const path = major ? `${major}/${careerPath}` : careerPath;
+  const response = await fetch(`${API_BASE_URL}/api/careers/${path}`);
   
   if (!response.ok) {
     if (response.status === 404) {
@@ -97,6 +99,8 @@ export async function fetchCareerPath(careerPath: string) {
         learningOutcomes: course.expanded_info?.learning_outcomes || course.expandedInfo?.learningOutcomes,
         topics: course.expanded_info?.topics || course.expandedInfo?.topics,
         careerRelevance: course.expanded_info?.career_relevance || course.expandedInfo?.careerRelevance,
+        realWorldApplications: course.expanded_info?.real_world_applications || course.expandedInfo?.realWorldApplications,
+        resources: course.expanded_info?.resources || course.expandedInfo?.resources,
         additionalNotes: course.expanded_info?.additional_notes || course.expandedInfo?.additionalNotes,
       } : undefined,
     })),
@@ -108,7 +112,7 @@ export async function fetchCareerPath(careerPath: string) {
  * Fetch all majors from the backend
  */
 export async function fetchMajors(): Promise<Major[]> {
-  const response = await fetch(`${API_BASE_URL}/api/majors/`);
+  const response = await fetch(`${API_BASE_URL}/api/majors/?paginate=false`);
   
   if (!response.ok) {
     throw new Error(`Failed to fetch majors: ${response.statusText}`);
@@ -0,0 +1,9 @@
+-- Indexes backing keyset pagination on the backend catalog endpoints.
+-- GET /api/clubs pages on (display_order, created_at, id);
+-- GET /api/majors pages on (name, id).
+
+CREATE INDEX IF NOT EXISTS idx_clubs_display_order_created_at_id
+  ON public.clubs (display_order, created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_majors_name_id
+  ON public.majors (name, id);
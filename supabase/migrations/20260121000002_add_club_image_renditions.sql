@@ -0,0 +1,5 @@
+-- Resized logo/banner URLs produced by the upload rendition stage.
+-- Shape: {"webp": {"64": "https://..."}, "avif": {...}}
+ALTER TABLE public.clubs
+  ADD COLUMN IF NOT EXISTS logo_renditions jsonb,
+  ADD COLUMN IF NOT EXISTS banner_renditions jsonb;
@@ -0,0 +1,48 @@
+-- Change counters for tables the backend indexes in memory.
+-- Statement-level triggers bump a table's counter on every write (including
+-- RPCs, club request approval and FK cascades); the backend polls the counters
+-- and rebuilds its club filter index when they move.
+
+CREATE TABLE IF NOT EXISTS public.catalog_versions (
+  name text PRIMARY KEY,
+  version bigint NOT NULL DEFAULT 0,
+  updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+ALTER TABLE public.catalog_versions ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "public_read_catalog_versions" ON public.catalog_versions;
+CREATE POLICY "public_read_catalog_versions" ON public.catalog_versions FOR SELECT USING (true);
+
+GRANT SELECT ON TABLE public.catalog_versions TO anon;
+GRANT SELECT ON TABLE public.catalog_versions TO authenticated;
+GRANT ALL ON TABLE public.catalog_versions TO service_role;
+
+INSERT INTO public.catalog_versions (name)
+VALUES ('clubs'), ('club_majors')
+ON CONFLICT (name) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION public.bump_catalog_version()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  INSERT INTO public.catalog_versions (name, version, updated_at)
+  VALUES (TG_TABLE_NAME, 1, now())
+  ON CONFLICT (name)
+  DO UPDATE SET version = catalog_versions.version + 1, updated_at = now();
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS bump_catalog_version ON public.clubs;
+CREATE TRIGGER bump_catalog_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.clubs
+  FOR EACH STATEMENT EXECUTE FUNCTION public.bump_catalog_version();
+
+DROP TRIGGER IF EXISTS bump_catalog_version ON public.club_majors;
+CREATE TRIGGER bump_catalog_version
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.club_majors
+  FOR EACH STATEMENT EXECUTE FUNCTION public.bump_catalog_version();
@@ -0,0 +1,31 @@
+-- Delete a major in one round trip, refusing while clubs are linked to it.
+-- club_majors.major_id cascades on delete, so a plain DELETE would silently drop
+-- the links; this locks the major row (which blocks concurrent club_majors
+-- inserts referencing it), checks for links and deletes atomically.
+-- Errors: 23503 when clubs are linked, P0002 when the major does not exist.
+-- Called by the backend with the service role key only.
+
+CREATE OR REPLACE FUNCTION public.delete_major_if_unused(p_major_id uuid)
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  PERFORM 1 FROM public.majors WHERE id = p_major_id FOR UPDATE;
+  IF NOT FOUND THEN
+    RAISE EXCEPTION 'Major with id ''%'' not found', p_major_id USING ERRCODE = 'P0002';
+  END IF;
+
+  IF EXISTS (SELECT 1 FROM public.club_majors WHERE major_id = p_major_id) THEN
+    RAISE EXCEPTION 'Major is associated with one or more clubs' USING ERRCODE = '23503';
+  END IF;
+
+  DELETE FROM public.majors WHERE id = p_major_id;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.delete_major_if_unused(uuid) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.delete_major_if_unused(uuid) FROM anon;
+REVOKE ALL ON FUNCTION public.delete_major_if_unused(uuid) FROM authenticated;
+GRANT EXECUTE ON FUNCTION public.delete_major_if_unused(uuid) TO service_role;
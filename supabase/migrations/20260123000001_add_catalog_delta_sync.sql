@@ -0,0 +1,112 @@
+-- Change timestamps and delete tombstones for incremental catalog sync.
+-- Every catalog table gets an updated_at kept current by set_updated_at(), so
+-- the backend can fetch only rows changed since its last watermark. Deletes
+-- (including FK cascades) leave a tombstone with the deleted row's key.
+
+ALTER TABLE public.clubs ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+ALTER TABLE public.majors ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+ALTER TABLE public.club_majors ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+ALTER TABLE public.club_tags ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+
+DROP TRIGGER IF EXISTS trg_clubs_set_updated_at ON public.clubs;
+CREATE TRIGGER trg_clubs_set_updated_at
+  BEFORE UPDATE ON public.clubs
+  FOR EACH ROW EXECUTE FUNCTION public.set_updated_at();
+
+DROP TRIGGER IF EXISTS trg_majors_set_updated_at ON public.majors;
+CREATE TRIGGER trg_majors_set_updated_at
+  BEFORE UPDATE ON public.majors
+  FOR EACH ROW EXECUTE FUNCTION public.set_updated_at();
+
+DROP TRIGGER IF EXISTS trg_club_majors_set_updated_at ON public.club_majors;
+CREATE TRIGGER trg_club_majors_set_updated_at
+  BEFORE UPDATE ON public.club_majors
+  FOR EACH ROW EXECUTE FUNCTION public.set_updated_at();
+
+DROP TRIGGER IF EXISTS trg_club_tags_set_updated_at ON public.club_tags;
+CREATE TRIGGER trg_club_tags_set_updated_at
+  BEFORE UPDATE ON public.club_tags
+  FOR EACH ROW EXECUTE FUNCTION public.set_updated_at();
+
+CREATE INDEX IF NOT EXISTS clubs_updated_at_idx ON public.clubs (updated_at);
+CREATE INDEX IF NOT EXISTS majors_updated_at_idx ON public.majors (updated_at);
+CREATE INDEX IF NOT EXISTS club_majors_updated_at_idx ON public.club_majors (updated_at);
+CREATE INDEX IF NOT EXISTS club_tags_updated_at_idx ON public.club_tags (updated_at);
+
+CREATE TABLE IF NOT EXISTS public.catalog_tombstones (
+  id bigserial PRIMARY KEY,
+  table_name text NOT NULL,
+  row_key jsonb NOT NULL,
+  deleted_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS catalog_tombstones_deleted_at_idx ON public.catalog_tombstones (deleted_at);
+
+ALTER TABLE public.catalog_tombstones ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "public_read_catalog_tombstones" ON public.catalog_tombstones;
+CREATE POLICY "public_read_catalog_tombstones" ON public.catalog_tombstones FOR SELECT USING (true);
+
+GRANT SELECT ON TABLE public.catalog_tombstones TO anon;
+GRANT SELECT ON TABLE public.catalog_tombstones TO authenticated;
+GRANT ALL ON TABLE public.catalog_tombstones TO service_role;
+
+-- Trigger arguments name the key columns copied into row_key
+CREATE OR REPLACE FUNCTION public.record_catalog_tombstone()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_old jsonb := to_jsonb(OLD);
+  v_key jsonb := '{}'::jsonb;
+  i integer;
+BEGIN
+  FOR i IN 0 .. TG_NARGS - 1 LOOP
+    v_key := v_key || jsonb_build_object(TG_ARGV[i], v_old -> TG_ARGV[i]);
+  END LOOP;
+  INSERT INTO public.catalog_tombstones (table_name, row_key) VALUES (TG_TABLE_NAME, v_key);
+  RETURN OLD;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS record_catalog_tombstone ON public.clubs;
+CREATE TRIGGER record_catalog_tombstone
+  AFTER DELETE ON public.clubs
+  FOR EACH ROW EXECUTE FUNCTION public.record_catalog_tombstone('id');
+
+DROP TRIGGER IF EXISTS record_catalog_tombstone ON public.majors;
+CREATE TRIGGER record_catalog_tombstone
+  AFTER DELETE ON public.majors
+  FOR EACH ROW EXECUTE FUNCTION public.record_catalog_tombstone('id');
+
+DROP TRIGGER IF EXISTS record_catalog_tombstone ON public.club_majors;
+CREATE TRIGGER record_catalog_tombstone
+  AFTER DELETE ON public.club_majors
+  FOR EACH ROW EXECUTE FUNCTION public.record_catalog_tombstone('club_id', 'major_id');
+
+DROP TRIGGER IF EXISTS record_catalog_tombstone ON public.club_tags;
+CREATE TRIGGER record_catalog_tombstone
+  AFTER DELETE ON public.club_tags
+  FOR EACH ROW EXECUTE FUNCTION public.record_catalog_tombstone('club_id', 'tag');
+
+-- Drop tombstones older than the retention the backend assumes
+-- (CATALOG_SYNC_TOMBSTONE_RETENTION_SECONDS); syncs older than that reload in full
+CREATE OR REPLACE FUNCTION public.prune_catalog_tombstones(p_older_than interval DEFAULT interval '7 days')
+RETURNS bigint
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_deleted bigint;
+BEGIN
+  DELETE FROM public.catalog_tombstones WHERE deleted_at < now() - p_older_than;
+  GET DIAGNOSTICS v_deleted = ROW_COUNT;
+  RETURN v_deleted;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.prune_catalog_tombstones(interval) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.prune_catalog_tombstones(interval) TO service_role;